@@ -2,8 +2,10 @@
 API documentation routes for serving OpenAPI specification and documentation.
 """
 
-from flask import Blueprint, jsonify, render_template_string
-from ..utils.api_docs import get_openapi_spec, generate_markdown_docs, get_api_summary
+from flask import Blueprint, Response, render_template_string, request
+from ..utils.api_docs import (
+    get_openapi_spec_json, get_openapi_spec_etag, generate_markdown_docs, get_api_summary
+)
 from ..utils.response_wrapper import ApiResponse
 
 # Create blueprint
@@ -13,8 +15,17 @@ docs_bp = Blueprint('docs', __name__)
 @docs_bp.route('/openapi.json')
 def openapi_spec():
     """Serve OpenAPI 3.0 specification."""
-    spec = get_openapi_spec()
-    return jsonify(spec)
+    etag = get_openapi_spec_etag()
+    
+    # The spec only changes on restart, so revalidating clients get a 304
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(get_openapi_spec_json(), mimetype='application/json')
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 
 @docs_bp.route('/swagger')
@@ -9,7 +9,7 @@ from pathlib import Path
 # Import our modules
 from ..config import FINNHUB_API_KEY, AUTO_DOWNLOAD_SYMBOLS, EXPORT_DIR, API_TIMEOUT
 from .. import config
-from ..models.data_fetcher import MarketDataFetcher
+from ..models.data_fetcher import get_market_data_fetcher
 from ..models.database import save_to_database_csv, load_from_database_csv, update_database_from_tracking
 from ..models.data_generator import (
     calculate_data_limit, 
@@ -51,10 +51,10 @@ def health_check():
 def get_stock_data(symbol):
     """Get stock data from the database or generate it"""
     try:
-        # Fetch latest data and save it for tracking
-        fetcher = MarketDataFetcher()
+        # Fetch latest data; only fresh (not cached) quotes are saved for tracking
+        fetcher = get_market_data_fetcher()
         current_data_result = fetcher.get_current_data(symbol.upper())
-        if current_data_result['success']:
+        if current_data_result['success'] and not current_data_result.get('cached'):
             save_price_tracking_data(symbol.upper(), current_data_result['data'])
             
         period = request.args.get('period', 'default')
@@ -206,7 +206,7 @@ def get_comparison_data():
         month_filter = request.args.get('month', None)
         limit = calculate_data_limit(period)
         
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         
         data = {}
         global_errors = []
@@ -371,7 +371,7 @@ def download_csv(filename):
 def export_stock_data_csv(symbol):
     """Export current stock data to CSV and download immediately"""
     try:
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         
         # Get period and month from query parameters
         period = request.args.get('period', 'all')
@@ -487,7 +487,7 @@ def get_market_correlation():
         symbols = request.args.get('symbols', 'AAPL,MSFT,GOOGL').split(',')
         period = request.args.get('period', 'default')
         
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         correlation_data = {}
         stock_returns = {}
         
@@ -555,7 +555,7 @@ def get_market_events():
         symbol = request.args.get('symbol', 'AAPL').upper()
         threshold = float(request.args.get('threshold', '0.05'))  # 5% default
         
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         result = fetcher.get_historical_data(symbol, 60)
         
         if not result['success'] or not result['data']:
@@ -624,10 +624,10 @@ def trigger_cleanup():
 def save_to_database(symbol):
     """Explicitly save current stock data to CSV database"""
     try:
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         
         # Get fresh data
-        historical_result = fetcher.get_historical_data(symbol.upper(), 60)
+        historical_result = fetcher.get_historical_data(symbol.upper(), 60, fresh=True)
         
         if not historical_result['success'] or not historical_result['data']:
             return jsonify({
@@ -759,14 +759,14 @@ def list_database_files():
 def update_all_databases():
     """Update all database files with fresh data"""
     try:
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         symbols = ['NVDA', 'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']  # Add more as needed
         results = {}
         
         for symbol in symbols:
             try:
                 # Get fresh data
-                historical_result = fetcher.get_historical_data(symbol, 60)
+                historical_result = fetcher.get_historical_data(symbol, 60, fresh=True)
                 
                 if historical_result['success'] and historical_result['data']:
                     # Update database
@@ -7,6 +7,7 @@ from .config import config
 # Import services and utilities
 from .services.scheduler import setup_scheduler
 from .utils.helpers import cleanup_duplicate_csv_files
+from .utils.json_provider import OrjsonProvider
 from .utils.logger import get_logger
 
 # Import API blueprint (new modular structure)
@@ -17,6 +18,7 @@ app = Flask(__name__,
             static_folder='../front_end',
             static_url_path='',
             template_folder='../front_end')
+app.json = OrjsonProvider(app)
 
 # Register API blueprint
 app.register_blueprint(api, url_prefix='/api')
@@ -28,10 +30,29 @@ def dashboard():
     return render_template('dashboard.html')
 
 
-def create_app():
-    """Application factory function"""
+# Set once the one-time startup work in create_app has run
+_started = False
+
+
+def create_app(testing=False):
+    """Application factory function
     
+    The app is a module-level singleton, so startup work (duplicate CSV
+    cleanup, scheduler setup, banner logging) only runs on the first
+    non-testing call; later calls return the same app. With ``testing=True``
+    the startup work is skipped and the app is returned unchanged, so a later
+    regular call still starts the app normally. Tests set TESTING themselves.
+    """
+    global _started
     logger = get_logger(__name__)
+    
+    if testing:
+        logger.info("🧪 Testing mode: automated data collection not scheduled")
+        return app
+    if _started:
+        return app
+    _started = True
+    
     logger.info("🚀 Starting Stock Dashboard...")
     
     # Clean up duplicate CSV files on startup
@@ -4,13 +4,56 @@ Configuration management for the stock market dashboard.
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
 
-@dataclass
+# Environment variables read by APIConfig.from_env(), in field order
+_API_ENV_KEYS = (
+    'FINNHUB_API_KEY',
+    'ALPHA_VANTAGE_API_KEY',
+    'API_TIMEOUT_SECONDS',
+    'API_QUICK_TIMEOUT_SECONDS',
+    'HISTORICAL_DATA_LIMIT'
+)
+
+# Environment variables read by ServerConfig.from_env(), in field order
+_SERVER_ENV_KEYS = ('FLASK_HOST', 'FLASK_PORT', 'FLASK_DEBUG')
+
+
+def _env_snapshot(keys: Tuple[str, ...]) -> Tuple[Optional[str], ...]:
+    """Return the current values of ``keys`` as a hashable cache key."""
+    return tuple(map(os.environ.get, keys))
+
+
+@lru_cache(maxsize=8)
+def _parse_api_env(env: Tuple[Optional[str], ...]) -> tuple:
+    """Coerce raw API environment values into APIConfig field values."""
+    finnhub_api_key, alpha_vantage_api_key, timeout, quick_timeout, historical_data_limit = env
+    return (
+        finnhub_api_key,
+        alpha_vantage_api_key,
+        int(15 if timeout is None else timeout),
+        int(10 if quick_timeout is None else quick_timeout),
+        int(121 if historical_data_limit is None else historical_data_limit)
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_server_env(env: Tuple[Optional[str], ...]) -> tuple:
+    """Coerce raw server environment values into ServerConfig field values."""
+    host, port, debug = env
+    return (
+        '0.0.0.0' if host is None else host,
+        int(8001 if port is None else port),
+        (debug or 'False').lower() == 'true'
+    )
+
+
+@dataclass(slots=True)
 class APIConfig:
     """API configuration settings."""
     finnhub_api_key: Optional[str]
@@ -21,14 +64,12 @@ class APIConfig:
     
     @classmethod
     def from_env(cls) -> 'APIConfig':
-        """Create API config from environment variables."""
-        return cls(
-            finnhub_api_key=os.getenv('FINNHUB_API_KEY'),
-            alpha_vantage_api_key=os.getenv('ALPHA_VANTAGE_API_KEY'),
-            timeout=int(os.getenv('API_TIMEOUT_SECONDS', 15)),
-            quick_timeout=int(os.getenv('API_QUICK_TIMEOUT_SECONDS', 10)),
-            historical_data_limit=int(os.getenv('HISTORICAL_DATA_LIMIT', 121))
-        )
+        """Create API config from environment variables.
+        
+        Parsing is memoized on the raw values; each call still returns a new
+        instance, so callers may modify it freely.
+        """
+        return cls(*_parse_api_env(_env_snapshot(_API_ENV_KEYS)))
     
     def validate(self) -> List[str]:
         """Validate API configuration and return list of warnings."""
@@ -46,7 +87,7 @@ class APIConfig:
         return warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration settings."""
     host: str
@@ -55,12 +96,8 @@ class ServerConfig:
     
     @classmethod
     def from_env(cls) -> 'ServerConfig':
-        """Create server config from environment variables."""
-        return cls(
-            host=os.getenv('FLASK_HOST', '0.0.0.0'),
-            port=int(os.getenv('FLASK_PORT', 8001)),
-            debug=os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
-        )
+        """Create server config from environment variables (parsing is memoized, see APIConfig)."""
+        return cls(*_parse_server_env(_env_snapshot(_SERVER_ENV_KEYS)))
     
     def validate(self) -> List[str]:
         """Validate server configuration and return list of warnings."""
@@ -75,7 +112,7 @@ class ServerConfig:
         return warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulingConfig:
     """Scheduling configuration settings."""
     daily_update_hour: int
@@ -109,7 +146,7 @@ class SchedulingConfig:
         return warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration settings."""
     level: str
@@ -148,6 +185,8 @@ class LoggingConfig:
 class Config:
     """Main configuration class that manages all application settings."""
     
+    __slots__ = ('api', 'server', 'scheduling', 'logging', 'export_dir')
+    
     def __init__(self):
         # Load environment variables
         load_dotenv(override=True)
@@ -159,8 +198,8 @@ class Config:
         self.logging = LoggingConfig.from_env()
         
         # Directories
-        self.export_dir = Path("data_exports")
-        self.export_dir.mkdir(exist_ok=True)
+        self.export_dir = Path(os.getenv('EXPORT_DIR', 'data_exports'))
+        self.export_dir.mkdir(parents=True, exist_ok=True)
         
         # Validate all configurations
         self._validate_all()
@@ -4,9 +4,14 @@ Market data fetcher for retrieving stock data from external APIs.
 
 import finnhub
 from alpha_vantage.timeseries import TimeSeries
+import inspect
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Tuple
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Optional, Union, Any, Tuple
 from ..config import config
 from ..utils.exceptions import ApiKeyNotConfiguredException, DataFetchException
 
@@ -38,23 +43,101 @@ def get_api_ticker(symbol: str, api_name: str) -> str:
     return symbol
 
 
+# Seconds a successful API response is served from memory, and how many are kept
+CURRENT_DATA_TTL = 60
+CURRENT_DATA_CACHE_SIZE = 256
+HISTORICAL_DATA_TTL = 3600
+HISTORICAL_DATA_CACHE_SIZE = 64
+
+
+def _copy_response(response: ApiResponse, cached: bool) -> ApiResponse:
+    """Return a copy of a response whose records callers can modify freely.
+    
+    ``cached`` tells callers whether the response was served from memory, so
+    side effects of a fresh fetch (like price tracking) are not repeated.
+    """
+    data = response.get('data')
+    if isinstance(data, list):
+        data = [dict(record) for record in data]
+    elif isinstance(data, dict):
+        data = dict(data)
+    return {**response, 'data': data, 'cached': cached}
+
+
+def _ttl_cache(ttl: float, maxsize: int) -> Callable:
+    """
+    Cache a fetcher method's successful responses per symbol and arguments.
+    
+    Entries are shared by all fetcher instances, keyed by the upper-cased
+    symbol and the remaining arguments with defaults applied, expire after
+    ``ttl`` seconds and are evicted least recently used beyond ``maxsize``.
+    Failed fetches raise, so they are never cached. Responses carry a
+    ``cached`` flag; callers that persist data pass ``fresh=True`` to skip
+    the lookup and refresh the entry from the API.
+    """
+    def decorator(method: Callable) -> Callable:
+        cache: "OrderedDict[Tuple, Tuple[float, ApiResponse]]" = OrderedDict()
+        lock = threading.Lock()
+        signature = inspect.signature(method)
+        
+        @wraps(method)
+        def wrapper(self, symbol: str, *args: Any, fresh: bool = False, **kwargs: Any) -> ApiResponse:
+            bound = signature.bind(self, symbol, *args, **kwargs)
+            bound.apply_defaults()
+            key = (symbol.upper(), *list(bound.arguments.values())[2:])
+            if not fresh:
+                with lock:
+                    entry = cache.get(key)
+                    if entry is not None and entry[0] > time.monotonic():
+                        cache.move_to_end(key)
+                        return _copy_response(entry[1], cached=True)
+            
+            result = method(self, symbol, *args, **kwargs)
+            if result.get('success'):
+                with lock:
+                    cache[key] = (time.monotonic() + ttl, result)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return _copy_response(result, cached=False)
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def clear_response_caches() -> None:
+    """Drop every cached quote and historical response."""
+    MarketDataFetcher.get_current_data.cache_clear()
+    MarketDataFetcher.get_historical_data.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _finnhub_client(api_key: str) -> finnhub.Client:
+    """Finnhub client shared by every fetcher using the same key."""
+    return finnhub.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _alpha_vantage_client(api_key: str) -> TimeSeries:
+    """Alpha Vantage client shared by every fetcher using the same key."""
+    return TimeSeries(key=api_key, output_format='json')
+
+
 class MarketDataFetcher:
     """Fetches market data from Finnhub and Alpha Vantage APIs."""
     
     def __init__(self) -> None:
         """Initialize API clients based on configured API keys."""
         if config.api.finnhub_api_key:
-            self.finnhub_client: Optional[finnhub.Client] = finnhub.Client(api_key=config.api.finnhub_api_key)
+            self.finnhub_client: Optional[finnhub.Client] = _finnhub_client(config.api.finnhub_api_key)
             logging.info("Finnhub client initialized for current data.")
         else:
             self.finnhub_client = None
             logging.warning("Finnhub API key not configured. Will be unable to fetch current data.")
 
         if config.api.alpha_vantage_api_key:
-            self.alpha_vantage_client: Optional[TimeSeries] = TimeSeries(
-                key=config.api.alpha_vantage_api_key, 
-                output_format='json'
-            )
+            self.alpha_vantage_client: Optional[TimeSeries] = _alpha_vantage_client(config.api.alpha_vantage_api_key)
             logging.info("Alpha Vantage client initialized for historical data.")
         else:
             self.alpha_vantage_client = None
@@ -82,9 +165,11 @@ class MarketDataFetcher:
             })
         return records
 
+    @_ttl_cache(HISTORICAL_DATA_TTL, HISTORICAL_DATA_CACHE_SIZE)
     def get_historical_data(self, symbol: str, limit: Optional[int] = None) -> ApiResponse:
         """
-        Gets historical stock data from Alpha Vantage.
+        Gets historical stock data from Alpha Vantage, cached for an hour
+        unless called with ``fresh=True``.
         
         Args:
             symbol: Stock symbol to fetch data for
@@ -128,9 +213,10 @@ class MarketDataFetcher:
             logging.error(message)
             raise DataFetchException(message)
 
+    @_ttl_cache(CURRENT_DATA_TTL, CURRENT_DATA_CACHE_SIZE)
     def get_current_data(self, symbol: str) -> ApiResponse:
         """
-        Gets current stock data from Finnhub.
+        Gets current stock data from Finnhub, cached for a minute.
         
         Args:
             symbol: Stock symbol to fetch current data for
@@ -175,4 +261,23 @@ class MarketDataFetcher:
         except Exception as e:
             message = f"Finnhub current data fetch failed for {symbol}: {str(e)}"
             logging.error(message)
-            raise DataFetchException(message) 
\ No newline at end of file
+            raise DataFetchException(message) 
+
+
+@lru_cache(maxsize=1)
+def _shared_fetcher(finnhub_api_key: Optional[str], alpha_vantage_api_key: Optional[str]) -> MarketDataFetcher:
+    """Fetcher built once per configured pair of API keys."""
+    return MarketDataFetcher()
+
+
+def get_market_data_fetcher() -> MarketDataFetcher:
+    """
+    Return the application-wide market data fetcher.
+    
+    A new fetcher is only built when the configured API keys change.
+    
+    Returns:
+        Shared MarketDataFetcher instance
+    """
+    return _shared_fetcher(config.api.finnhub_api_key, config.api.alpha_vantage_api_key)
+
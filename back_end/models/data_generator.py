@@ -1,11 +1,72 @@
 import logging
-import random
-import math
+import zlib
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from ..config import EXPORT_DIR
+import numpy as np
 import pandas as pd
 
 
+# European market hours: 9:00 AM to 5:30 PM CET (8.5 hours), every 30 minutes for smoother curves
+_MARKET_OPEN = 9.0
+_MARKET_CLOSE = 17.5
+_INTERVALS_PER_HOUR = 2
+
+# The intraday schedule is the same every day, so it is laid out once
+_HOURS_FROM_OPEN = np.arange(int((_MARKET_CLOSE - _MARKET_OPEN) * _INTERVALS_PER_HOUR)) / _INTERVALS_PER_HOUR
+_INTERVAL_HOURS = _MARKET_OPEN + _HOURS_FROM_OPEN
+_INTERVAL_CLOCK_TIMES = tuple(
+    f"{int(hour):02d}:{int((hour - int(hour)) * 60):02d}:00" for hour in _INTERVAL_HOURS.tolist()
+)
+_TREND_FACTOR = np.sin(_HOURS_FROM_OPEN * np.pi / 8.5) * 0.002  # Gentle intraday trend
+
+# Intraday activity bands: opening/closing hour and the (quieter) European lunch hour
+_OPENING_OR_CLOSING = (_INTERVAL_HOURS < 10.0) | (_INTERVAL_HOURS > 16.5)
+_LUNCH = (_INTERVAL_HOURS >= 12.0) & (_INTERVAL_HOURS <= 13.0)
+
+# Base configuration for the simulated stocks, European first
+_STOCK_CONFIGS = MappingProxyType({
+    # Dutch stocks (AEX)
+    'ASML.AS': {'base_price': 650, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.030},
+    'INGA.AS': {'base_price': 13, 'sector': 'finance', 'beta': 1.1, 'volatility': 0.025},
+    'HEIA.AS': {'base_price': 85, 'sector': 'consumer', 'beta': 0.8, 'volatility': 0.020},
+    'PHIA.AS': {'base_price': 25, 'sector': 'tech', 'beta': 1.0, 'volatility': 0.025},
+    
+    # Other European stocks
+    'SAP': {'base_price': 120, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
+    'LVMH.PA': {'base_price': 750, 'sector': 'luxury', 'beta': 0.9, 'volatility': 0.028},
+    
+    # Still support US stocks for comparison
+    'NVDA': {'base_price': 165, 'sector': 'tech', 'beta': 1.5, 'volatility': 0.035},
+    'AAPL': {'base_price': 200, 'sector': 'tech', 'beta': 1.2, 'volatility': 0.025},
+    'MSFT': {'base_price': 480, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
+    'GOOGL': {'base_price': 2800, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.028},
+    'TSLA': {'base_price': 350, 'sector': 'auto', 'beta': 1.8, 'volatility': 0.045}
+})
+
+# Typical intraday base volume for the European stocks (others default to 1M)
+_BASE_VOLUMES = MappingProxyType({
+    'ASML.AS': 2000000,  # High volume Dutch tech stock
+    'INGA.AS': 8000000,  # High volume bank
+    'HEIA.AS': 1500000,  # Medium volume consumer stock
+    'PHIA.AS': 3000000,  # Medium volume tech
+    'SAP': 1800000,      # German software
+    'LVMH.PA': 800000    # French luxury (lower volume)
+})
+
+
+def _stock_config(symbol):
+    """Return the simulation config for ``symbol``, trying it without its exchange suffix, then ASML."""
+    clean_symbol = symbol.split('.')[0] if '.' in symbol else symbol
+    return _STOCK_CONFIGS.get(symbol, _STOCK_CONFIGS.get(clean_symbol, _STOCK_CONFIGS['ASML.AS']))
+
+
+def _interval_timestamps(day):
+    """Return the ISO timestamps of every trading interval on ``day`` (YYYY-MM-DD)."""
+    return [f"{day}T{clock}" for clock in _INTERVAL_CLOCK_TIMES]
+
+
 def calculate_data_limit(period):
     """Calculate the number of days to fetch based on the period"""
     if period == 'today':
@@ -20,128 +81,109 @@ def calculate_data_limit(period):
         return 121  # Default
 
 
+def _interval_records(timestamps, closes, volatility, volumes, rng):
+    """Build OHLCV records from per-interval close prices and volumes.
+    
+    Each interval opens at the previous (rounded) close, and its high/low
+    sit a random fraction of the intraday range above/below the close.
+    """
+    n = len(closes)
+    volatility_range = closes * volatility / 10  # Small intraday range
+    highs = np.round(closes + rng.uniform(0, 1, n) * volatility_range, 2)
+    lows = np.round(closes - rng.uniform(0, 1, n) * volatility_range, 2)
+    rounded_closes = np.round(closes, 2)
+    opens = np.concatenate((rounded_closes[:1], rounded_closes[:-1]))
+    
+    return [
+        {'date': timestamp, 'open': open_price, 'high': high, 'low': low, 'close': close, 'volume': volume}
+        for timestamp, open_price, high, low, close, volume in zip(
+            timestamps, opens.tolist(), highs.tolist(), lows.tolist(), rounded_closes.tolist(), volumes.tolist()
+        )
+    ]
+
+
+def _day_rng(symbol, day):
+    """Random generator seeded by symbol and day, so a day's simulation is reproducible."""
+    return np.random.default_rng(zlib.crc32(f"{symbol}:{day}".encode()))
+
+
+@lru_cache(maxsize=64)
+def _simulate_today(symbol, day):
+    """Simulate a European trading day for ``symbol``, cached per symbol and day."""
+    total_intervals = len(_INTERVAL_HOURS)
+    config = _stock_config(symbol)
+    
+    # Start with yesterday's closing price (simulate market open)
+    rng = _day_rng(symbol, day)
+    current_price = config['base_price'] * rng.uniform(0.98, 1.02)  # ±2% gap
+    
+    # European market factors affecting price movement, drawn for all intervals at once
+    
+    # 1. Time-of-day effects (European pattern): opening hour, closing hour,
+    #    lunch hour (lower activity in Europe), normal trading hours
+    time_spread = np.select([_INTERVAL_HOURS < 10.0, _INTERVAL_HOURS > 16.5, _LUNCH], [0.008, 0.006, 0.002], 0.004)
+    time_factor = rng.uniform(-1, 1, total_intervals) * time_spread
+    
+    # 2. Random walk with mean reversion
+    random_factor = rng.normal(0, config['volatility'] / 8, total_intervals)  # Smaller moves for intraday
+    
+    # 3. European trend factor
+    trend_factor = _TREND_FACTOR
+    
+    # 4. Volume-based movement
+    volume_factor = rng.uniform(0.5, 2.0, total_intervals)
+    
+    # Combine all factors
+    total_change = (time_factor + random_factor + trend_factor) * volume_factor
+    
+    # Apply changes, keeping price within reasonable bounds (±5% from start of day);
+    # the clamp depends on the previous price, so this step stays sequential
+    start_price = config['base_price']
+    min_price = start_price * 0.95
+    max_price = start_price * 1.05
+    closes = np.empty(total_intervals)
+    for i, change in enumerate(total_change.tolist()):
+        current_price = max(min_price, min(max_price, current_price * (1 + change)))
+        closes[i] = current_price
+    
+    # Generate realistic volume (European patterns)
+    base_volume = _BASE_VOLUMES.get(symbol, 1000000)
+    # Higher volume at open/close, lower during lunch, normal otherwise
+    volume_low = np.select([_OPENING_OR_CLOSING, _LUNCH], [1.5, 0.3], 0.7)
+    volume_high = np.select([_OPENING_OR_CLOSING, _LUNCH], [2.5, 0.7], 1.3)
+    volumes = (base_volume * rng.uniform(volume_low, volume_high)).astype(np.int64)
+    
+    return tuple(_interval_records(_interval_timestamps(day), closes, config['volatility'], volumes, rng))
+
+
+@lru_cache(maxsize=64)
+def _simulate_yesterday(symbol, day):
+    """Simulate the previous trading day for ``symbol``, cached per symbol and day."""
+    # This is largely the same as the simulation for today, without the price bounds
+    total_intervals = len(_INTERVAL_HOURS)
+    config = _stock_config(symbol)
+    
+    rng = _day_rng(symbol, day)
+    current_price = config['base_price'] * rng.uniform(0.98, 1.02)
+    
+    # No price bounds here, so the whole walk is one cumulative product
+    time_factor = rng.uniform(-0.004, 0.004, total_intervals)
+    random_factor = rng.normal(0, config['volatility'] / 8, total_intervals)
+    total_change = time_factor + random_factor + _TREND_FACTOR
+    closes = current_price * np.cumprod(1 + total_change)
+    
+    base_volume = 1000000
+    volumes = (base_volume * rng.uniform(0.7, 1.3, total_intervals)).astype(np.int64)
+    
+    return tuple(_interval_records(_interval_timestamps(day), closes, config['volatility'], volumes, rng))
+
+
 def generate_hourly_data_for_today(symbol):
     """Generate realistic hourly stock data for today (European market hours)"""
     try:
-        # European market hours: 9:00 AM to 5:30 PM CET (8.5 hours)
-        # Generate data every 30 minutes for smoother curves
-        market_open = 9.0   # 9:00 AM CET
-        market_close = 17.5 # 5:30 PM CET
-        intervals_per_hour = 2  # Every 30 minutes
-        total_intervals = int((market_close - market_open) * intervals_per_hour)
-        
-        # Get base configuration for European stocks
-        stock_configs = {
-            # Dutch stocks (AEX)
-            'ASML.AS': {'base_price': 650, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.030},
-            'INGA.AS': {'base_price': 13, 'sector': 'finance', 'beta': 1.1, 'volatility': 0.025},
-            'HEIA.AS': {'base_price': 85, 'sector': 'consumer', 'beta': 0.8, 'volatility': 0.020},
-            'PHIA.AS': {'base_price': 25, 'sector': 'tech', 'beta': 1.0, 'volatility': 0.025},
-            
-            # Other European stocks
-            'SAP': {'base_price': 120, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
-            'LVMH.PA': {'base_price': 750, 'sector': 'luxury', 'beta': 0.9, 'volatility': 0.028},
-            
-            # Still support US stocks for comparison
-            'NVDA': {'base_price': 165, 'sector': 'tech', 'beta': 1.5, 'volatility': 0.035},
-            'AAPL': {'base_price': 200, 'sector': 'tech', 'beta': 1.2, 'volatility': 0.025},
-            'MSFT': {'base_price': 480, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
-            'GOOGL': {'base_price': 2800, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.028},
-            'TSLA': {'base_price': 350, 'sector': 'auto', 'beta': 1.8, 'volatility': 0.045}
-        }
-        
-        # Clean symbol (remove exchange suffix for lookup)
-        clean_symbol = symbol.split('.')[0] if '.' in symbol else symbol
-        config = stock_configs.get(symbol, stock_configs.get(clean_symbol, stock_configs['ASML.AS']))
-        
-        # Start with yesterday's closing price (simulate market open)
-        current_price = config['base_price'] * random.uniform(0.98, 1.02)  # ±2% gap
-        
-        records = []
+        # Callers get their own record dicts; the cached simulation stays untouched
         today = datetime.now().strftime('%Y-%m-%d')
-        
-        # Generate intraday price movements
-        for i in range(total_intervals):
-            # Calculate time for this interval
-            hours_from_open = i / intervals_per_hour
-            current_hour = market_open + hours_from_open
-            
-            # Convert to actual time
-            hour = int(current_hour)
-            minute = int((current_hour - hour) * 60)
-            time_str = f"{hour:02d}:{minute:02d}:00"
-            timestamp = f"{today}T{time_str}"
-            
-            # European market factors affecting price movement
-            
-            # 1. Time-of-day effects (European pattern)
-            time_factor = 0
-            if current_hour < 10.0:  # Opening hour volatility
-                time_factor = random.uniform(-0.008, 0.008)
-            elif current_hour > 16.5:  # Closing hour volatility
-                time_factor = random.uniform(-0.006, 0.006)
-            elif 12.0 <= current_hour <= 13.0:  # Lunch hour (lower activity in Europe)
-                time_factor = random.uniform(-0.002, 0.002)
-            else:  # Normal trading hours
-                time_factor = random.uniform(-0.004, 0.004)
-            
-            # 2. Random walk with mean reversion
-            random_factor = random.gauss(0, config['volatility'] / 8)  # Smaller moves for intraday
-            
-            # 3. European trend factor
-            trend_factor = math.sin(hours_from_open * math.pi / 8.5) * 0.002  # Gentle intraday trend
-            
-            # 4. Volume-based movement
-            volume_factor = random.uniform(0.5, 2.0)
-            
-            # Combine all factors
-            total_change = (time_factor + random_factor + trend_factor) * volume_factor
-            
-            # Apply change
-            current_price = current_price * (1 + total_change)
-            
-            # Keep price within reasonable bounds (±5% from start of day)
-            start_price = config['base_price']
-            min_price = start_price * 0.95
-            max_price = start_price * 1.05
-            current_price = max(min_price, min(max_price, current_price))
-            
-            # Generate OHLC data for this interval
-            volatility_range = current_price * config['volatility'] / 10  # Small intraday range
-            
-            high = current_price + random.uniform(0, volatility_range)
-            low = current_price - random.uniform(0, volatility_range)
-            open_price = records[-1]['close'] if records else current_price
-            close_price = current_price
-            
-            # Generate realistic volume (European patterns)
-            base_volumes = {
-                'ASML.AS': 2000000,  # High volume Dutch tech stock
-                'INGA.AS': 8000000,  # High volume bank
-                'HEIA.AS': 1500000,  # Medium volume consumer stock
-                'PHIA.AS': 3000000,  # Medium volume tech
-                'SAP': 1800000,      # German software
-                'LVMH.PA': 800000    # French luxury (lower volume)
-            }
-            
-            base_volume = base_volumes.get(symbol, 1000000)
-            if current_hour < 10.0 or current_hour > 16.5:
-                volume = int(base_volume * random.uniform(1.5, 2.5))  # Higher volume at open/close
-            elif 12.0 <= current_hour <= 13.0:
-                volume = int(base_volume * random.uniform(0.3, 0.7))  # Lower during lunch
-            else:
-                volume = int(base_volume * random.uniform(0.7, 1.3))  # Normal volume
-            
-            record = {
-                'date': timestamp,
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close_price, 2),
-                'volume': volume
-            }
-            
-            records.append(record)
+        records = [dict(record) for record in _simulate_today(symbol, today)]
         
         return {
             'success': True,
@@ -161,67 +203,8 @@ def generate_hourly_data_for_today(symbol):
 def generate_hourly_data_for_yesterday(symbol):
     """Generate realistic hourly stock data for yesterday (European market hours)"""
     try:
-        # This is largely the same as the function for today, just with the date adjusted
-        market_open = 9.0
-        market_close = 17.5
-        intervals_per_hour = 2
-        total_intervals = int((market_close - market_open) * intervals_per_hour)
-        
-        stock_configs = {
-            'ASML.AS': {'base_price': 650, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.030},
-            'INGA.AS': {'base_price': 13, 'sector': 'finance', 'beta': 1.1, 'volatility': 0.025},
-            'HEIA.AS': {'base_price': 85, 'sector': 'consumer', 'beta': 0.8, 'volatility': 0.020},
-            'PHIA.AS': {'base_price': 25, 'sector': 'tech', 'beta': 1.0, 'volatility': 0.025},
-            'SAP': {'base_price': 120, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
-            'LVMH.PA': {'base_price': 750, 'sector': 'luxury', 'beta': 0.9, 'volatility': 0.028},
-            'NVDA': {'base_price': 165, 'sector': 'tech', 'beta': 1.5, 'volatility': 0.035},
-            'AAPL': {'base_price': 200, 'sector': 'tech', 'beta': 1.2, 'volatility': 0.025},
-            'MSFT': {'base_price': 480, 'sector': 'tech', 'beta': 1.1, 'volatility': 0.022},
-            'GOOGL': {'base_price': 2800, 'sector': 'tech', 'beta': 1.3, 'volatility': 0.028},
-            'TSLA': {'base_price': 350, 'sector': 'auto', 'beta': 1.8, 'volatility': 0.045}
-        }
-        
-        clean_symbol = symbol.split('.')[0] if '.' in symbol else symbol
-        config = stock_configs.get(symbol, stock_configs.get(clean_symbol, stock_configs['ASML.AS']))
-        
-        current_price = config['base_price'] * random.uniform(0.98, 1.02)
-        records = []
         yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        for i in range(total_intervals):
-            hours_from_open = i / intervals_per_hour
-            current_hour = market_open + hours_from_open
-            
-            hour = int(current_hour)
-            minute = int((current_hour - hour) * 60)
-            time_str = f"{hour:02d}:{minute:02d}:00"
-            timestamp = f"{yesterday}T{time_str}"
-            
-            time_factor = random.uniform(-0.004, 0.004)
-            random_factor = random.gauss(0, config['volatility'] / 8)
-            trend_factor = math.sin(hours_from_open * math.pi / 8.5) * 0.002
-            total_change = time_factor + random_factor + trend_factor
-            
-            current_price = current_price * (1 + total_change)
-            
-            volatility_range = current_price * config['volatility'] / 10
-            high = current_price + random.uniform(0, volatility_range)
-            low = current_price - random.uniform(0, volatility_range)
-            open_price = records[-1]['close'] if records else current_price
-            close_price = current_price
-            
-            base_volume = 1000000
-            volume = int(base_volume * random.uniform(0.7, 1.3))
-            
-            record = {
-                'date': timestamp,
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close_price, 2),
-                'volume': volume
-            }
-            records.append(record)
+        records = [dict(record) for record in _simulate_yesterday(symbol, yesterday)]
         
         return {
             'success': True,
@@ -249,17 +232,13 @@ def filter_data_by_month(records, month_year):
         target_month = month_date.month
         target_year = month_date.year
         
-        filtered_records = []
-        for record in records:
-            if 'date' in record:
-                try:
-                    record_date = datetime.strptime(record['date'].split('T')[0], '%Y-%m-%d')
-                    if record_date.month == target_month and record_date.year == target_year:
-                        filtered_records.append(record)
-                except (ValueError, AttributeError):
-                    continue
+        # Parse all dates in one pass; missing, non-string or malformed dates become NaT and are dropped
+        raw_dates = [record.get('date') for record in records]
+        dates = pd.Series([date if isinstance(date, str) else '' for date in raw_dates], dtype=object)
+        parsed = pd.to_datetime(dates.str.split('T').str[0], format='%Y-%m-%d', errors='coerce', cache=True)
+        mask = (parsed.dt.month == target_month) & (parsed.dt.year == target_year)
         
-        return filtered_records
+        return [record for record, keep in zip(records, mask.to_numpy()) if keep]
     except ValueError:
         # If month_year format is invalid, return original records
         return records
@@ -5,6 +5,7 @@ Database operations for CSV-based stock data storage.
 import pandas as pd
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any, Tuple
 from ..config import config
@@ -14,6 +15,25 @@ StockRecord = Dict[str, Union[str, float, int]]
 DatabaseResult = Dict[str, Union[bool, str, int, List[StockRecord], None]]
 TrackingSummary = Dict[str, Union[str, float, int]]
 
+# Column types for database CSVs, so the parser skips inference and dates stay strings
+_DATABASE_DTYPES = {'date': str, 'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64'}
+
+
+def _rows_unchanged(existing_df: pd.DataFrame, incoming_df: pd.DataFrame, dates: set) -> bool:
+    """Return True if every incoming row is already stored with the same values."""
+    columns = list(incoming_df.columns)
+    if not set(columns) <= set(existing_df.columns):
+        return False
+    
+    stored = existing_df.loc[existing_df['date'].isin(dates), columns]
+    if len(stored) != len(incoming_df):
+        return False
+    
+    # Compare as objects so 150 and 150.0 count as the same price
+    stored = stored.sort_values('date').reset_index(drop=True).astype(object)
+    incoming = incoming_df.sort_values('date').reset_index(drop=True).astype(object)
+    return stored.equals(incoming)
+
 
 def save_to_database_csv(
     data: List[StockRecord], 
@@ -44,40 +64,37 @@ def save_to_database_csv(
         
         if filepath.exists() and update_existing:
             try:
-                # Read existing database
-                existing_df = pd.read_csv(filepath)
+                # Read existing database (dates are read as strings)
+                existing_df = pd.read_csv(filepath, dtype=_DATABASE_DTYPES)
                 
                 # Merge data (update existing dates, add new dates)
-                # Create a copy to avoid modifying original data
-                df_copy = df.copy()
-                existing_df_copy = existing_df.copy()
-                
-                # Ensure date columns are strings for comparison
-                df_copy['date'] = df_copy['date'].astype(str)
-                existing_df_copy['date'] = existing_df_copy['date'].astype(str)
+                # df was built above from the records, so it can be normalized in place
+                df['date'] = df['date'].astype(str)
                 
-                # Remove any existing dates from the old data to avoid duplicates
-                existing_dates = set(df_copy['date'])
-                filtered_existing = existing_df_copy[~existing_df_copy['date'].isin(existing_dates)]
-                
-                # Combine old (non-overlapping) + new data
-                combined_df = pd.concat([filtered_existing, df_copy], ignore_index=True)
-                
-                # Sort by date
-                combined_df = combined_df.sort_values('date')
-                
-                # Check if data actually changed
-                if len(combined_df) == len(existing_df) and existing_df.equals(combined_df):
+                # Check if data actually changed before merging: no new dates and
+                # the incoming rows already stored as-is means nothing to write
+                incoming_dates = set(df['date'])
+                new_dates = incoming_dates - set(existing_df['date'])
+                if not new_dates and _rows_unchanged(existing_df, df, incoming_dates):
                     return {
                         'success': True,
                         'filename': filename,
                         'filepath': str(filepath),
                         'records': len(df),
-                        'total_records': len(combined_df),
-                        'message': f'No changes needed - database up to date ({len(combined_df)} total records)',
+                        'total_records': len(existing_df),
+                        'message': f'No changes needed - database up to date ({len(existing_df)} total records)',
                         'updated': False
                     }
                 
+                # Remove any existing dates from the old data to avoid duplicates
+                filtered_existing = existing_df[~existing_df['date'].isin(incoming_dates)]
+                
+                # Combine old (non-overlapping) + new data
+                combined_df = pd.concat([filtered_existing, df], ignore_index=True)
+                
+                # Sort by date; both parts are already mostly in order, which a stable merge sort handles well
+                combined_df = combined_df.sort_values('date', kind='mergesort', ignore_index=True)
+                
                 # Save updated database
                 combined_df.to_csv(filepath, index=False)
                 
@@ -129,6 +146,18 @@ def save_to_database_csv(
         }
 
 
+@lru_cache(maxsize=32)
+def _read_database_records(filepath: str, mtime_ns: int, size: int) -> Tuple[StockRecord, ...]:
+    """
+    Parse a database CSV into records, cached per file version.
+    
+    The modification time and size are part of the cache key, so a file
+    rewritten by ``save_to_database_csv`` is parsed again on next load.
+    """
+    df = pd.read_csv(filepath, dtype=_DATABASE_DTYPES, memory_map=True, engine='c')
+    return tuple(df.to_dict('records'))
+
+
 def load_from_database_csv(symbol: str) -> DatabaseResult:
     """
     Load stock data from persistent CSV database.
@@ -151,10 +180,11 @@ def load_from_database_csv(symbol: str) -> DatabaseResult:
                 'records': 0
             }
         
-        df = pd.read_csv(filepath)
-        
-        # Convert to records format
-        records: List[StockRecord] = df.to_dict('records')
+        # Parsing is cached per file version; callers get their own record
+        # dicts since they are annotated in place downstream
+        stat = filepath.stat()
+        cached = _read_database_records(str(filepath), stat.st_mtime_ns, stat.st_size)
+        records: List[StockRecord] = [dict(r) for r in cached]
         
         return {
             'success': True,
@@ -206,41 +236,34 @@ def update_database_from_tracking() -> DatabaseResult:
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         df = df.sort_values(['symbol', 'timestamp'])
 
-        # Group by symbol and date
-        grouped = df.groupby(['symbol', pd.Grouper(key='timestamp', freq='D')])
-        
-        all_summaries: List[Tuple[str, TrackingSummary]] = []
-        for (symbol, date), group in grouped:
-            if not group.empty:
-                summary: TrackingSummary = {
-                    'date': date.strftime('%Y-%m-%d'),
-                    'open': group['price'].iloc[0],
-                    'high': group['price'].max(),
-                    'low': group['price'].min(),
-                    'close': group['price'].iloc[-1],
-                    'volume': 0  # Volume is not tracked in real-time data
-                }
-                all_summaries.append((symbol, summary))
+        # Summarize every symbol/day in one grouped aggregation
+        daily = (
+            df.groupby(['symbol', pd.Grouper(key='timestamp', freq='D')])['price']
+            .agg(open='first', high='max', low='min', close='last')
+            .dropna(how='all')
+            .reset_index()
+        )
 
-        if not all_summaries:
+        if daily.empty:
             return {
                 'success': True,
                 'message': 'No daily data to summarize from tracking file.',
                 'updated_symbols': []
             }
 
-        # Update database for each symbol
-        updated_symbols: Dict[str, Dict[str, Any]] = {}
-        symbols_to_update = set(s for s, _ in all_summaries)
+        daily['date'] = daily['timestamp'].dt.strftime('%Y-%m-%d')
+        daily['volume'] = 0  # Volume is not tracked in real-time data
+        summary_columns = ['date', 'open', 'high', 'low', 'close', 'volume']
 
-        for symbol in symbols_to_update:
-            symbol_summaries = [s for sym, s in all_summaries if sym == symbol]
-            result = save_to_database_csv(symbol_summaries, symbol)
-            updated_symbols[symbol] = result
+        # Update database for each symbol with all of its days in one save
+        updated_symbols: Dict[str, Dict[str, Any]] = {}
+        for symbol, group in daily.groupby('symbol', sort=False):
+            symbol_summaries: List[TrackingSummary] = group[summary_columns].to_dict('records')
+            updated_symbols[symbol] = save_to_database_csv(symbol_summaries, symbol)
 
         return {
             'success': True,
-            'message': f'Successfully processed tracking data for {len(symbols_to_update)} symbols.',
+            'message': f'Successfully processed tracking data for {len(updated_symbols)} symbols.',
             'updated_symbols': updated_symbols
         }
 
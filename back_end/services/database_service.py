@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Dict, List
 
 from ..config import EXPORT_DIR, AUTO_DOWNLOAD_SYMBOLS
-from ..models.data_fetcher import MarketDataFetcher
+from ..models.data_fetcher import get_market_data_fetcher
 from ..models.database import save_to_database_csv, load_from_database_csv, update_database_from_tracking
 from ..utils.exceptions import DatabaseException, FileNotFoundException
 from ..utils.helpers import cleanup_duplicate_csv_files
@@ -19,7 +19,7 @@ class DatabaseService:
     """Service for database operations."""
     
     def __init__(self):
-        self.fetcher = MarketDataFetcher()
+        self.fetcher = get_market_data_fetcher()
     
     def list_csv_files(self) -> Dict:
         """List all available CSV files."""
@@ -88,7 +88,7 @@ class DatabaseService:
         for symbol in symbols:
             try:
                 # Get fresh data
-                historical_result = self.fetcher.get_historical_data(symbol, 60)
+                historical_result = self.fetcher.get_historical_data(symbol, 60, fresh=True)
                 
                 if historical_result['success'] and historical_result['data']:
                     # Update database
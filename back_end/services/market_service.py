@@ -7,7 +7,7 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List
 
-from ..models.data_fetcher import MarketDataFetcher
+from ..models.data_fetcher import get_market_data_fetcher
 from ..utils.exceptions import DataFetchException
 
 
@@ -15,7 +15,7 @@ class MarketService:
     """Service for market analysis operations."""
     
     def __init__(self):
-        self.fetcher = MarketDataFetcher()
+        self.fetcher = get_market_data_fetcher()
     
     def get_market_correlation(self, symbols: List[str], period: str = 'default') -> Dict:
         """Get market correlation analysis for multiple symbols."""
@@ -9,7 +9,7 @@ from ..config import (
     AUTO_DOWNLOAD_SYMBOLS, 
     FINNHUB_API_KEY
 )
-from ..models.data_fetcher import MarketDataFetcher
+from ..models.data_fetcher import get_market_data_fetcher
 from ..models.database import save_to_database_csv
 
 
@@ -34,7 +34,7 @@ def automated_daily_download():
         # This function now relies on the MarketDataFetcher, which requires at least Alpha Vantage key.
         # The fetcher itself will handle which API to use.
         
-        fetcher = MarketDataFetcher()
+        fetcher = get_market_data_fetcher()
         results = {}
         
         for symbol in AUTO_DOWNLOAD_SYMBOLS:
@@ -42,7 +42,7 @@ def automated_daily_download():
                 logging.info(f"📈 Fetching data for {symbol}...")
                 
                 # Get historical data (last 30 days to ensure we have recent data)
-                historical_result = fetcher.get_historical_data(symbol, 30)
+                historical_result = fetcher.get_historical_data(symbol, 30, fresh=True)
                 
                 if historical_result['success'] and historical_result['data']:
                     # Save to daily CSV
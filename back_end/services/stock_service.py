@@ -3,10 +3,14 @@ Stock service for handling stock data business logic.
 """
 
 import logging
-from datetime import datetime, timedelta
+import pandas as pd
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
-from ..models.data_fetcher import MarketDataFetcher
+from ..models.data_fetcher import get_market_data_fetcher
 from ..models.database import save_to_database_csv, load_from_database_csv
 from ..models.data_generator import (
     calculate_data_limit, 
@@ -22,11 +26,29 @@ from ..utils.logger import get_logger, log_data_operation, log_error
 from ..config import config
 
 
+@lru_cache(maxsize=64)
+def _period_window(period: str, today_date: date) -> Optional[Tuple[datetime, datetime]]:
+    """Return the ``[start, stop)`` datetime window for a period, or None if unfiltered."""
+    if period == 'week':
+        start_date = today_date - timedelta(days=today_date.weekday() + 7)
+        end_date = start_date + timedelta(days=4)
+    elif period == 'month':
+        end_date = today_date.replace(day=1) - timedelta(days=1)
+        start_date = end_date.replace(day=1)
+    else:
+        return None
+    
+    # Window covers [start_date, end_date] inclusive of whole days
+    start = datetime.combine(start_date, datetime.min.time())
+    stop = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    return start, stop
+
+
 class StockService:
     """Service for stock data operations."""
     
     def __init__(self):
-        self.fetcher = MarketDataFetcher()
+        self.fetcher = get_market_data_fetcher()
         self.technical_analysis = TechnicalAnalysisService()
         self.prediction_service = PredictionService()
         self.logger = get_logger(__name__)
@@ -38,9 +60,9 @@ class StockService:
         self.logger.info(f"Fetching stock data for {symbol} (period: {period})")
         
         try:
-            # Fetch latest data and save it for tracking
+            # Fetch latest data; only fresh (not cached) quotes are saved for tracking
             current_data_result = self.fetcher.get_current_data(symbol)
-            if current_data_result['success']:
+            if current_data_result['success'] and not current_data_result.get('cached'):
                 save_price_tracking_data(symbol, current_data_result['data'])
                 log_data_operation(self.logger, "tracking_save", symbol, 1)
             
@@ -55,6 +77,34 @@ class StockService:
             log_error(self.logger, e, f"get_stock_data for {symbol}")
             raise
     
+    def get_stock_data_batch(self, symbol: str, periods: List[str]) -> Dict[str, Dict]:
+        """Get stock data for several periods, loading the database only once."""
+        symbol = symbol.upper()
+        
+        self.logger.info(f"Fetching stock data for {symbol} (periods: {', '.join(periods)})")
+        
+        try:
+            # Fetch latest data; only fresh (not cached) quotes are saved for tracking
+            current_data_result = self.fetcher.get_current_data(symbol)
+            if current_data_result['success'] and not current_data_result.get('cached'):
+                save_price_tracking_data(symbol, current_data_result['data'])
+                log_data_operation(self.logger, "tracking_save", symbol, 1)
+            
+            loaded = None
+            results = {}
+            for period in periods:
+                if period in ['today', 'yesterday']:
+                    results[period] = self._get_time_based_data(symbol, period)
+                else:
+                    if loaded is None:
+                        loaded = self._load_date_based_records(symbol)
+                    results[period] = self._get_date_based_data(symbol, period, loaded)
+            return results
+            
+        except Exception as e:
+            log_error(self.logger, e, f"get_stock_data_batch for {symbol}")
+            raise
+    
     def _get_time_based_data(self, symbol: str, period: str) -> Dict:
         """Get time-based data (today/yesterday)."""
         historical_result = None
@@ -88,9 +138,27 @@ class StockService:
             'granularity': 'hourly'
         }
     
-    def _get_date_based_data(self, symbol: str, period: str) -> Dict:
-        """Get date-based data (week/month/all)."""
+    def _load_date_based_records(self, symbol: str) -> Tuple[Dict, List[Dict], Optional[Dict]]:
+        """Load and process the database records shared by all date-based periods."""
         db_load_result = load_from_database_csv(symbol)
+        if not db_load_result['success']:
+            return db_load_result, [], None
+        
+        all_records = self._process_database_records(db_load_result['data'])
+        return db_load_result, all_records, self._get_current_data_from_db(symbol)
+    
+    def _get_date_based_data(
+        self,
+        symbol: str,
+        period: str,
+        loaded: Optional[Tuple[Dict, List[Dict], Optional[Dict]]] = None
+    ) -> Dict:
+        """Get date-based data (week/month/all).
+        
+        ``loaded`` is a result of ``_load_date_based_records`` to reuse when
+        building several periods for the same symbol.
+        """
+        db_load_result, all_records, current_data = loaded or self._load_date_based_records(symbol)
         
         if not db_load_result['success']:
             return {
@@ -104,15 +172,13 @@ class StockService:
                 'messages': {'historical': 'No data found in database.', 'current': ''}
             }
         
-        all_records = self._process_database_records(db_load_result['data'])
         records_to_process = self._filter_records_by_period(all_records, period)
         
-        dates = [r['date_obj'].strftime('%Y-%m-%d') for r in records_to_process]
+        # Format every date in one vectorized pass instead of per-record strftime
+        dates = pd.DatetimeIndex([r['date_obj'] for r in records_to_process]).strftime('%Y-%m-%d').tolist()
         prices = [float(r['close']) for r in records_to_process]
         volumes = [int(r.get('volume', 0)) for r in records_to_process]
         
-        current_data = self._get_current_data_from_db(symbol)
-        
         return {
             'success': True,
             'symbol': symbol,
@@ -130,44 +196,40 @@ class StockService:
     
     def _process_database_records(self, records: List[Dict]) -> List[Dict]:
         """Process and sort database records."""
-        for r in records:
-            try:
-                r['date_obj'] = datetime.strptime(r['date'].split('T')[0], '%Y-%m-%d')
-            except (ValueError, KeyError):
-                continue
-        
-        records = [r for r in records if 'date_obj' in r]
-        records.sort(key=lambda r: r['date_obj'])
-        return records
+        if not records:
+            return []
+        
+        # Parse every date in one vectorized pass; missing, non-string or
+        # malformed dates become NaT and those records are dropped
+        dates = [r.get('date') for r in records]
+        date_strings = pd.Series([d if isinstance(d, str) else '' for d in dates], dtype=object)
+        parsed = pd.to_datetime(date_strings.str.split('T').str[0], format='%Y-%m-%d', errors='coerce')
+        parsed = parsed[parsed.notna()].sort_values(kind='stable')
+        
+        processed = []
+        for index, date_obj in zip(parsed.index, pd.DatetimeIndex(parsed).to_pydatetime()):
+            record = records[index]
+            record['date_obj'] = date_obj
+            processed.append(record)
+        return processed
     
     def _filter_records_by_period(self, records: List[Dict], period: str) -> List[Dict]:
-        """Filter records based on period."""
+        """Filter records based on period.
+        
+        Records must be sorted by ``date_obj`` (as returned by
+        ``_process_database_records``), so each period is a bisected slice.
+        """
         if not records:
             return []
         
-        today = records[-1]['date_obj']
-        
-        if period == 'week':
-            today_date = today.date()
-            start_of_last_week = today_date - timedelta(days=today_date.weekday() + 7)
-            end_of_last_week = start_of_last_week + timedelta(days=4)
-            
-            return [
-                r for r in records 
-                if start_of_last_week <= r['date_obj'].date() <= end_of_last_week
-            ]
-        elif period == 'month':
-            today_date = today.date()
-            first_day_current_month = today_date.replace(day=1)
-            end_of_last_month = first_day_current_month - timedelta(days=1)
-            start_of_last_month = end_of_last_month.replace(day=1)
-            
-            return [
-                r for r in records 
-                if start_of_last_month <= r['date_obj'].date() <= end_of_last_month
-            ]
-        else:
+        window = _period_window(period, records[-1]['date_obj'].date())
+        if window is None:
             return records
+        
+        start, stop = window
+        lo = bisect_left(records, start, key=itemgetter('date_obj'))
+        hi = bisect_left(records, stop, lo=lo, key=itemgetter('date_obj'))
+        return records[lo:hi]
     
     def _get_current_data_from_db(self, symbol: str) -> Optional[Dict]:
         """Get current data from database."""
@@ -287,7 +349,7 @@ class StockService:
         
         try:
             # Get fresh data
-            historical_result = self.fetcher.get_historical_data(symbol, config.api.historical_data_limit)
+            historical_result = self.fetcher.get_historical_data(symbol, config.api.historical_data_limit, fresh=True)
             
             if not historical_result['success'] or not historical_result['data']:
                 raise DataFetchException(f"No data available to save for {symbol}: {historical_result['message']}")
@@ -4,35 +4,66 @@ Technical analysis service for calculating indicators and generating trading sig
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import DataFetchException
 
 
+# Indicator inputs: stock records or a DataFrame with 'close' prices, or the close prices as an array
+PriceData = Union[List[Dict], pd.DataFrame, np.ndarray]
+
+
+def _close_prices(data: PriceData) -> np.ndarray:
+    """Return close prices as a float64 array, extracting them from records if needed."""
+    if isinstance(data, np.ndarray):
+        return data.astype(np.float64, copy=False)
+    if isinstance(data, pd.DataFrame):
+        return data['close'].to_numpy(dtype=np.float64)
+    return np.fromiter((record['close'] for record in data), dtype=np.float64, count=len(data))
+
+
+def _first_cross(sma_short: List[float], sma_long: List[float], upward: bool) -> Optional[int]:
+    """Return the first index where the short series crosses the long one, or None."""
+    n = min(len(sma_short), len(sma_long))
+    if n < 2:
+        return None
+    
+    # Sign of the spread on consecutive days; NaN compares False, so gaps never cross
+    spread = np.asarray(sma_short[:n], dtype=np.float64) - np.asarray(sma_long[:n], dtype=np.float64)
+    if upward:
+        crossed = (spread[:-1] <= 0) & (spread[1:] > 0)
+    else:
+        crossed = (spread[:-1] >= 0) & (spread[1:] < 0)
+    
+    indices = np.flatnonzero(crossed)
+    return int(indices[0]) + 1 if indices.size else None
+
+
 class TechnicalAnalysisService:
     """Service for technical analysis calculations and signal generation."""
     
     def __init__(self):
         self.logger = get_logger(__name__)
     
-    def calculate_sma(self, data: List[Dict], period: int = 20) -> List[float]:
+    def calculate_sma(self, data: PriceData, period: int = 20) -> List[float]:
         """
         Calculate Simple Moving Average.
         
         Args:
-            data: List of stock records with 'close' prices
+            data: List of stock records or a DataFrame with 'close' prices, or an array of close prices
             period: Period for SMA calculation (default: 20)
             
         Returns:
             List of SMA values (same length as input data, NaN for insufficient data)
         """
-        if not data or len(data) < period:
-            return [np.nan] * len(data) if data else []
+        n = 0 if data is None else len(data)
+        if n == 0 or n < period:
+            return [np.nan] * n
         
         # Extract close prices
-        close_prices = [float(record['close']) for record in data]
+        close_prices = _close_prices(data)
         
         # Calculate SMA using pandas
         df = pd.DataFrame({'close': close_prices})
@@ -40,22 +71,23 @@ class TechnicalAnalysisService:
         
         return sma
     
-    def calculate_ema(self, data: List[Dict], period: int = 20) -> List[float]:
+    def calculate_ema(self, data: PriceData, period: int = 20) -> List[float]:
         """
         Calculate Exponential Moving Average.
         
         Args:
-            data: List of stock records with 'close' prices
+            data: List of stock records or a DataFrame with 'close' prices, or an array of close prices
             period: Period for EMA calculation (default: 20)
             
         Returns:
             List of EMA values (same length as input data, NaN for insufficient data)
         """
-        if not data or len(data) < period:
-            return [np.nan] * len(data) if data else []
+        n = 0 if data is None else len(data)
+        if n == 0 or n < period:
+            return [np.nan] * n
         
         # Extract close prices
-        close_prices = [float(record['close']) for record in data]
+        close_prices = _close_prices(data)
         
         # Calculate EMA using pandas
         df = pd.DataFrame({'close': close_prices})
@@ -63,22 +95,23 @@ class TechnicalAnalysisService:
         
         return ema
     
-    def calculate_rsi(self, data: List[Dict], period: int = 14) -> List[float]:
+    def calculate_rsi(self, data: PriceData, period: int = 14) -> List[float]:
         """
         Calculate Relative Strength Index.
         
         Args:
-            data: List of stock records with 'close' prices
+            data: List of stock records or a DataFrame with 'close' prices, or an array of close prices
             period: Period for RSI calculation (default: 14)
             
         Returns:
             List of RSI values (same length as input data, NaN for insufficient data)
         """
-        if not data or len(data) < period + 1:
-            return [np.nan] * len(data) if data else []
+        n = 0 if data is None else len(data)
+        if n == 0 or n < period + 1:
+            return [np.nan] * n
         
         # Extract close prices
-        close_prices = [float(record['close']) for record in data]
+        close_prices = _close_prices(data)
         
         # Calculate price changes
         price_changes = pd.Series(close_prices).diff()
@@ -97,12 +130,12 @@ class TechnicalAnalysisService:
         
         return rsi.tolist()
     
-    def calculate_macd(self, data: List[Dict], fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, List[float]]:
+    def calculate_macd(self, data: PriceData, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, List[float]]:
         """
         Calculate MACD (Moving Average Convergence Divergence).
         
         Args:
-            data: List of stock records with 'close' prices
+            data: List of stock records or a DataFrame with 'close' prices, or an array of close prices
             fast: Fast EMA period (default: 12)
             slow: Slow EMA period (default: 26)
             signal: Signal line period (default: 9)
@@ -110,8 +143,9 @@ class TechnicalAnalysisService:
         Returns:
             Dictionary with 'macd_line', 'signal_line', and 'histogram' lists
         """
-        if not data or len(data) < slow:
-            empty_list = [np.nan] * len(data) if data else []
+        n = 0 if data is None else len(data)
+        if n == 0 or n < slow:
+            empty_list = [np.nan] * n
             return {
                 'macd_line': empty_list,
                 'signal_line': empty_list,
@@ -119,7 +153,7 @@ class TechnicalAnalysisService:
             }
         
         # Extract close prices
-        close_prices = [float(record['close']) for record in data]
+        close_prices = _close_prices(data)
         
         # Calculate fast and slow EMAs
         df = pd.DataFrame({'close': close_prices})
@@ -141,53 +175,31 @@ class TechnicalAnalysisService:
             'histogram': histogram.tolist()
         }
     
-    def detect_golden_cross(self, sma_short: List[float], sma_long: List[float]) -> Optional[int]:
+    def detect_golden_cross(self, sma_short: Union[List[float], np.ndarray], sma_long: Union[List[float], np.ndarray]) -> Optional[int]:
         """
         Detect golden cross (short SMA crosses above long SMA).
         
         Args:
-            sma_short: List of short-term SMA values
-            sma_long: List of long-term SMA values
+            sma_short: Short-term SMA values as a list or array
+            sma_long: Long-term SMA values as a list or array
             
         Returns:
             Index where golden cross occurred, or None if no cross detected
         """
-        if len(sma_short) < 2 or len(sma_long) < 2:
-            return None
-        
-        # Check for golden cross (short SMA crosses above long SMA)
-        for i in range(1, len(sma_short)):
-            if (sma_short[i-1] <= sma_long[i-1] and 
-                sma_short[i] > sma_long[i] and 
-                not pd.isna(sma_short[i]) and 
-                not pd.isna(sma_long[i])):
-                return i
-        
-        return None
+        return _first_cross(sma_short, sma_long, upward=True)
     
-    def detect_death_cross(self, sma_short: List[float], sma_long: List[float]) -> Optional[int]:
+    def detect_death_cross(self, sma_short: Union[List[float], np.ndarray], sma_long: Union[List[float], np.ndarray]) -> Optional[int]:
         """
         Detect death cross (short SMA crosses below long SMA).
         
         Args:
-            sma_short: List of short-term SMA values
-            sma_long: List of long-term SMA values
+            sma_short: Short-term SMA values as a list or array
+            sma_long: Long-term SMA values as a list or array
             
         Returns:
             Index where death cross occurred, or None if no cross detected
         """
-        if len(sma_short) < 2 or len(sma_long) < 2:
-            return None
-        
-        # Check for death cross (short SMA crosses below long SMA)
-        for i in range(1, len(sma_short)):
-            if (sma_short[i-1] >= sma_long[i-1] and 
-                sma_short[i] < sma_long[i] and 
-                not pd.isna(sma_short[i]) and 
-                not pd.isna(sma_long[i])):
-                return i
-        
-        return None
+        return _first_cross(sma_short, sma_long, upward=False)
     
     def generate_signals(self, historical_data: List[Dict]) -> Dict:
         """
@@ -205,14 +217,15 @@ class TechnicalAnalysisService:
         self.logger.info(f"Generating technical analysis signals for {len(historical_data)} data points")
         
         try:
-            # Calculate all indicators
-            sma_20 = self.calculate_sma(historical_data, 20)
-            sma_50 = self.calculate_sma(historical_data, 50)
-            sma_200 = self.calculate_sma(historical_data, 200)
-            ema_12 = self.calculate_ema(historical_data, 12)
-            ema_26 = self.calculate_ema(historical_data, 26)
-            rsi_14 = self.calculate_rsi(historical_data, 14)
-            macd_data = self.calculate_macd(historical_data)
+            # Extract close prices once and calculate all indicators from them
+            closes = _close_prices(historical_data)
+            sma_20 = self.calculate_sma(closes, 20)
+            sma_50 = self.calculate_sma(closes, 50)
+            sma_200 = self.calculate_sma(closes, 200)
+            ema_12 = self.calculate_ema(closes, 12)
+            ema_26 = self.calculate_ema(closes, 26)
+            rsi_14 = self.calculate_rsi(closes, 14)
+            macd_data = self.calculate_macd(closes)
             
             # Get latest values for signal generation
             latest_index = len(historical_data) - 1
@@ -2,679 +2,77 @@
 API Documentation for Stock Market Dashboard.
 
 This module provides comprehensive API documentation using OpenAPI/Swagger specification.
+
+The specification is static at runtime, so every function here returns a
+shared, cached object. Callers must treat the results as read-only.
 """
 
+import hashlib
+import json
+import sys
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, Any, List
 from datetime import datetime
 
+from .api_docs_generated import _SPEC
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 def get_openapi_spec() -> Dict[str, Any]:
     """
-    Generate OpenAPI 3.0 specification for the Stock Market Dashboard API.
+    Get the OpenAPI 3.0 specification for the Stock Market Dashboard API.
+    
+    The specification is maintained in ``api_spec.yaml`` and frozen into
+    ``api_docs_generated.py`` by ``tools/gen_api_docs.py``.
     
     Returns:
-        Complete OpenAPI specification dictionary
+        Complete OpenAPI specification dictionary (shared, do not mutate)
     """
-    return {
-        "openapi": "3.0.3",
-        "info": {
-            "title": "Stock Market Dashboard API",
-            "description": """
-            Comprehensive API for stock market data analysis and management.
-            
-            ## Features
-            - Real-time and historical stock data retrieval
-            - Market correlation and volatility analysis
-            - Database management and automation
-            - Price tracking and event detection
-            
-            ## Authentication
-            Currently no authentication required. API keys for external services (Finnhub, Alpha Vantage) 
-            should be configured via environment variables.
-            
-            ## Rate Limits
-            - Finnhub: 60 calls/minute (free tier)
-            - Alpha Vantage: 5 calls/minute, 500 calls/day (free tier)
-            
-            ## Data Sources
-            - **Current Data**: Finnhub API
-            - **Historical Data**: Alpha Vantage API
-            - **Storage**: Local CSV files
-            """,
-            "version": "1.0.0",
-            "contact": {
-                "name": "Stock Market Dashboard",
-                "url": "https://github.com/your-repo/stockmarket"
-            },
-            "license": {
-                "name": "MIT",
-                "url": "https://opensource.org/licenses/MIT"
-            }
-        },
-        "servers": [
-            {
-                "url": "http://localhost:8001",
-                "description": "Development server"
-            }
-        ],
-        "paths": {
-            "/api/health": {
-                "get": {
-                    "summary": "Health Check",
-                    "description": "Check API health and configuration status",
-                    "tags": ["System"],
-                    "responses": {
-                        "200": {
-                            "description": "API is healthy",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/HealthResponse"
-                                    },
-                                    "example": {
-                                        "success": True,
-                                        "data": {
-                                            "status": "healthy",
-                                            "timestamp": "2023-01-01T12:00:00Z",
-                                            "config": {
-                                                "api_keys_configured": True,
-                                                "auto_download_enabled": True,
-                                                "server_host": "localhost",
-                                                "server_port": 8001
-                                            }
-                                        },
-                                        "message": "API is healthy",
-                                        "timestamp": "2023-01-01T12:00:00Z"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/stock_data/{symbol}": {
-                "get": {
-                    "summary": "Get Stock Data",
-                    "description": "Retrieve current and historical stock data for a symbol",
-                    "tags": ["Stock Data"],
-                    "parameters": [
-                        {
-                            "name": "symbol",
-                            "in": "path",
-                            "required": True,
-                            "description": "Stock symbol (e.g., AAPL, MSFT)",
-                            "schema": {
-                                "type": "string",
-                                "example": "AAPL"
-                            }
-                        },
-                        {
-                            "name": "period",
-                            "in": "query",
-                            "required": False,
-                            "description": "Time period for historical data",
-                            "schema": {
-                                "type": "string",
-                                "enum": ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max", "default"],
-                                "default": "default"
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Stock data retrieved successfully",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/StockDataResponse"
-                                    }
-                                }
-                            }
-                        },
-                        "400": {
-                            "description": "Bad request - invalid symbol or API error",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/ErrorResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/comparison_data": {
-                "get": {
-                    "summary": "Get Comparison Data",
-                    "description": "Retrieve data for multiple symbols for comparison",
-                    "tags": ["Stock Data"],
-                    "parameters": [
-                        {
-                            "name": "symbols",
-                            "in": "query",
-                            "required": True,
-                            "description": "Comma-separated list of stock symbols",
-                            "schema": {
-                                "type": "string",
-                                "example": "AAPL,MSFT,GOOGL"
-                            }
-                        },
-                        {
-                            "name": "period",
-                            "in": "query",
-                            "required": False,
-                            "description": "Time period for historical data",
-                            "schema": {
-                                "type": "string",
-                                "enum": ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max", "default"],
-                                "default": "default"
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Comparison data retrieved successfully",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/ComparisonDataResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/market/correlation": {
-                "get": {
-                    "summary": "Market Correlation Analysis",
-                    "description": "Analyze correlation between multiple stocks",
-                    "tags": ["Market Analysis"],
-                    "parameters": [
-                        {
-                            "name": "symbols",
-                            "in": "query",
-                            "required": True,
-                            "description": "Comma-separated list of stock symbols",
-                            "schema": {
-                                "type": "string",
-                                "example": "AAPL,MSFT,GOOGL"
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Correlation analysis completed",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/CorrelationResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/market/events": {
-                "get": {
-                    "summary": "Market Events Detection",
-                    "description": "Detect significant market events for a stock",
-                    "tags": ["Market Analysis"],
-                    "parameters": [
-                        {
-                            "name": "symbol",
-                            "in": "query",
-                            "required": True,
-                            "description": "Stock symbol to analyze",
-                            "schema": {
-                                "type": "string",
-                                "example": "AAPL"
-                            }
-                        },
-                        {
-                            "name": "threshold",
-                            "in": "query",
-                            "required": False,
-                            "description": "Threshold for event detection (percentage)",
-                            "schema": {
-                                "type": "number",
-                                "format": "float",
-                                "default": 5.0,
-                                "minimum": 0.1,
-                                "maximum": 50.0
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Market events detected",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/MarketEventsResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/database/save/{symbol}": {
-                "get": {
-                    "summary": "Save Stock Data to Database",
-                    "description": "Download and save historical stock data to local database",
-                    "tags": ["Database Management"],
-                    "parameters": [
-                        {
-                            "name": "symbol",
-                            "in": "path",
-                            "required": True,
-                            "description": "Stock symbol to save",
-                            "schema": {
-                                "type": "string",
-                                "example": "AAPL"
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Data saved successfully",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/DatabaseSaveResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/database/list": {
-                "get": {
-                    "summary": "List Database Files",
-                    "description": "List all available database files with metadata",
-                    "tags": ["Database Management"],
-                    "responses": {
-                        "200": {
-                            "description": "Database files listed",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/DatabaseListResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/database/update-all": {
-                "get": {
-                    "summary": "Update All Databases",
-                    "description": "Update all configured stock databases with latest data",
-                    "tags": ["Database Management"],
-                    "responses": {
-                        "200": {
-                            "description": "All databases updated",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/DatabaseUpdateResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/auto-download/status": {
-                "get": {
-                    "summary": "Get Automation Status",
-                    "description": "Get current automation configuration and status",
-                    "tags": ["Automation"],
-                    "responses": {
-                        "200": {
-                            "description": "Automation status retrieved",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/AutomationStatusResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/api/auto-download/trigger": {
-                "get": {
-                    "summary": "Trigger Automated Download",
-                    "description": "Manually trigger the automated download process",
-                    "tags": ["Automation"],
-                    "responses": {
-                        "200": {
-                            "description": "Automated download triggered",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/AutomationTriggerResponse"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        },
-        "components": {
-            "schemas": {
-                "HealthResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "status": {"type": "string", "enum": ["healthy", "unhealthy"]},
-                                "timestamp": {"type": "string", "format": "date-time"},
-                                "config": {
-                                    "type": "object",
-                                    "properties": {
-                                        "api_keys_configured": {"type": "boolean"},
-                                        "auto_download_enabled": {"type": "boolean"},
-                                        "server_host": {"type": "string"},
-                                        "server_port": {"type": "integer"}
-                                    }
-                                }
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "StockDataResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "symbol": {"type": "string"},
-                                "dates": {"type": "array", "items": {"type": "string"}},
-                                "prices": {"type": "array", "items": {"type": "number"}},
-                                "volumes": {"type": "array", "items": {"type": "integer"}},
-                                "current": {
-                                    "type": "object",
-                                    "properties": {
-                                        "price": {"type": "number"},
-                                        "change": {"type": "number"},
-                                        "change_percent": {"type": "number"}
-                                    }
-                                },
-                                "errors": {"type": "array", "items": {"type": "string"}},
-                                "messages": {"type": "object"},
-                                "granularity": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "ComparisonDataResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "additionalProperties": {
-                                "$ref": "#/components/schemas/StockDataResponse"
-                            }
-                        },
-                        "errors": {"type": "array", "items": {"type": "string"}},
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "CorrelationResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "correlation_matrix": {
-                                    "type": "object",
-                                    "additionalProperties": {
-                                        "type": "object",
-                                        "additionalProperties": {"type": "number"}
-                                    }
-                                },
-                                "market_volatility": {
-                                    "type": "object",
-                                    "additionalProperties": {"type": "number"}
-                                },
-                                "symbols": {"type": "array", "items": {"type": "string"}},
-                                "analysis_date": {"type": "string", "format": "date-time"},
-                                "message": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "MarketEventsResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "symbol": {"type": "string"},
-                                "threshold": {"type": "number"},
-                                "events": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "date": {"type": "string"},
-                                            "type": {"type": "string"},
-                                            "magnitude": {"type": "string"},
-                                            "return": {"type": "number"},
-                                            "price_from": {"type": "number"},
-                                            "price_to": {"type": "number"},
-                                            "volume": {"type": "integer"}
-                                        }
-                                    }
-                                },
-                                "total_events": {"type": "integer"},
-                                "analysis_date": {"type": "string", "format": "date-time"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "DatabaseSaveResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "symbol": {"type": "string"},
-                                "message": {"type": "string"},
-                                "records_added": {"type": "integer"},
-                                "total_records": {"type": "integer"},
-                                "updated": {"type": "boolean"},
-                                "filename": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "DatabaseListResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "databases": {
-                                    "type": "array",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "symbol": {"type": "string"},
-                                            "filename": {"type": "string"},
-                                            "records": {"type": "integer"},
-                                            "size_kb": {"type": "number"},
-                                            "last_modified": {"type": "integer"},
-                                            "date_range": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "earliest": {"type": "string"},
-                                                    "latest": {"type": "string"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                },
-                                "total_files": {"type": "integer"},
-                                "message": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "DatabaseUpdateResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "results": {
-                                    "type": "object",
-                                    "additionalProperties": {
-                                        "$ref": "#/components/schemas/DatabaseSaveResponse"
-                                    }
-                                },
-                                "summary": {
-                                    "type": "object",
-                                    "properties": {
-                                        "successful_symbols": {"type": "integer"},
-                                        "total_symbols": {"type": "integer"},
-                                        "total_records": {"type": "integer"}
-                                    }
-                                },
-                                "message": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "AutomationStatusResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "config": {
-                                    "type": "object",
-                                    "properties": {
-                                        "enabled": {"type": "boolean"},
-                                        "hour": {"type": "integer"},
-                                        "minute": {"type": "integer"},
-                                        "symbols": {"type": "array", "items": {"type": "string"}},
-                                        "api_key_configured": {"type": "boolean"}
-                                    }
-                                },
-                                "next_run": {"type": "string"}
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "AutomationTriggerResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "data": {
-                            "type": "object",
-                            "properties": {
-                                "message": {"type": "string"},
-                                "results": {
-                                    "type": "object",
-                                    "additionalProperties": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {"type": "boolean"},
-                                            "records": {"type": "integer"}
-                                        }
-                                    }
-                                },
-                                "summary": {
-                                    "type": "object",
-                                    "properties": {
-                                        "successful_symbols": {"type": "integer"},
-                                        "total_symbols": {"type": "integer"},
-                                        "total_records": {"type": "integer"}
-                                    }
-                                }
-                            }
-                        },
-                        "message": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                },
-                "ErrorResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {"type": "boolean"},
-                        "message": {"type": "string"},
-                        "error_code": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"}
-                    }
-                }
-            }
-        },
-        "tags": [
-            {
-                "name": "System",
-                "description": "System health and status endpoints"
-            },
-            {
-                "name": "Stock Data",
-                "description": "Stock data retrieval and analysis"
-            },
-            {
-                "name": "Market Analysis",
-                "description": "Market correlation and event detection"
-            },
-            {
-                "name": "Database Management",
-                "description": "Database operations and file management"
-            },
-            {
-                "name": "Automation",
-                "description": "Automated data collection and scheduling"
-            }
-        ]
-    }
+    return _SPEC
+
+
+@lru_cache(maxsize=1)
+def get_openapi_spec_json() -> bytes:
+    """
+    Get the OpenAPI specification serialized as compact JSON.
+    
+    The specification is encoded once and the bytes are reused for every
+    request, so serving ``/openapi.json`` does no JSON encoding at all.
+    
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(get_openapi_spec(), option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(get_openapi_spec(), separators=(',', ':')).encode('utf-8')
 
 
+@lru_cache(maxsize=1)
+def get_openapi_spec_etag() -> str:
+    """
+    Get an entity tag for the serialized OpenAPI specification.
+    
+    The tag is a hash of the cached JSON bytes, so it only changes when
+    the specification itself changes.
+    
+    Returns:
+        Hex digest identifying the current specification
+    """
+    return hashlib.blake2b(get_openapi_spec_json(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1)
 def generate_markdown_docs() -> str:
     """
     Generate markdown documentation for the API.
     
+    The markdown is built on first call and cached afterwards.
+    
     Returns:
         Markdown formatted API documentation
     """
@@ -734,7 +132,7 @@ Check API health and configuration status.
 
 #### Get Stock Data
 
-`GET /api/stock_data/{symbol}`
+`GET /api/stock_data/{{symbol}}`
 
 Retrieve current and historical stock data for a symbol.
 
@@ -799,7 +197,7 @@ GET /api/market/events?symbol=AAPL&threshold=3.0
 
 #### Save Stock Data to Database
 
-`GET /api/database/save/{symbol}`
+`GET /api/database/save/{{symbol}}`
 
 Download and save historical stock data to local database.
 
@@ -930,20 +328,22 @@ For issues and questions, please refer to the project repository or create an is
     return markdown
 
 
+@lru_cache(maxsize=1)
 def get_api_summary() -> Dict[str, Any]:
     """
     Get a summary of all available API endpoints.
     
+    The summary is built on first call and cached afterwards.
+    
     Returns:
-        Dictionary containing endpoint summary
+        Dictionary containing endpoint summary (shared, do not mutate)
     """
     spec = get_openapi_spec()
     
-    summary = {
-        "total_endpoints": len(spec["paths"]),
-        "tags": {},
-        "endpoints": []
-    }
+    endpoints = []
+    # Tag names come from the unpickled spec, so intern them before they
+    # are used as counter keys
+    tag_counter = Counter()
     
     for path, methods in spec["paths"].items():
         for method, details in methods.items():
@@ -952,15 +352,14 @@ def get_api_summary() -> Dict[str, Any]:
                     "path": path,
                     "method": method.upper(),
                     "summary": details.get("summary", ""),
-                    "tags": details.get("tags", []),
+                    "tags": [sys.intern(tag) for tag in details.get("tags", [])],
                     "description": details.get("description", "")
                 }
-                summary["endpoints"].append(endpoint)
-                
-                # Count by tags
-                for tag in endpoint["tags"]:
-                    if tag not in summary["tags"]:
-                        summary["tags"][tag] = 0
-                    summary["tags"][tag] += 1
+                endpoints.append(endpoint)
+                tag_counter.update(endpoint["tags"])
     
-    return summary 
\ No newline at end of file
+    return {
+        "total_endpoints": len(spec["paths"]),
+        "tags": dict(tag_counter),
+        "endpoints": endpoints
+    }
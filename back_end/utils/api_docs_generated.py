@@ -0,0 +1,266 @@
+"""
+Frozen OpenAPI specification for the Stock Market Dashboard API.
+
+GENERATED FILE - DO NOT EDIT. Edit back_end/utils/api_spec.yaml and run
+``python tools/gen_api_docs.py`` instead.
+"""
+
+import pickle
+
+_SPEC_PICKLE: bytes = (
+    b'\x80\x04\x95H/\x00\x00\x00\x00\x00\x00}\x94(\x8c\x07openapi\x94\x8c\x053.0.3\x94\x8c\x04info\x94}\x94(\x8c\x05titl'
+    b'e\x94\x8c\x1aStock Market Dashboard API\x94\x8c\x0bdescription\x94X\x81\x02'
+    b'\x00\x00Comprehensive API for stock market data analys'
+    b'is and management.\n\n## Features\n- Real-time and '
+    b'historical stock data retrieval\n- Market correla'
+    b'tion and volatility analysis\n- Database manageme'
+    b'nt and automation\n- Price tracking and event det'
+    b'ection\n\n## Authentication\nCurrently no authentic'
+    b'ation required. API keys for external services ('
+    b'Finnhub, Alpha Vantage)\nshould be configured via'
+    b' environment variables.\n\n## Rate Limits\n- Finnhu'
+    b'b: 60 calls/minute (free tier)\n- Alpha Vantage: '
+    b'5 calls/minute, 500 calls/day (free tier)\n\n## Da'
+    b'ta Sources\n- **Current Data**: Finnhub API\n- **H'
+    b'istorical Data**: Alpha Vantage API\n- **Storage*'
+    b'*: Local CSV files\n\x94\x8c\x07version\x94\x8c\x051.0.0\x94\x8c\x07contact\x94'
+    b'}\x94(\x8c\x04name\x94\x8c\x16Stock Market Dashboard\x94\x8c\x03url\x94\x8c(https'
+    b'://github.com/your-repo/stockmarket\x94u\x8c\x07license\x94}'
+    b'\x94(\x8c\x04name\x94\x8c\x03MIT\x94\x8c\x03url\x94\x8c#https://opensource.org/li'
+    b'censes/MIT\x94uu\x8c\x07servers\x94]\x94}\x94(\x8c\x03url\x94\x8c\x15http://local'
+    b'host:8001\x94\x8c\x0bdescription\x94\x8c\x12Development server\x94ua\x8c'
+    b'\x05paths\x94}\x94(\x8c\x0b/api/health\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x0cH'
+    b'ealth Check\x94\x8c\x0bdescription\x94\x8c)Check API health and'
+    b' configuration status\x94\x8c\x04tags\x94]\x94\x8c\x06System\x94a\x8c\trespo'
+    b'nses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x0eAPI is healthy\x94\x8c'
+    b'\x07content\x94}\x94\x8c\x10application/json\x94}\x94(\x8c\x06schema\x94}\x94\x8c\x04$r'
+    b'ef\x94\x8c##/components/schemas/HealthResponse\x94s\x8c\x07exam'
+    b'ple\x94}\x94(\x8c\x07success\x94\x88\x8c\x04data\x94}\x94(\x8c\x06status\x94\x8c\x07healthy\x94\x8c'
+    b'\ttimestamp\x94\x8c\x142023-01-01T12:00:00Z\x94\x8c\x06config\x94}\x94(\x8c\x13'
+    b'api_keys_configured\x94\x88\x8c\x15auto_download_enabled\x94\x88\x8c\x0b'
+    b'server_host\x94\x8c\tlocalhost\x94\x8c\x0bserver_port\x94MA\x1fuu\x8c\x07mes'
+    b'sage\x94\x8c\x0eAPI is healthy\x94\x8c\ttimestamp\x94\x8c\x142023-01-01T1'
+    b'2:00:00Z\x94uususus\x8c\x18/api/stock_data/{symbol}\x94}\x94\x8c\x03g'
+    b'et\x94}\x94(\x8c\x07summary\x94\x8c\x0eGet Stock Data\x94\x8c\x0bdescription\x94\x8c'
+    b'7Retrieve current and historical stock data for '
+    b'a symbol\x94\x8c\x04tags\x94]\x94\x8c\nStock Data\x94a\x8c\nparameters\x94]\x94('
+    b'}\x94(\x8c\x04name\x94\x8c\x06symbol\x94\x8c\x02in\x94\x8c\x04path\x94\x8c\x08required\x94\x88\x8c\x0bdes'
+    b'cription\x94\x8c\x1fStock symbol (e.g., AAPL, MSFT)\x94\x8c\x06sch'
+    b'ema\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x07example\x94\x8c\x04AAPL\x94uu}\x94(\x8c\x04n'
+    b'ame\x94\x8c\x06period\x94\x8c\x02in\x94\x8c\x05query\x94\x8c\x08required\x94\x89\x8c\x0bdescript'
+    b'ion\x94\x8c\x1fTime period for historical data\x94\x8c\x06schema\x94}'
+    b'\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x04enum\x94]\x94(\x8c\x021d\x94\x8c\x025d\x94\x8c\x031mo\x94\x8c\x033m'
+    b'o\x94\x8c\x036mo\x94\x8c\x021y\x94\x8c\x022y\x94\x8c\x025y\x94\x8c\x0310y\x94\x8c\x03ytd\x94\x8c\x03max\x94\x8c\x07defau'
+    b'lt\x94e\x8c\x07default\x94\x8c\x07default\x94uue\x8c\tresponses\x94}\x94(\x8c\x03200\x94'
+    b'}\x94(\x8c\x0bdescription\x94\x8c!Stock data retrieved successf'
+    b'ully\x94\x8c\x07content\x94}\x94\x8c\x10application/json\x94}\x94\x8c\x06schema\x94}'
+    b'\x94\x8c\x04$ref\x94\x8c&#/components/schemas/StockDataResponse'
+    b'\x94sssu\x8c\x03400\x94}\x94(\x8c\x0bdescription\x94\x8c)Bad request - inva'
+    b'lid symbol or API error\x94\x8c\x07content\x94}\x94\x8c\x10applicatio'
+    b'n/json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c"#/components/schema'
+    b's/ErrorResponse\x94sssuuus\x8c\x14/api/comparison_data\x94}\x94'
+    b'\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x13Get Comparison Data\x94\x8c\x0bdescr'
+    b'iption\x94\x8c1Retrieve data for multiple symbols for '
+    b'comparison\x94\x8c\x04tags\x94]\x94\x8c\nStock Data\x94a\x8c\nparameters\x94]'
+    b'\x94(}\x94(\x8c\x04name\x94\x8c\x07symbols\x94\x8c\x02in\x94\x8c\x05query\x94\x8c\x08required\x94\x88\x8c'
+    b'\x0bdescription\x94\x8c%Comma-separated list of stock sym'
+    b'bols\x94\x8c\x06schema\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x07example\x94\x8c\x0fAAP'
+    b'L,MSFT,GOOGL\x94uu}\x94(\x8c\x04name\x94\x8c\x06period\x94\x8c\x02in\x94\x8c\x05query\x94\x8c'
+    b'\x08required\x94\x89\x8c\x0bdescription\x94\x8c\x1fTime period for histo'
+    b'rical data\x94\x8c\x06schema\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x04enum\x94]\x94'
+    b'(\x8c\x021d\x94\x8c\x025d\x94\x8c\x031mo\x94\x8c\x033mo\x94\x8c\x036mo\x94\x8c\x021y\x94\x8c\x022y\x94\x8c\x025y\x94\x8c\x0310'
+    b'y\x94\x8c\x03ytd\x94\x8c\x03max\x94\x8c\x07default\x94e\x8c\x07default\x94\x8c\x07default\x94uue'
+    b'\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c&Compariso'
+    b'n data retrieved successfully\x94\x8c\x07content\x94}\x94\x8c\x10appl'
+    b'ication/json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c+#/components/'
+    b'schemas/ComparisonDataResponse\x94sssusus\x8c\x17/api/mar'
+    b'ket/correlation\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x1bMarket Co'
+    b'rrelation Analysis\x94\x8c\x0bdescription\x94\x8c+Analyze corre'
+    b'lation between multiple stocks\x94\x8c\x04tags\x94]\x94\x8c\x0fMarket'
+    b' Analysis\x94a\x8c\nparameters\x94]\x94}\x94(\x8c\x04name\x94\x8c\x07symbols\x94\x8c\x02'
+    b'in\x94\x8c\x05query\x94\x8c\x08required\x94\x88\x8c\x0bdescription\x94\x8c%Comma-sep'
+    b'arated list of stock symbols\x94\x8c\x06schema\x94}\x94(\x8c\x04type\x94'
+    b'\x8c\x06string\x94\x8c\x07example\x94\x8c\x0fAAPL,MSFT,GOOGL\x94uua\x8c\trespon'
+    b'ses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x1eCorrelation analy'
+    b'sis completed\x94\x8c\x07content\x94}\x94\x8c\x10application/json\x94}\x94\x8c'
+    b'\x06schema\x94}\x94\x8c\x04$ref\x94\x8c(#/components/schemas/Correlat'
+    b'ionResponse\x94sssusus\x8c\x12/api/market/events\x94}\x94\x8c\x03get\x94'
+    b'}\x94(\x8c\x07summary\x94\x8c\x17Market Events Detection\x94\x8c\x0bdescrip'
+    b'tion\x94\x8c,Detect significant market events for a st'
+    b'ock\x94\x8c\x04tags\x94]\x94\x8c\x0fMarket Analysis\x94a\x8c\nparameters\x94]\x94('
+    b'}\x94(\x8c\x04name\x94\x8c\x06symbol\x94\x8c\x02in\x94\x8c\x05query\x94\x8c\x08required\x94\x88\x8c\x0bde'
+    b'scription\x94\x8c\x17Stock symbol to analyze\x94\x8c\x06schema\x94}\x94('
+    b'\x8c\x04type\x94\x8c\x06string\x94\x8c\x07example\x94\x8c\x04AAPL\x94uu}\x94(\x8c\x04name\x94\x8c\tt'
+    b'hreshold\x94\x8c\x02in\x94\x8c\x05query\x94\x8c\x08required\x94\x89\x8c\x0bdescription\x94'
+    b'\x8c*Threshold for event detection (percentage)\x94\x8c\x06s'
+    b'chema\x94}\x94(\x8c\x04type\x94\x8c\x06number\x94\x8c\x06format\x94\x8c\x05float\x94\x8c\x07defa'
+    b'ult\x94G@\x14\x00\x00\x00\x00\x00\x00\x8c\x07minimum\x94G?\xb9\x99\x99\x99\x99\x99\x9a\x8c\x07maximum\x94G@I\x00\x00\x00'
+    b'\x00\x00\x00uue\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x16Mar'
+    b'ket events detected\x94\x8c\x07content\x94}\x94\x8c\x10application/js'
+    b'on\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c)#/components/schemas/Ma'
+    b'rketEventsResponse\x94sssusus\x8c\x1b/api/database/save/{'
+    b'symbol}\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x1bSave Stock Data t'
+    b'o Database\x94\x8c\x0bdescription\x94\x8c9Download and save his'
+    b'torical stock data to local database\x94\x8c\x04tags\x94]\x94\x8c\x13'
+    b'Database Management\x94a\x8c\nparameters\x94]\x94}\x94(\x8c\x04name\x94\x8c\x06'
+    b'symbol\x94\x8c\x02in\x94\x8c\x04path\x94\x8c\x08required\x94\x88\x8c\x0bdescription\x94\x8c\x14S'
+    b'tock symbol to save\x94\x8c\x06schema\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94'
+    b'\x8c\x07example\x94\x8c\x04AAPL\x94uua\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdes'
+    b'cription\x94\x8c\x17Data saved successfully\x94\x8c\x07content\x94}\x94\x8c'
+    b'\x10application/json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c)#/compon'
+    b'ents/schemas/DatabaseSaveResponse\x94sssusus\x8c\x12/api/'
+    b'database/list\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x13List Databa'
+    b'se Files\x94\x8c\x0bdescription\x94\x8c/List all available data'
+    b'base files with metadata\x94\x8c\x04tags\x94]\x94\x8c\x13Database Man'
+    b'agement\x94a\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x15'
+    b'Database files listed\x94\x8c\x07content\x94}\x94\x8c\x10application/'
+    b'json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c)#/components/schemas/'
+    b'DatabaseListResponse\x94sssusus\x8c\x18/api/database/upda'
+    b'te-all\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x14Update All Databas'
+    b'es\x94\x8c\x0bdescription\x94\x8c6Update all configured stock d'
+    b'atabases with latest data\x94\x8c\x04tags\x94]\x94\x8c\x13Database Ma'
+    b'nagement\x94a\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c'
+    b'\x15All databases updated\x94\x8c\x07content\x94}\x94\x8c\x10application'
+    b'/json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c+#/components/schemas'
+    b'/DatabaseUpdateResponse\x94sssusus\x8c\x19/api/auto-downl'
+    b'oad/status\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x15Get Automation'
+    b' Status\x94\x8c\x0bdescription\x94\x8c/Get current automation c'
+    b'onfiguration and status\x94\x8c\x04tags\x94]\x94\x8c\nAutomation\x94a\x8c'
+    b'\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x1bAutomation'
+    b' status retrieved\x94\x8c\x07content\x94}\x94\x8c\x10application/json'
+    b'\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c-#/components/schemas/Auto'
+    b'mationStatusResponse\x94sssusus\x8c\x1a/api/auto-download'
+    b'/trigger\x94}\x94\x8c\x03get\x94}\x94(\x8c\x07summary\x94\x8c\x1aTrigger Automate'
+    b'd Download\x94\x8c\x0bdescription\x94\x8c/Manually trigger the '
+    b'automated download process\x94\x8c\x04tags\x94]\x94\x8c\nAutomation'
+    b'\x94a\x8c\tresponses\x94}\x94\x8c\x03200\x94}\x94(\x8c\x0bdescription\x94\x8c\x1cAutomat'
+    b'ed download triggered\x94\x8c\x07content\x94}\x94\x8c\x10application/'
+    b'json\x94}\x94\x8c\x06schema\x94}\x94\x8c\x04$ref\x94\x8c.#/components/schemas/'
+    b'AutomationTriggerResponse\x94sssususu\x8c\ncomponents\x94}'
+    b'\x94\x8c\x07schemas\x94}\x94(\x8c\x0eHealthResponse\x94}\x94(\x8c\x04type\x94\x8c\x06objec'
+    b't\x94\x8c\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s'
+    b'\x8c\x04data\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x06stat'
+    b'us\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x04enum\x94]\x94(\x8c\x07healthy\x94\x8c\tunhe'
+    b'althy\x94eu\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94'
+    b'\x8c\tdate-time\x94u\x8c\x06config\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nprope'
+    b'rties\x94}\x94(\x8c\x13api_keys_configured\x94}\x94\x8c\x04type\x94\x8c\x07boolea'
+    b'n\x94s\x8c\x15auto_download_enabled\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c'
+    b'\x0bserver_host\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x0bserver_port\x94}\x94'
+    b'\x8c\x04type\x94\x8c\x07integer\x94suuuu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06strin'
+    b'g\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdat'
+    b'e-time\x94uuu\x8c\x11StockDataResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object'
+    b'\x94\x8c\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c'
+    b'\x04data\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x06symbo'
+    b'l\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x05dates\x94}\x94(\x8c\x04type\x94\x8c\x05array\x94\x8c'
+    b'\x05items\x94}\x94\x8c\x04type\x94\x8c\x06string\x94su\x8c\x06prices\x94}\x94(\x8c\x04type\x94\x8c\x05'
+    b'array\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x06number\x94su\x8c\x07volumes\x94}\x94(\x8c'
+    b'\x04type\x94\x8c\x05array\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94su\x8c\x07cur'
+    b'rent\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x05price\x94'
+    b'}\x94\x8c\x04type\x94\x8c\x06number\x94s\x8c\x06change\x94}\x94\x8c\x04type\x94\x8c\x06number\x94s\x8c'
+    b'\x0echange_percent\x94}\x94\x8c\x04type\x94\x8c\x06number\x94suu\x8c\x06errors\x94}\x94'
+    b'(\x8c\x04type\x94\x8c\x05array\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x06string\x94su\x8c\x08me'
+    b'ssages\x94}\x94\x8c\x04type\x94\x8c\x06object\x94s\x8c\x0bgranularity\x94}\x94\x8c\x04type'
+    b'\x94\x8c\x06string\x94suu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttime'
+    b'stamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uu'
+    b'u\x8c\x16ComparisonDataResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\np'
+    b'roperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04dat'
+    b'a\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\x14additionalProperties\x94}\x94\x8c\x04'
+    b'$ref\x94\x8c&#/components/schemas/StockDataResponse\x94su'
+    b'\x8c\x06errors\x94}\x94(\x8c\x04type\x94\x8c\x05array\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x06st'
+    b'ring\x94su\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttimestamp\x94'
+    b'}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uuu\x8c\x13Cor'
+    b'relationResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties'
+    b'\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04data\x94}\x94(\x8c\x04ty'
+    b'pe\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x12correlation_matrix'
+    b'\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\x14additionalProperties\x94}\x94(\x8c\x04'
+    b'type\x94\x8c\x06object\x94\x8c\x14additionalProperties\x94}\x94\x8c\x04type\x94\x8c\x06'
+    b'number\x94suu\x8c\x11market_volatility\x94}\x94(\x8c\x04type\x94\x8c\x06object'
+    b'\x94\x8c\x14additionalProperties\x94}\x94\x8c\x04type\x94\x8c\x06number\x94su\x8c\x07sy'
+    b'mbols\x94}\x94(\x8c\x04type\x94\x8c\x05array\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x06strin'
+    b'g\x94su\x8c\ranalysis_date\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94'
+    b'\x8c\tdate-time\x94u\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94suu\x8c\x07me'
+    b'ssage\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c'
+    b'\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uuu\x8c\x14MarketEventsRe'
+    b'sponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07succ'
+    b'ess\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04data\x94}\x94(\x8c\x04type\x94\x8c\x06objec'
+    b't\x94\x8c\nproperties\x94}\x94(\x8c\x06symbol\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\t'
+    b'threshold\x94}\x94\x8c\x04type\x94\x8c\x06number\x94s\x8c\x06events\x94}\x94(\x8c\x04type\x94'
+    b'\x8c\x05array\x94\x8c\x05items\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94'
+    b'}\x94(\x8c\x04date\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x04type\x94}\x94\x8c\x04type\x94\x8c\x06s'
+    b'tring\x94s\x8c\tmagnitude\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x06return\x94}'
+    b'\x94\x8c\x04type\x94\x8c\x06number\x94s\x8c\nprice_from\x94}\x94\x8c\x04type\x94\x8c\x06number'
+    b'\x94s\x8c\x08price_to\x94}\x94\x8c\x04type\x94\x8c\x06number\x94s\x8c\x06volume\x94}\x94\x8c\x04typ'
+    b'e\x94\x8c\x07integer\x94suuu\x8c\x0ctotal_events\x94}\x94\x8c\x04type\x94\x8c\x07intege'
+    b'r\x94s\x8c\ranalysis_date\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c'
+    b'\tdate-time\x94uuu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttim'
+    b'estamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94u'
+    b'uu\x8c\x14DatabaseSaveResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\npr'
+    b'operties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04data'
+    b'\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x06symbol\x94}\x94\x8c'
+    b'\x04type\x94\x8c\x06string\x94s\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\rr'
+    b'ecords_added\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\rtotal_records'
+    b'\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\x07updated\x94}\x94\x8c\x04type\x94\x8c\x07boolea'
+    b'n\x94s\x8c\x08filename\x94}\x94\x8c\x04type\x94\x8c\x06string\x94suu\x8c\x07message\x94}\x94\x8c'
+    b'\x04type\x94\x8c\x06string\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c'
+    b'\x06format\x94\x8c\tdate-time\x94uuu\x8c\x14DatabaseListResponse\x94}\x94'
+    b'(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04t'
+    b'ype\x94\x8c\x07boolean\x94s\x8c\x04data\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nprope'
+    b'rties\x94}\x94(\x8c\tdatabases\x94}\x94(\x8c\x04type\x94\x8c\x05array\x94\x8c\x05items\x94}'
+    b'\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x06symbol\x94}\x94\x8c\x04t'
+    b'ype\x94\x8c\x06string\x94s\x8c\x08filename\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x07re'
+    b'cords\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\x07size_kb\x94}\x94\x8c\x04type\x94\x8c\x06n'
+    b'umber\x94s\x8c\rlast_modified\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\ndat'
+    b'e_range\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x08ear'
+    b'liest\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x06latest\x94}\x94\x8c\x04type\x94\x8c\x06str'
+    b'ing\x94suuuuu\x8c\x0btotal_files\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\x07me'
+    b'ssage\x94}\x94\x8c\x04type\x94\x8c\x06string\x94suu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06'
+    b'string\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94'
+    b'\x8c\tdate-time\x94uuu\x8c\x16DatabaseUpdateResponse\x94}\x94(\x8c\x04typ'
+    b'e\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07'
+    b'boolean\x94s\x8c\x04data\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94'
+    b'}\x94(\x8c\x07results\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\x14additionalProp'
+    b'erties\x94}\x94\x8c\x04$ref\x94\x8c)#/components/schemas/DatabaseS'
+    b'aveResponse\x94su\x8c\x07summary\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\npro'
+    b'perties\x94}\x94(\x8c\x12successful_symbols\x94}\x94\x8c\x04type\x94\x8c\x07integ'
+    b'er\x94s\x8c\rtotal_symbols\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\rtotal_'
+    b'records\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94suu\x8c\x07message\x94}\x94\x8c\x04type'
+    b'\x94\x8c\x06string\x94suu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttime'
+    b'stamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uu'
+    b'u\x8c\x18AutomationStatusResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c'
+    b'\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04d'
+    b'ata\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x06config\x94'
+    b'}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07enabled\x94}\x94\x8c'
+    b'\x04type\x94\x8c\x07boolean\x94s\x8c\x04hour\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\x06mi'
+    b'nute\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94s\x8c\x07symbols\x94}\x94(\x8c\x04type\x94\x8c\x05a'
+    b'rray\x94\x8c\x05items\x94}\x94\x8c\x04type\x94\x8c\x06string\x94su\x8c\x12api_key_confi'
+    b'gured\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94suu\x8c\x08next_run\x94}\x94\x8c\x04type\x94'
+    b'\x8c\x06string\x94suu\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttimes'
+    b'tamp\x94}\x94(\x8c\x04type\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uuu'
+    b'\x8c\x19AutomationTriggerResponse\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c'
+    b'\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x04d'
+    b'ata\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07message'
+    b'\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\x07results\x94}\x94(\x8c\x04type\x94\x8c\x06object'
+    b'\x94\x8c\x14additionalProperties\x94}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\npro'
+    b'perties\x94}\x94(\x8c\x07success\x94}\x94\x8c\x04type\x94\x8c\x07boolean\x94s\x8c\x07recor'
+    b'ds\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94suuu\x8c\x07summary\x94}\x94(\x8c\x04type\x94\x8c\x06'
+    b'object\x94\x8c\nproperties\x94}\x94(\x8c\x12successful_symbols\x94}\x94\x8c\x04'
+    b'type\x94\x8c\x07integer\x94s\x8c\rtotal_symbols\x94}\x94\x8c\x04type\x94\x8c\x07integ'
+    b'er\x94s\x8c\rtotal_records\x94}\x94\x8c\x04type\x94\x8c\x07integer\x94suuuu\x8c\x07me'
+    b'ssage\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04type\x94\x8c'
+    b'\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uuu\x8c\rErrorResponse\x94'
+    b'}\x94(\x8c\x04type\x94\x8c\x06object\x94\x8c\nproperties\x94}\x94(\x8c\x07success\x94}\x94\x8c'
+    b'\x04type\x94\x8c\x07boolean\x94s\x8c\x07message\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\n'
+    b'error_code\x94}\x94\x8c\x04type\x94\x8c\x06string\x94s\x8c\ttimestamp\x94}\x94(\x8c\x04t'
+    b'ype\x94\x8c\x06string\x94\x8c\x06format\x94\x8c\tdate-time\x94uuuus\x8c\x04tags\x94]\x94'
+    b'(}\x94(\x8c\x04name\x94\x8c\x06System\x94\x8c\x0bdescription\x94\x8c"System healt'
+    b'h and status endpoints\x94u}\x94(\x8c\x04name\x94\x8c\nStock Data\x94\x8c'
+    b'\x0bdescription\x94\x8c!Stock data retrieval and analysis'
+    b'\x94u}\x94(\x8c\x04name\x94\x8c\x0fMarket Analysis\x94\x8c\x0bdescription\x94\x8c&Ma'
+    b'rket correlation and event detection\x94u}\x94(\x8c\x04name\x94'
+    b"\x8c\x13Database Management\x94\x8c\x0bdescription\x94\x8c'Database o"
+    b'perations and file management\x94u}\x94(\x8c\x04name\x94\x8c\nAutom'
+    b'ation\x94\x8c\x0bdescription\x94\x8c(Automated data collection '
+    b'and scheduling\x94ueu.'
+)
+
+_SPEC = pickle.loads(_SPEC_PICKLE)
@@ -1,46 +1,57 @@
-import glob
 import os
+import re
 import logging
-from collections import defaultdict
+
+# Leading "<symbol>_<period>_" of an exported CSV filename
+_EXPORT_NAME_PATTERN = re.compile(r'^([^_]+)_([^_]+)_')
 
 
 def cleanup_duplicate_csv_files():
     """Remove duplicate CSV files to prevent storage waste"""
     try:
-        csv_files = glob.glob('data_exports/*.csv')
-        file_groups = defaultdict(list)
+        if not os.path.isdir('data_exports'):
+            return {'deleted': 0, 'kept': 0}
         
-        # Group files by symbol and type
-        for file_path in csv_files:
-            filename = os.path.basename(file_path)
-            parts = filename.split('_')
-            if len(parts) >= 3:
-                symbol = parts[0]
-                period = parts[1] if parts[1] != 'default' else 'daily'
+        # Track the newest file per symbol/period; older files only get a
+        # list once a duplicate actually shows up
+        best = {}
+        extras = {}
+        with os.scandir('data_exports') as entries:
+            for entry in entries:
+                if not entry.name.endswith('.csv') or entry.name.startswith('.'):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                match = _EXPORT_NAME_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                symbol, period = match.groups()
+                if period == 'default':
+                    period = 'daily'
                 key = f"{symbol}_{period}"
-                file_groups[key].append((file_path, os.path.getmtime(file_path)))
+                path = entry.path
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                
+                current = best.get(key)
+                if current is None:
+                    best[key] = (path, mtime)
+                elif mtime > current[1]:
+                    extras.setdefault(key, []).append(current[0])
+                    best[key] = (path, mtime)
+                else:
+                    extras.setdefault(key, []).append(path)
         
         deleted_count = 0
-        kept_count = 0
+        kept_count = len(best)
         
-        # Keep only the newest file for each group
-        for key, files in file_groups.items():
-            if len(files) > 1:
-                # Sort by modification time, keep the newest
-                files.sort(key=lambda x: x[1], reverse=True)
-                newest_file = files[0][0]
-                
-                # Delete older duplicates
-                for file_path, _ in files[1:]:
-                    try:
-                        os.remove(file_path)
-                        deleted_count += 1
-                    except Exception as e:
-                        logging.warning(f"Failed to delete {file_path}: {e}")
-                
-                kept_count += 1
-            elif len(files) == 1:
-                kept_count += 1
+        # Delete older duplicates, keeping the newest file for each group
+        for stale_files in extras.values():
+            for file_path in stale_files:
+                try:
+                    os.remove(file_path)
+                    deleted_count += 1
+                except Exception as e:
+                    logging.warning(f"Failed to delete {file_path}: {e}")
         
         logging.info(f"🧹 Cleanup complete: Deleted {deleted_count} duplicate files, kept {kept_count} unique files")
         return {'deleted': deleted_count, 'kept': kept_count}
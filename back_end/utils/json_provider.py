@@ -0,0 +1,38 @@
+"""
+JSON provider that serializes and parses with orjson when it is installed.
+"""
+
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to Flask's stdlib provider
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; also encodes ``ApiResponse`` payloads."""
+
+    # Key order is left as built, so ApiResponse envelopes keep their field order
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON, delegating to Flask for stdlib-only options."""
+        if orjson is None or set(kwargs) - {'indent', 'separators', 'default'}:
+            return super().dumps(obj, **kwargs)
+
+        # Dates and dataclasses go through Flask's default (HTTP dates, asdict)
+        option = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON from text or UTF-8 bytes."""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -2,15 +2,23 @@
 Logging configuration and utilities for the stock market dashboard.
 """
 
+import copy
+import json
 import logging
 import logging.handlers
 import sys
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from ..config import config
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
@@ -25,38 +33,81 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
     
-    def format(self, record):
-        # Add color to levelname
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of on every record
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{code}{level}{reset}"
+            for level, code in self.COLORS.items() if level != 'RESET'
+        }
+    
+    def formatMessage(self, record):
+        # Color a shallow copy so other handlers still see the plain levelname
+        colored = self._colored_levels.get(record.levelname)
+        if colored is None:
+            return super().formatMessage(record)
         
-        return super().format(record)
+        colored_record = copy.copy(record)
+        colored_record.levelname = colored
+        return super().formatMessage(colored_record)
+
+
+@dataclass
+class _LogEntry:
+    """Fixed-shape part of a structured log record."""
+    timestamp: str
+    level: str
+    logger: str
+    message: str
+    module: str
+    function: str
+    line: int
+
+
+# Field names of a structured log entry, in output order
+_LOG_ENTRY_FIELDS = tuple(field.name for field in fields(_LogEntry))
 
 
 class StructuredFormatter(logging.Formatter):
-    """Structured formatter for JSON-like log output."""
+    """Structured formatter for JSON log output."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._use_orjson = orjson is not None
     
     def format(self, record):
+        values = (
+            datetime.fromtimestamp(record.created).isoformat(),
+            record.levelname,
+            record.name,
+            record.getMessage(),
+            record.module,
+            record.funcName,
+            record.lineno
+        )
+        
+        # Records without exception info or extra fields keep the fixed
+        # shape, which orjson encodes directly from the dataclass
+        extra_fields = getattr(record, 'extra_fields', None)
+        if self._use_orjson and not record.exc_info and extra_fields is None:
+            return orjson.dumps(_LogEntry(*values)).decode('utf-8')
+        
         # Create structured log entry
-        log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno
-        }
+        log_entry = dict(zip(_LOG_ENTRY_FIELDS, values))
         
         # Add exception info if present
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
         
         # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
+        if extra_fields is not None:
+            log_entry.update(extra_fields)
         
-        return str(log_entry)
+        # Non-JSON values (datetimes, exceptions, ...) fall back to str()
+        if self._use_orjson:
+            return orjson.dumps(log_entry, default=str).decode('utf-8')
+        return json.dumps(log_entry, default=str)
 
 
 def setup_logging(
@@ -85,18 +136,14 @@ def setup_logging(
     root_logger.handlers.clear()
     
     # Set root logger level
-    root_logger.setLevel(getattr(logging, level.upper()))
-    
-    # Create formatters
-    console_formatter = ColoredFormatter(log_format)
-    file_formatter = logging.Formatter(log_format)
-    structured_formatter = StructuredFormatter()
+    numeric_level = getattr(logging, level.upper())
+    root_logger.setLevel(numeric_level)
     
     # Console handler
     if console_enabled:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_handler.setFormatter(console_formatter)
+        console_handler.setLevel(numeric_level)
+        console_handler.setFormatter(ColoredFormatter(log_format))
         root_logger.addHandler(console_handler)
     
     # File handler with rotation
@@ -111,8 +158,8 @@ def setup_logging(
             backupCount=backup_count,
             encoding='utf-8'
         )
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(file_formatter)
+        file_handler.setLevel(numeric_level)
+        file_handler.setFormatter(logging.Formatter(log_format))
         root_logger.addHandler(file_handler)
     
     # Set specific logger levels
@@ -145,25 +192,30 @@ def log_function_call(logger: logging.Logger, func_name: str, **kwargs):
     """
     def decorator(func):
         def wrapper(*args, **func_kwargs):
-            # Log function entry
-            logger.debug(f"Entering {func_name}", extra={
-                'extra_fields': {
-                    'function': func_name,
-                    'parameters': {**kwargs, **func_kwargs}
-                }
-            })
+            # Skip building the debug payloads unless they will be emitted
+            debug_on = logger.isEnabledFor(logging.DEBUG)
             
-            try:
-                result = func(*args, **func_kwargs)
-                logger.debug(f"Exiting {func_name} successfully", extra={
+            # Log function entry
+            if debug_on:
+                logger.debug("Entering %s", func_name, extra={
                     'extra_fields': {
                         'function': func_name,
-                        'result_type': type(result).__name__
+                        'parameters': {**kwargs, **func_kwargs}
                     }
                 })
+            
+            try:
+                result = func(*args, **func_kwargs)
+                if debug_on:
+                    logger.debug("Exiting %s successfully", func_name, extra={
+                        'extra_fields': {
+                            'function': func_name,
+                            'result_type': type(result).__name__
+                        }
+                    })
                 return result
             except Exception as e:
-                logger.error(f"Error in {func_name}: {str(e)}", extra={
+                logger.error("Error in %s: %s", func_name, e, extra={
                     'extra_fields': {
                         'function': func_name,
                         'error_type': type(e).__name__
@@ -185,7 +237,9 @@ def log_api_request(logger: logging.Logger, endpoint: str, method: str = 'GET',
         method: HTTP method
         **kwargs: Additional request details
     """
-    logger.info(f"API Request: {method} {endpoint}", extra={
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("API Request: %s %s", method, endpoint, extra={
         'extra_fields': {
             'api_request': {
                 'method': method,
@@ -208,7 +262,9 @@ def log_api_response(logger: logging.Logger, endpoint: str, status_code: int, re
         **kwargs: Additional response details
     """
     level = logging.ERROR if status_code >= 400 else logging.INFO
-    logger.log(level, f"API Response: {status_code} {endpoint} ({response_time:.3f}s)", extra={
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, "API Response: %s %s (%.3fs)", status_code, endpoint, response_time, extra={
         'extra_fields': {
             'api_response': {
                 'endpoint': endpoint,
@@ -231,7 +287,9 @@ def log_data_operation(logger: logging.Logger, operation: str, symbol: str, reco
         records_count: Number of records processed
         **kwargs: Additional operation details
     """
-    logger.info(f"Data {operation}: {symbol} ({records_count} records)", extra={
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("Data %s: %s (%s records)", operation, symbol, records_count, extra={
         'extra_fields': {
             'data_operation': {
                 'operation': operation,
@@ -253,7 +311,9 @@ def log_error(logger: logging.Logger, error: Exception, context: str = "", **kwa
         context: Context where the error occurred
         **kwargs: Additional context information
     """
-    logger.error(f"Error in {context}: {str(error)}", extra={
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    logger.error("Error in %s: %s", context, error, extra={
         'extra_fields': {
             'error_context': context,
             'error_type': type(error).__name__,
@@ -2,12 +2,31 @@
 Response wrapper for consistent API responses.
 """
 
+import logging
+import sys
 import time
 from typing import Any, Dict, Optional, Union
-from flask import jsonify, request
+from flask import Response, current_app, request
 from .exceptions import StockDashboardException
 from .logger import get_logger
 
+# Base payloads copied per response instead of rebuilding the dict from scratch
+_SUCCESS_BASE = {'success': True, 'message': '', 'timestamp': 0.0, 'status_code': 200}
+_ERROR_BASE = {'success': False, 'message': '', 'timestamp': 0.0, 'status_code': 400}
+
+# Media types client errors can be rendered as, in order of preference
+_CLIENT_ERROR_MIMETYPES = ('application/json', 'text/plain')
+
+
+def _prefers_plain_text() -> bool:
+    """Whether the request's Accept header ranks text/plain above JSON."""
+    return request.accept_mimetypes.best_match(_CLIENT_ERROR_MIMETYPES) == 'text/plain'
+
+
+def _json_response(payload: Dict, status_code: int):
+    """Serialize a response payload with the app's JSON provider."""
+    return current_app.json.response(payload), status_code
+
 
 class ApiResponse:
     """Standardized API response wrapper."""
@@ -21,13 +40,12 @@ class ApiResponse:
         **kwargs
     ):
         """Create a successful response."""
-        response = {
-            'success': True,
-            'message': message,
-            'timestamp': time.time(),
-            'status_code': status_code,
-            **kwargs
-        }
+        response = _SUCCESS_BASE.copy()
+        response['message'] = message
+        response['timestamp'] = time.time()
+        response['status_code'] = status_code
+        if kwargs:
+            response.update(kwargs)
         
         if data is not None:
             response['data'] = data
@@ -35,7 +53,7 @@ class ApiResponse:
         if metadata:
             response['metadata'] = metadata
             
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
     
     @staticmethod
     def error(
@@ -47,13 +65,12 @@ class ApiResponse:
         **kwargs
     ):
         """Create an error response."""
-        response = {
-            'success': False,
-            'message': message,
-            'timestamp': time.time(),
-            'status_code': status_code,
-            **kwargs
-        }
+        response = _ERROR_BASE.copy()
+        response['message'] = message
+        response['timestamp'] = time.time()
+        response['status_code'] = status_code
+        if kwargs:
+            response.update(kwargs)
         
         if error_type:
             response['error_type'] = error_type
@@ -64,7 +81,7 @@ class ApiResponse:
         if details:
             response['details'] = details
             
-        return jsonify(response), status_code
+        return _json_response(response, status_code)
     
     @staticmethod
     def from_exception(exception: Exception, status_code: int = 500):
@@ -96,7 +113,7 @@ class ApiResponse:
         """Create a paginated response."""
         total_pages = (total + per_page - 1) // per_page
         
-        metadata = {
+        return _respond_with_metadata(data, {
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -105,14 +122,7 @@ class ApiResponse:
                 'has_next': page < total_pages,
                 'has_prev': page > 1
             }
-        }
-        
-        return ApiResponse.success(
-            data=data,
-            message=message,
-            metadata=metadata,
-            **kwargs
-        )
+        }, message, **kwargs)
     
     @staticmethod
     def list_response(
@@ -122,32 +132,70 @@ class ApiResponse:
         **kwargs
     ):
         """Create a list response with count information."""
-        metadata = {
+        return _respond_with_metadata(data, {
             'count': count if count is not None else len(data)
-        }
-        
-        return ApiResponse.success(
-            data=data,
-            message=message,
-            metadata=metadata,
-            **kwargs
-        )
+        }, message, **kwargs)
+
+
+def _respond_with_metadata(data: list, metadata: Dict, message: str = "", status_code: int = 200, **kwargs):
+    """Build a successful list-style response with metadata in one dict."""
+    response = _SUCCESS_BASE.copy()
+    response['message'] = message
+    response['timestamp'] = time.time()
+    response['status_code'] = status_code
+    if kwargs:
+        response.update(kwargs)
+    response['data'] = data
+    response['metadata'] = metadata
+    return _json_response(response, status_code)
+
+
+def _log_response(logger, endpoint: str, status_code: int, response_time: float, exc: Optional[Exception] = None):
+    """Log the outcome of a handled API request with a single emit call."""
+    if exc is None:
+        level = logging.INFO
+    elif status_code < 500:
+        level = logging.WARNING
+    else:
+        level = logging.ERROR
+    
+    if not logger.isEnabledFor(level):
+        return
+    
+    api_response = {
+        'endpoint': endpoint,
+        'status_code': status_code,
+        'response_time': response_time
+    }
+    
+    if exc is None:
+        logger.log(level, "API Response: %s %s (%.3fs)", status_code, endpoint, response_time,
+                   extra={'extra_fields': {'api_response': api_response}})
+    else:
+        api_response['error_type'] = type(exc).__name__
+        logger.log(level, "API Error: %s %s (%.3fs) - %s", status_code, endpoint, response_time, exc,
+                   extra={'extra_fields': {'api_response': api_response}},
+                   exc_info=exc if level == logging.ERROR else None)
 
 
 def handle_exceptions(func):
     """Decorator to handle exceptions and return consistent responses."""
     def wrapper(*args, **kwargs):
         logger = get_logger(func.__module__)
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        endpoint = request.endpoint if request else 'unknown'
+        if endpoint:
+            # Intern the routed endpoint name so log/extra_fields keys share one object
+            endpoint = sys.intern(endpoint)
         
         try:
-            # Log request
-            if request:
-                logger.info(f"API Request: {request.method} {request.endpoint}", extra={
+            # Log request; skip building the query/path dicts when INFO is off
+            if request and logger.isEnabledFor(logging.INFO):
+                logger.info("API Request: %s %s", request.method, endpoint, extra={
                     'extra_fields': {
                         'api_request': {
                             'method': request.method,
-                            'endpoint': request.endpoint,
+                            'endpoint': endpoint,
                             'args': request.args.to_dict(),
                             'path_params': request.view_args or {}
                         }
@@ -155,48 +203,28 @@ def handle_exceptions(func):
                 })
             
             result = func(*args, **kwargs)
-            
-            # Log successful response
-            response_time = time.time() - start_time
-            logger.info(f"API Response: 200 {request.endpoint if request else 'unknown'} ({response_time:.3f}s)", extra={
-                'extra_fields': {
-                    'api_response': {
-                        'endpoint': request.endpoint if request else 'unknown',
-                        'status_code': 200,
-                        'response_time': response_time
-                    }
-                }
-            })
-            
-            return result
+            status_code = 200
+            error = None
             
         except StockDashboardException as e:
-            response_time = time.time() - start_time
-            logger.warning(f"API Error: 400 {request.endpoint if request else 'unknown'} ({response_time:.3f}s) - {str(e)}", extra={
-                'extra_fields': {
-                    'api_response': {
-                        'endpoint': request.endpoint if request else 'unknown',
-                        'status_code': 400,
-                        'response_time': response_time,
-                        'error_type': type(e).__name__
-                    }
-                }
-            })
-            return ApiResponse.from_exception(e, status_code=400)
+            result = None
+            status_code = 400
+            error = e
             
         except Exception as e:
-            response_time = time.time() - start_time
-            logger.error(f"API Error: 500 {request.endpoint if request else 'unknown'} ({response_time:.3f}s) - {str(e)}", extra={
-                'extra_fields': {
-                    'api_response': {
-                        'endpoint': request.endpoint if request else 'unknown',
-                        'status_code': 500,
-                        'response_time': response_time,
-                        'error_type': type(e).__name__
-                    }
-                }
-            }, exc_info=True)
-            return ApiResponse.from_exception(e, status_code=500)
+            result = None
+            status_code = 500
+            error = e
+        
+        response_time = (time.monotonic_ns() - start_ns) * 1e-9
+        _log_response(logger, endpoint, status_code, response_time, error)
+        
+        if error is not None:
+            # Clients that only want the message can skip the JSON envelope
+            if status_code == 400 and _prefers_plain_text():
+                return Response(str(error), status=status_code, mimetype='text/plain'), status_code
+            return ApiResponse.from_exception(error, status_code=status_code)
+        return result
     
     wrapper.__name__ = func.__name__
-    return wrapper 
\ No newline at end of file
+    return wrapper
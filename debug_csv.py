@@ -3,14 +3,27 @@
 Debug script to test CSV reading functionality.
 """
 
+import csv
+import itertools
 import sys
-import os
-sys.path.append('back_end')
 
 from back_end.models.database import load_from_database_csv
 from back_end.config import config
 
-def test_csv_reading():
+def count_csv_rows(filepath):
+    """Count data rows (excluding the header) by scanning raw bytes in 1MB chunks."""
+    newlines = 0
+    last_chunk = b''
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            newlines += chunk.count(b'\n')
+            last_chunk = chunk
+    # A final line without a trailing newline still counts as a row
+    if last_chunk and not last_chunk.endswith(b'\n'):
+        newlines += 1
+    return max(newlines - 1, 0)
+
+def test_csv_reading(use_pandas=False):
     print("Testing CSV reading...")
     
     # Test the load function
@@ -33,18 +46,33 @@ def test_csv_reading():
             print(f"Example record without date: {missing_date[0]}")
     
     # Check file directly
-    import pandas as pd
     filepath = config.export_dir / "NVDA_database.csv"
-    print(f"\nDirect pandas read of {filepath}:")
     
-    if filepath.exists():
-        df = pd.read_csv(filepath)
-        print(f"Pandas rows: {len(df)}")
+    if not filepath.exists():
+        print(f"File does not exist: {filepath}")
+        return
+    
+    if use_pandas:
+        import pandas as pd
+        print(f"\nDirect pandas read of {filepath}:")
+        df = pd.read_csv(filepath, nrows=3)
+        print(f"Pandas rows: {count_csv_rows(filepath)}")
         print(f"Pandas columns: {list(df.columns)}")
         print(f"First 3 rows:")
         print(df.head(3))
-    else:
-        print(f"File does not exist: {filepath}")
+        return
+    
+    print(f"\nDirect CSV read of {filepath}:")
+    with open(filepath, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = list(itertools.islice(reader, 3))
+    print(f"CSV rows: {count_csv_rows(filepath)}")
+    print(f"CSV columns: {header}")
+    print(f"First 3 rows:")
+    for row in rows:
+        print(row)
 
 if __name__ == "__main__":
-    test_csv_reading() 
\ No newline at end of file
+    # Pass --pandas for a full DataFrame parse instead of the stdlib reader
+    test_csv_reading(use_pandas='--pandas' in sys.argv[1:]) 
\ No newline at end of file
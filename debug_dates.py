@@ -3,9 +3,7 @@
 Debug script to test the date processing issue.
 """
 
-import sys
-import os
-sys.path.append('back_end')
+import pandas as pd
 
 from back_end.models.database import load_from_database_csv
 from back_end.services.stock_service import StockService
@@ -50,7 +48,7 @@ def test_date_processing():
     
     # Test date extraction
     try:
-        dates = [r['date_obj'].strftime('%Y-%m-%d') for r in filtered_records]
+        dates = pd.DatetimeIndex([r['date_obj'] for r in filtered_records]).strftime('%Y-%m-%d').tolist()
         print(f"Dates extracted: {len(dates)}")
         print(f"First 3 dates: {dates[:3]}")
     except Exception as e:
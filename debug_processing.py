@@ -3,9 +3,7 @@
 Debug script to test the data processing pipeline.
 """
 
-import sys
-import os
-sys.path.append('back_end')
+import pandas as pd
 
 from back_end.models.database import load_from_database_csv
 from back_end.services.stock_service import StockService
@@ -33,12 +31,12 @@ def test_processing_pipeline():
         print(f"WARNING: Lost {len(result['data']) - len(processed_records)} records during processing!")
         
         # Check what records were lost
-        original_dates = set(r['date'] for r in result['data'])
-        processed_dates = set(r['date'] for r in processed_records)
-        lost_dates = original_dates - processed_dates
+        original_dates = pd.Index([r['date'] for r in result['data']])
+        processed_dates = pd.Index([r['date'] for r in processed_records])
+        lost_dates = original_dates.difference(processed_dates)
         
-        if lost_dates:
-            print(f"Lost dates (first 5): {list(lost_dates)[:5]}")
+        if len(lost_dates):
+            print(f"Lost dates (first 5): {lost_dates[:5].tolist()}")
     
     # Test filtering for different periods
     periods = ['default', 'week', 'month', 'all']
@@ -50,16 +48,18 @@ def test_processing_pipeline():
         if filtered_records:
             print(f"  Date range: {filtered_records[0]['date']} to {filtered_records[-1]['date']}")
     
-    # Test the full get_stock_data function
+    # Test the full get_stock_data function for every period from one load
     print("\nTesting full get_stock_data function:")
-    for period in ['default', 'week', 'month', 'all']:
-        try:
-            stock_data = service.get_stock_data('NVDA', period)
-            print(f"Period '{period}': {len(stock_data.get('dates', []))} dates, {len(stock_data.get('prices', []))} prices")
-            print(f"  Success: {stock_data.get('success')}")
-            print(f"  Current: {stock_data.get('current') is not None}")
-        except Exception as e:
-            print(f"Period '{period}': Error - {e}")
+    try:
+        batch = service.get_stock_data_batch('NVDA', ['default', 'week', 'month', 'all'])
+    except Exception as e:
+        print(f"Error - {e}")
+        return
+    
+    for period, stock_data in batch.items():
+        print(f"Period '{period}': {len(stock_data.get('dates', []))} dates, {len(stock_data.get('prices', []))} prices")
+        print(f"  Success: {stock_data.get('success')}")
+        print(f"  Current: {stock_data.get('current') is not None}")
 
 if __name__ == "__main__":
     test_processing_pipeline() 
\ No newline at end of file
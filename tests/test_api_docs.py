@@ -0,0 +1,75 @@
+"""
+Tests for API documentation utilities.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from back_end.utils.api_docs import (
+    get_openapi_spec,
+    get_openapi_spec_json,
+    generate_markdown_docs,
+    get_api_summary
+)
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+    _loads = json.loads
+
+GEN_API_DOCS = Path(__file__).resolve().parent.parent / 'tools' / 'gen_api_docs.py'
+
+
+def _load_gen_api_docs():
+    """Load tools/gen_api_docs.py without putting tools/ on sys.path."""
+    pytest.importorskip('yaml')
+    spec = importlib.util.spec_from_file_location('gen_api_docs', GEN_API_DOCS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestOpenApiSpec:
+    """Test the generated OpenAPI specification."""
+    
+    def test_generated_module_matches_yaml(self):
+        """Test that api_docs_generated.py is in sync with api_spec.yaml."""
+        gen_api_docs = _load_gen_api_docs()
+        
+        expected = gen_api_docs.render_module(gen_api_docs.load_spec())
+        current = gen_api_docs.GENERATED_MODULE.read_text(encoding='utf-8')
+        
+        assert current == expected, "Run python tools/gen_api_docs.py to regenerate"
+    
+    def test_spec_structure(self):
+        """Test the specification exposes the expected top-level sections."""
+        spec = get_openapi_spec()
+        
+        assert spec['openapi'] == '3.0.3'
+        assert '/api/health' in spec['paths']
+        assert 'ErrorResponse' in spec['components']['schemas']
+        assert [tag['name'] for tag in spec['tags']][0] == 'System'
+    
+    def test_spec_json_round_trip(self):
+        """Test the pre-serialized JSON decodes back to the specification."""
+        assert _loads(get_openapi_spec_json()) == get_openapi_spec()
+    
+    def test_markdown_and_summary(self):
+        """Test markdown docs and summary are built from the specification."""
+        spec = get_openapi_spec()
+        
+        assert spec['servers'][0]['url'] in generate_markdown_docs()
+        summary = get_api_summary()
+        assert summary['total_endpoints'] == len(spec['paths'])
+        assert summary['tags']['Database Management'] == 3
+        assert sum(summary['tags'].values()) == len(summary['endpoints'])
+    
+    def test_results_are_cached(self):
+        """Test repeated calls return the same cached objects."""
+        assert get_openapi_spec() is get_openapi_spec()
+        assert get_openapi_spec_json() is get_openapi_spec_json()
+        assert generate_markdown_docs() is generate_markdown_docs()
+        assert get_api_summary() is get_api_summary()
@@ -3,355 +3,369 @@ Tests for API routes.
 """
 
 import pytest
-import json
-from unittest.mock import Mock, patch, MagicMock
-from back_end.app import create_app
-from back_end.utils.exceptions import DataFetchException, DatabaseException
+from unittest.mock import MagicMock
+from back_end.utils.exceptions import DataFetchException
+
+
+# Canned service responses, built once at import time
+_STOCK_DATA_AAPL = {
+    'success': True,
+    'symbol': 'AAPL',
+    'dates': ['2023-01-01', '2023-01-02'],
+    'prices': [150.0, 155.0],
+    'volumes': [1000, 1100],
+    'current': {'price': 155.0, 'change': 5.0},
+    'errors': [],
+    'messages': {'historical': 'Data loaded', 'current': 'From database'},
+    'granularity': 'daily'
+}
+
+_COMPARISON_DATA = {
+    'success': True,
+    'data': {
+        'AAPL': {
+            'success': True,
+            'dates': ['2023-01-01'],
+            'prices': [150.0],
+            'current': {'price': 150.0}
+        },
+        'MSFT': {
+            'success': True,
+            'dates': ['2023-01-01'],
+            'prices': [300.0],
+            'current': {'price': 300.0}
+        }
+    },
+    'errors': []
+}
+
+_SAVE_TO_DATABASE = {
+    'success': True,
+    'symbol': 'AAPL',
+    'message': 'Database updated successfully',
+    'records_added': 10,
+    'total_records': 100,
+    'updated': True,
+    'filename': 'AAPL_database.csv'
+}
+
+_CORRELATION_DATA = {
+    'success': True,
+    'correlation_matrix': {
+        'AAPL': {'AAPL': 1.0, 'MSFT': 0.8},
+        'MSFT': {'AAPL': 0.8, 'MSFT': 1.0}
+    },
+    'market_volatility': {'AAPL': 0.2, 'MSFT': 0.18},
+    'symbols': ['AAPL', 'MSFT'],
+    'analysis_date': '2023-01-01 12:00:00',
+    'message': 'Correlation analysis complete'
+}
+
+_MARKET_EVENTS = {
+    'success': True,
+    'symbol': 'AAPL',
+    'threshold': 5.0,
+    'events': [
+        {
+            'date': '2023-01-02',
+            'type': 'Large Move Up',
+            'magnitude': 'Significant',
+            'return': 10.0,
+            'price_from': 100.0,
+            'price_to': 110.0,
+            'volume': 1000
+        }
+    ],
+    'total_events': 1,
+    'analysis_date': '2023-01-01 12:00:00'
+}
+
+_CSV_FILES = {
+    'success': True,
+    'files': [
+        {
+            'filename': 'test1.csv',
+            'size': 1024,
+            'created': '2023-01-01T00:00:00',
+            'modified': '2023-01-01T00:00:00'
+        }
+    ],
+    'count': 1
+}
+
+_DB_FILES = {
+    'success': True,
+    'databases': [
+        {
+            'symbol': 'AAPL',
+            'filename': 'AAPL_database.csv',
+            'records': 100,
+            'size_kb': 10.5,
+            'last_modified': 1234567890,
+            'date_range': {
+                'earliest': '2023-01-01',
+                'latest': '2023-12-31'
+            }
+        }
+    ],
+    'total_files': 1,
+    'message': 'Found 1 database files'
+}
+
+_UPDATE_ALL = {
+    'success': True,
+    'results': {
+        'AAPL': {
+            'success': True,
+            'message': 'Updated successfully',
+            'records_added': 10,
+            'total_records': 100,
+            'updated': True
+        }
+    },
+    'summary': {
+        'successful_symbols': 1,
+        'total_symbols': 1,
+        'total_records': 100
+    },
+    'message': 'Updated 1/1 databases'
+}
+
+_AUTOMATION_STATUS = {
+    'success': True,
+    'config': {
+        'enabled': True,
+        'hour': 18,
+        'minute': 0,
+        'symbols': ['AAPL'],
+        'api_key_configured': True
+    },
+    'next_run': '18:00 daily'
+}
+
+_AUTOMATION_TRIGGER = {
+    'success': True,
+    'message': 'Download triggered successfully',
+    'results': {
+        'AAPL': {'success': True, 'records': 10}
+    },
+    'summary': {
+        'successful_symbols': 1,
+        'total_symbols': 1,
+        'total_records': 10
+    }
+}
+
+
+def _lookup(payload, path):
+    """Walk a dotted key path such as ``"data.summary.total_symbols"``."""
+    for key in path.split('.'):
+        payload = payload[key]
+    return payload
+
+
+def _assert_payload(data, expected, required=()):
+    """Check a successful response envelope against dotted-path expectations."""
+    assert data['success'] is True
+    for path in required:
+        _lookup(data, path)
+    for path, value in expected:
+        assert _lookup(data, path) == value
+
+
+# Expected shape of the health check response
+_HEALTH_REQUIRED = ('data.status', 'data.config')
+_HEALTH_EXPECTED = (('data.status', 'healthy'),)
 
 
 class TestHealthRoutes:
     """Test health check routes."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-    
-    def test_health_check_success(self):
+    def test_health_check_success(self, client):
         """Test successful health check."""
-        response = self.client.get('/api/health')
+        response = client.get('/api/health')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert 'status' in data['data']
-        assert 'config' in data['data']
-        assert data['data']['status'] == 'healthy'
+        _assert_payload(response.get_json(), _HEALTH_EXPECTED, required=_HEALTH_REQUIRED)
+
+
+def _patched_service(patch_target):
+    """Patch ``patch_target`` with one MagicMock until the generator is closed."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        mock_service = MagicMock()
+        monkeypatch.setattr(patch_target, mock_service)
+        yield mock_service
+
+
+@pytest.fixture(scope="class")
+def stock_service():
+    """Stock service mock shared by a test class."""
+    yield from _patched_service('back_end.api.stock_routes.stock_service')
+
+
+@pytest.fixture(scope="class")
+def market_service():
+    """Market service mock shared by a test class."""
+    yield from _patched_service('back_end.api.market_routes.market_service')
+
+
+@pytest.fixture(scope="class")
+def database_service():
+    """Database service mock shared by a test class."""
+    yield from _patched_service('back_end.api.database_routes.database_service')
+
+
+@pytest.fixture(scope="class")
+def automation_service():
+    """Automation service mock shared by a test class."""
+    yield from _patched_service('back_end.api.automation_routes.automation_service')
+
+
+def _assert_service_route(client, mock_service, endpoint, mock_attr, payload, expected):
+    """Serve ``payload`` from a mocked service method and check the JSON response."""
+    # The mock is shared by the class, so drop state left by earlier tests
+    mock_service.reset_mock(return_value=True, side_effect=True)
+    getattr(mock_service, mock_attr).return_value = payload
+    
+    response = client.get(endpoint)
+    
+    assert response.status_code == 200
+    _assert_payload(response.get_json(), expected)
 
 
 class TestStockRoutes:
     """Test stock data routes."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-    
-    @patch('back_end.api.stock_routes.stock_service')
-    def test_get_stock_data_success(self, mock_service):
-        """Test successful stock data retrieval."""
-        # Mock the service response
-        mock_service.get_stock_data.return_value = {
-            'success': True,
-            'symbol': 'AAPL',
-            'dates': ['2023-01-01', '2023-01-02'],
-            'prices': [150.0, 155.0],
-            'volumes': [1000, 1100],
-            'current': {'price': 155.0, 'change': 5.0},
-            'errors': [],
-            'messages': {'historical': 'Data loaded', 'current': 'From database'},
-            'granularity': 'daily'
-        }
-        
-        response = self.client.get('/api/stock_data/AAPL?period=default')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['symbol'] == 'AAPL'
-        assert len(data['data']['dates']) == 2
-        assert len(data['data']['prices']) == 2
+    @pytest.mark.parametrize("endpoint, mock_attr, payload, expected", [
+        ('/api/stock_data/AAPL?period=default', 'get_stock_data', _STOCK_DATA_AAPL, [
+            ('data.symbol', 'AAPL'),
+            ('data.dates', ['2023-01-01', '2023-01-02']),
+            ('data.prices', [150.0, 155.0])
+        ]),
+        ('/api/comparison_data?symbols=AAPL,MSFT', 'get_comparison_data', _COMPARISON_DATA, [
+            ('data.data.AAPL.prices', [150.0]),
+            ('data.data.MSFT.prices', [300.0])
+        ]),
+        ('/api/database/save/AAPL', 'save_to_database', _SAVE_TO_DATABASE, [
+            ('data.symbol', 'AAPL'),
+            ('data.records_added', 10)
+        ])
+    ], ids=['stock_data', 'comparison_data', 'save_to_database'])
+    def test_stock_route_success(self, client, stock_service, endpoint, mock_attr, payload, expected):
+        """Test successful stock data routes."""
+        _assert_service_route(
+            client, stock_service, endpoint, mock_attr, payload, expected
+        )
     
-    @patch('back_end.api.stock_routes.stock_service')
-    def test_get_stock_data_service_error(self, mock_service):
+    def test_get_stock_data_service_error(self, client, stock_service):
         """Test stock data retrieval with service error."""
         # Mock the service to raise an exception
-        mock_service.get_stock_data.side_effect = DataFetchException("API error")
+        stock_service.reset_mock(return_value=True, side_effect=True)
+        stock_service.get_stock_data.side_effect = DataFetchException("API error")
         
-        response = self.client.get('/api/stock_data/AAPL')
+        response = client.get('/api/stock_data/AAPL')
         
+        # Only flags and substrings are checked, so match the raw body
         assert response.status_code == 400
-        data = json.loads(response.data)
-        
-        assert data['success'] is False
-        assert 'API error' in data['message']
+        assert b'"success":false' in response.data or b'"success": false' in response.data
+        assert b'API error' in response.data
     
-    @patch('back_end.api.stock_routes.stock_service')
-    def test_comparison_data_success(self, mock_service):
-        """Test successful comparison data retrieval."""
-        # Mock the service response
-        mock_service.get_comparison_data.return_value = {
-            'success': True,
-            'data': {
-                'AAPL': {
-                    'success': True,
-                    'dates': ['2023-01-01'],
-                    'prices': [150.0],
-                    'current': {'price': 150.0}
-                },
-                'MSFT': {
-                    'success': True,
-                    'dates': ['2023-01-01'],
-                    'prices': [300.0],
-                    'current': {'price': 300.0}
-                }
-            },
-            'errors': []
-        }
-        
-        response = self.client.get('/api/comparison_data?symbols=AAPL,MSFT')
+    def test_get_stock_data_service_error_plain_text(self, client, stock_service):
+        """Test stock data errors are served as plain text when the client asks for it."""
+        stock_service.reset_mock(return_value=True, side_effect=True)
+        stock_service.get_stock_data.side_effect = DataFetchException("API error")
         
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        response = client.get('/api/stock_data/AAPL', headers={'Accept': 'text/plain'})
         
-        assert data['success'] is True
-        assert 'AAPL' in data['data']['data']
-        assert 'MSFT' in data['data']['data']
-    
-    @patch('back_end.api.stock_routes.stock_service')
-    def test_save_to_database_success(self, mock_service):
-        """Test successful database save."""
-        # Mock the service response
-        mock_service.save_to_database.return_value = {
-            'success': True,
-            'symbol': 'AAPL',
-            'message': 'Database updated successfully',
-            'records_added': 10,
-            'total_records': 100,
-            'updated': True,
-            'filename': 'AAPL_database.csv'
-        }
-        
-        response = self.client.get('/api/database/save/AAPL')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['symbol'] == 'AAPL'
-        assert data['data']['records_added'] == 10
+        assert response.status_code == 400
+        assert response.mimetype == 'text/plain'
+        assert response.data == b'API error'
 
 
 class TestMarketRoutes:
     """Test market analysis routes."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-    
-    @patch('back_end.api.market_routes.market_service')
-    def test_market_correlation_success(self, mock_service):
-        """Test successful market correlation analysis."""
-        # Mock the service response
-        mock_service.get_market_correlation.return_value = {
-            'success': True,
-            'correlation_matrix': {
-                'AAPL': {'AAPL': 1.0, 'MSFT': 0.8},
-                'MSFT': {'AAPL': 0.8, 'MSFT': 1.0}
-            },
-            'market_volatility': {'AAPL': 0.2, 'MSFT': 0.18},
-            'symbols': ['AAPL', 'MSFT'],
-            'analysis_date': '2023-01-01 12:00:00',
-            'message': 'Correlation analysis complete'
-        }
-        
-        response = self.client.get('/api/market/correlation?symbols=AAPL,MSFT')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert 'correlation_matrix' in data['data']
-        assert 'market_volatility' in data['data']
-    
-    @patch('back_end.api.market_routes.market_service')
-    def test_market_events_success(self, mock_service):
-        """Test successful market events detection."""
-        # Mock the service response
-        mock_service.get_market_events.return_value = {
-            'success': True,
-            'symbol': 'AAPL',
-            'threshold': 5.0,
-            'events': [
-                {
-                    'date': '2023-01-02',
-                    'type': 'Large Move Up',
-                    'magnitude': 'Significant',
-                    'return': 10.0,
-                    'price_from': 100.0,
-                    'price_to': 110.0,
-                    'volume': 1000
-                }
-            ],
-            'total_events': 1,
-            'analysis_date': '2023-01-01 12:00:00'
-        }
-        
-        response = self.client.get('/api/market/events?symbol=AAPL&threshold=0.05')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['symbol'] == 'AAPL'
-        assert len(data['data']['events']) == 1
+    @pytest.mark.parametrize("endpoint, mock_attr, payload, expected", [
+        ('/api/market/correlation?symbols=AAPL,MSFT', 'get_market_correlation', _CORRELATION_DATA, [
+            ('data.correlation_matrix', _CORRELATION_DATA['correlation_matrix']),
+            ('data.market_volatility', _CORRELATION_DATA['market_volatility'])
+        ]),
+        ('/api/market/events?symbol=AAPL&threshold=0.05', 'get_market_events', _MARKET_EVENTS, [
+            ('data.symbol', 'AAPL'),
+            ('data.total_events', 1),
+            ('data.events', _MARKET_EVENTS['events'])
+        ])
+    ], ids=['correlation', 'events'])
+    def test_market_route_success(self, client, market_service, endpoint, mock_attr, payload, expected):
+        """Test successful market analysis routes."""
+        _assert_service_route(
+            client, market_service, endpoint, mock_attr, payload, expected
+        )
 
 
 class TestDatabaseRoutes:
     """Test database management routes."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = self.app.test_client()
-    
-    @patch('back_end.api.database_routes.database_service')
-    def test_list_csv_files_success(self, mock_service):
-        """Test successful CSV file listing."""
-        # Mock the service response
-        mock_service.list_csv_files.return_value = {
-            'success': True,
-            'files': [
-                {
-                    'filename': 'test1.csv',
-                    'size': 1024,
-                    'created': '2023-01-01T00:00:00',
-                    'modified': '2023-01-01T00:00:00'
-                }
-            ],
-            'count': 1
-        }
-        
-        response = self.client.get('/api/csv/list')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['count'] == 1
-        assert len(data['data']['files']) == 1
-    
-    @patch('back_end.api.database_routes.database_service')
-    def test_list_database_files_success(self, mock_service):
-        """Test successful database file listing."""
-        # Mock the service response
-        mock_service.list_database_files.return_value = {
-            'success': True,
-            'databases': [
-                {
-                    'symbol': 'AAPL',
-                    'filename': 'AAPL_database.csv',
-                    'records': 100,
-                    'size_kb': 10.5,
-                    'last_modified': 1234567890,
-                    'date_range': {
-                        'earliest': '2023-01-01',
-                        'latest': '2023-12-31'
-                    }
-                }
-            ],
-            'total_files': 1,
-            'message': 'Found 1 database files'
-        }
-        
-        response = self.client.get('/api/database/list')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['total_files'] == 1
-        assert len(data['data']['databases']) == 1
-    
-    @patch('back_end.api.database_routes.database_service')
-    def test_update_all_databases_success(self, mock_service):
-        """Test successful database update."""
-        # Mock the service response
-        mock_service.update_all_databases.return_value = {
-            'success': True,
-            'results': {
-                'AAPL': {
-                    'success': True,
-                    'message': 'Updated successfully',
-                    'records_added': 10,
-                    'total_records': 100,
-                    'updated': True
-                }
-            },
-            'summary': {
-                'successful_symbols': 1,
-                'total_symbols': 1,
-                'total_records': 100
-            },
-            'message': 'Updated 1/1 databases'
-        }
-        
-        response = self.client.get('/api/database/update-all')
-        
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        
-        assert data['success'] is True
-        assert data['data']['summary']['successful_symbols'] == 1
+    @pytest.mark.parametrize("endpoint, mock_attr, payload, expected", [
+        ('/api/csv/list', 'list_csv_files', _CSV_FILES, [
+            ('data.count', 1),
+            ('data.files', _CSV_FILES['files'])
+        ]),
+        ('/api/database/list', 'list_database_files', _DB_FILES, [
+            ('data.total_files', 1),
+            ('data.databases', _DB_FILES['databases'])
+        ]),
+        ('/api/database/update-all', 'update_all_databases', _UPDATE_ALL, [
+            ('data.summary.successful_symbols', 1)
+        ])
+    ], ids=['csv_list', 'database_list', 'update_all'])
+    def test_database_route_success(self, client, database_service, endpoint, mock_attr, payload, expected):
+        """Test successful database management routes."""
+        _assert_service_route(
+            client, database_service, endpoint, mock_attr, payload, expected
+        )
 
 
 class TestAutomationRoutes:
     """Test automation routes."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = create_app()
-        self.client = self.app.test_client()
+    @pytest.mark.parametrize("endpoint, mock_attr, payload, expected", [
+        ('/api/auto-download/status', 'get_automation_status', _AUTOMATION_STATUS, [
+            ('data.config.enabled', True),
+            ('data.config.hour', 18)
+        ]),
+        ('/api/auto-download/trigger', 'trigger_automated_download', _AUTOMATION_TRIGGER, [
+            ('data.summary.successful_symbols', 1)
+        ])
+    ], ids=['status', 'trigger'])
+    def test_automation_route_success(self, client, automation_service, endpoint, mock_attr, payload, expected):
+        """Test successful automation routes."""
+        _assert_service_route(
+            client, automation_service, endpoint, mock_attr, payload, expected
+        )
+
+
+class TestDocsRoutes:
+    """Test API documentation routes."""
     
-    @patch('back_end.api.automation_routes.automation_service')
-    def test_automation_status_success(self, mock_service):
-        """Test successful automation status retrieval."""
-        # Mock the service response
-        mock_service.get_automation_status.return_value = {
-            'success': True,
-            'config': {
-                'enabled': True,
-                'hour': 18,
-                'minute': 0,
-                'symbols': ['AAPL'],
-                'api_key_configured': True
-            },
-            'next_run': '18:00 daily'
-        }
-        
-        response = self.client.get('/api/auto-download/status')
+    def test_openapi_spec_success(self, client):
+        """Test serving the OpenAPI specification."""
+        response = client.get('/api/docs/openapi.json')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        assert response.mimetype == 'application/json'
+        data = response.get_json()
         
-        assert data['success'] is True
-        assert data['data']['config']['enabled'] is True
-        assert data['data']['config']['hour'] == 18
+        assert data['openapi'] == '3.0.3'
+        assert '/api/health' in data['paths']
     
-    @patch('back_end.api.automation_routes.automation_service')
-    def test_trigger_automated_download_success(self, mock_service):
-        """Test successful automated download triggering."""
-        # Mock the service response
-        mock_service.trigger_automated_download.return_value = {
-            'success': True,
-            'message': 'Download triggered successfully',
-            'results': {
-                'AAPL': {'success': True, 'records': 10}
-            },
-            'summary': {
-                'successful_symbols': 1,
-                'total_symbols': 1,
-                'total_records': 10
-            }
-        }
-        
-        response = self.client.get('/api/auto-download/trigger')
+    def test_openapi_spec_not_modified(self, client):
+        """Test revalidating the OpenAPI specification with its ETag."""
+        first = client.get('/api/docs/openapi.json')
+        etag = first.headers['ETag']
         
-        assert response.status_code == 200
-        data = json.loads(response.data)
+        response = client.get('/api/docs/openapi.json', headers={'If-None-Match': etag})
         
-        assert data['success'] is True
-        assert data['data']['summary']['successful_symbols'] == 1 
\ No newline at end of file
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
@@ -0,0 +1,38 @@
+"""
+Tests for the application factory.
+"""
+
+from back_end.app import app as flask_app, create_app
+
+
+class TestCreateApp:
+    """Test the application factory."""
+    
+    def test_startup_runs_once(self, app, monkeypatch):
+        """Test startup work runs on the first regular call only, even after a testing call."""
+        calls = []
+        monkeypatch.setattr('back_end.app._started', False)
+        monkeypatch.setattr('back_end.app.cleanup_duplicate_csv_files',
+                            lambda: calls.append('cleanup') or {'deleted': 0})
+        monkeypatch.setattr('back_end.app.setup_scheduler', lambda: calls.append('scheduler'))
+        monkeypatch.setattr('back_end.app.config.scheduling.auto_download_enabled', True)
+        
+        assert create_app(testing=True) is flask_app
+        assert calls == []
+        
+        assert create_app() is flask_app
+        assert create_app(False) is flask_app
+        assert create_app(testing=False) is flask_app
+        assert calls == ['cleanup', 'scheduler']
+    
+    def test_testing_mode(self, app):
+        """Test the session app runs in TESTING mode."""
+        assert app.config['TESTING'] is True
+    
+    def test_testing_call_leaves_config_alone(self, app, monkeypatch):
+        """Test a testing-mode call does not change the app's configuration."""
+        monkeypatch.setitem(flask_app.config, 'TESTING', False)
+        
+        create_app(testing=True)
+        
+        assert flask_app.config['TESTING'] is False
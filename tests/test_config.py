@@ -4,215 +4,269 @@ Tests for configuration management.
 
 import os
 import pytest
-from unittest.mock import patch
-from back_end.config import Config, APIConfig, ServerConfig, SchedulingConfig, LoggingConfig
+from functools import lru_cache
+from back_end.config import EXPORT_DIR, Config, APIConfig, ServerConfig, SchedulingConfig, LoggingConfig
+
+
+# Every environment variable read by the config sections
+_CONFIG_ENV_VARS = (
+    'FINNHUB_API_KEY', 'ALPHA_VANTAGE_API_KEY', 'API_TIMEOUT_SECONDS',
+    'API_QUICK_TIMEOUT_SECONDS', 'HISTORICAL_DATA_LIMIT',
+    'FLASK_HOST', 'FLASK_PORT', 'FLASK_DEBUG',
+    'DAILY_UPDATE_HOUR', 'DAILY_UPDATE_MINUTE', 'AUTO_DOWNLOAD_ENABLED',
+    'LOG_LEVEL', 'LOG_FORMAT', 'LOG_FILE_ENABLED', 'LOG_FILE_PATH', 'LOG_CONSOLE_ENABLED'
+)
+
+
+def _set_env(monkeypatch, values=None):
+    """Unset every config variable, then set ``values`` through ``monkeypatch``."""
+    for name in _CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in (values or {}).items():
+        monkeypatch.setenv(name, value)
+
+
+@lru_cache(maxsize=None)
+def _default_config(config_cls):
+    """Build a config section from an empty environment, once per section class."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _set_env(monkeypatch)
+        return config_cls.from_env()
+
+
+# Logging section with an invalid level, which validation resets
+_INVALID_LOGGING_KWARGS = dict(
+    level='INVALID_LEVEL',
+    format='test format',
+    file_enabled=True,
+    file_path=None,
+    console_enabled=True
+)
+
+# (section class, constructor kwargs, expected warning fragments) per section
+_VALIDATION_CASES = (
+    (APIConfig, dict(
+        finnhub_api_key=None,
+        alpha_vantage_api_key=None,
+        timeout=3,  # Very low timeout
+        quick_timeout=10,
+        historical_data_limit=121
+    ), [
+        "FINNHUB_API_KEY not configured",
+        "ALPHA_VANTAGE_API_KEY not configured",
+        "API_TIMEOUT_SECONDS (3) is very low"
+    ]),
+    (ServerConfig, dict(
+        host='0.0.0.0',
+        port=99999,  # Invalid port
+        debug=True
+    ), [
+        "FLASK_PORT (99999) is outside recommended range",
+        "Debug mode enabled with host 0.0.0.0"
+    ]),
+    (SchedulingConfig, dict(
+        daily_update_hour=25,  # Invalid hour
+        daily_update_minute=70,  # Invalid minute
+        auto_download_enabled=True,
+        auto_download_symbols=[]
+    ), [
+        "DAILY_UPDATE_HOUR (25) must be between 0-23",
+        "DAILY_UPDATE_MINUTE (70) must be between 0-59",
+        "No auto-download symbols configured"
+    ]),
+    (LoggingConfig, _INVALID_LOGGING_KWARGS, [
+        "LOG_LEVEL (INVALID_LEVEL) is not valid"
+    ])
+)
 
 
 class TestAPIConfig:
     """Test API configuration."""
     
-    def test_api_config_from_env(self):
+    def test_api_config_from_env(self, monkeypatch):
         """Test creating API config from environment variables."""
-        with patch.dict(os.environ, {
+        _set_env(monkeypatch, {
             'FINNHUB_API_KEY': 'test_finnhub_key',
             'ALPHA_VANTAGE_API_KEY': 'test_alpha_key',
             'API_TIMEOUT_SECONDS': '20',
             'API_QUICK_TIMEOUT_SECONDS': '5',
             'HISTORICAL_DATA_LIMIT': '200'
-        }):
-            config = APIConfig.from_env()
-            
-            assert config.finnhub_api_key == 'test_finnhub_key'
-            assert config.alpha_vantage_api_key == 'test_alpha_key'
-            assert config.timeout == 20
-            assert config.quick_timeout == 5
-            assert config.historical_data_limit == 200
+        })
+        
+        config = APIConfig.from_env()
+        
+        assert config.finnhub_api_key == 'test_finnhub_key'
+        assert config.alpha_vantage_api_key == 'test_alpha_key'
+        assert config.timeout == 20
+        assert config.quick_timeout == 5
+        assert config.historical_data_limit == 200
     
     def test_api_config_defaults(self):
         """Test API config with default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = APIConfig.from_env()
-            
-            assert config.finnhub_api_key is None
-            assert config.alpha_vantage_api_key is None
-            assert config.timeout == 15
-            assert config.quick_timeout == 10
-            assert config.historical_data_limit == 121
+        config = _default_config(APIConfig)
+        
+        assert config.finnhub_api_key is None
+        assert config.alpha_vantage_api_key is None
+        assert config.timeout == 15
+        assert config.quick_timeout == 10
+        assert config.historical_data_limit == 121
     
-    def test_api_config_validation(self):
-        """Test API config validation."""
-        config = APIConfig(
-            finnhub_api_key=None,
-            alpha_vantage_api_key=None,
-            timeout=3,  # Very low timeout
-            quick_timeout=10,
-            historical_data_limit=121
-        )
+    def test_api_config_from_env_is_memoized(self, monkeypatch):
+        """Test repeated parsing returns fresh instances that track the environment."""
+        _set_env(monkeypatch, {'API_TIMEOUT_SECONDS': '30'})
+        first = APIConfig.from_env()
+        second = APIConfig.from_env()
         
-        warnings = config.validate()
+        assert first == second
+        assert first is not second
         
-        assert len(warnings) == 3
-        assert "FINNHUB_API_KEY not configured" in warnings[0]
-        assert "ALPHA_VANTAGE_API_KEY not configured" in warnings[1]
-        assert "API_TIMEOUT_SECONDS (3) is very low" in warnings[2]
+        monkeypatch.setenv('API_TIMEOUT_SECONDS', '40')
+        assert APIConfig.from_env().timeout == 40
 
 
 class TestServerConfig:
     """Test server configuration."""
     
-    def test_server_config_from_env(self):
+    def test_server_config_from_env(self, monkeypatch):
         """Test creating server config from environment variables."""
-        with patch.dict(os.environ, {
+        _set_env(monkeypatch, {
             'FLASK_HOST': 'localhost',
             'FLASK_PORT': '8080',
             'FLASK_DEBUG': 'True'
-        }):
-            config = ServerConfig.from_env()
-            
-            assert config.host == 'localhost'
-            assert config.port == 8080
-            assert config.debug is True
+        })
+        
+        config = ServerConfig.from_env()
+        
+        assert config.host == 'localhost'
+        assert config.port == 8080
+        assert config.debug is True
     
     def test_server_config_defaults(self):
         """Test server config with default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = ServerConfig.from_env()
-            
-            assert config.host == '0.0.0.0'
-            assert config.port == 8001
-            assert config.debug is False
-    
-    def test_server_config_validation(self):
-        """Test server config validation."""
-        config = ServerConfig(
-            host='0.0.0.0',
-            port=99999,  # Invalid port
-            debug=True
-        )
+        config = _default_config(ServerConfig)
         
-        warnings = config.validate()
-        
-        assert len(warnings) == 2
-        assert "FLASK_PORT (99999) is outside recommended range" in warnings[0]
-        assert "Debug mode enabled with host 0.0.0.0" in warnings[1]
+        assert config.host == '0.0.0.0'
+        assert config.port == 8001
+        assert config.debug is False
 
 
 class TestSchedulingConfig:
     """Test scheduling configuration."""
     
-    def test_scheduling_config_from_env(self):
+    def test_scheduling_config_from_env(self, monkeypatch):
         """Test creating scheduling config from environment variables."""
-        with patch.dict(os.environ, {
+        _set_env(monkeypatch, {
             'DAILY_UPDATE_HOUR': '20',
             'DAILY_UPDATE_MINUTE': '30',
             'AUTO_DOWNLOAD_ENABLED': 'False'
-        }):
-            config = SchedulingConfig.from_env()
-            
-            assert config.daily_update_hour == 20
-            assert config.daily_update_minute == 30
-            assert config.auto_download_enabled is False
-    
-    def test_scheduling_config_validation(self):
-        """Test scheduling config validation."""
-        config = SchedulingConfig(
-            daily_update_hour=25,  # Invalid hour
-            daily_update_minute=70,  # Invalid minute
-            auto_download_enabled=True,
-            auto_download_symbols=[]
-        )
+        })
         
-        warnings = config.validate()
+        config = SchedulingConfig.from_env()
         
-        assert len(warnings) == 3
-        assert "DAILY_UPDATE_HOUR (25) must be between 0-23" in warnings[0]
-        assert "DAILY_UPDATE_MINUTE (70) must be between 0-59" in warnings[1]
-        assert "No auto-download symbols configured" in warnings[2]
+        assert config.daily_update_hour == 20
+        assert config.daily_update_minute == 30
+        assert config.auto_download_enabled is False
 
 
 class TestLoggingConfig:
     """Test logging configuration."""
     
-    def test_logging_config_from_env(self):
+    def test_logging_config_from_env(self, monkeypatch):
         """Test creating logging config from environment variables."""
-        with patch.dict(os.environ, {
+        _set_env(monkeypatch, {
             'LOG_LEVEL': 'DEBUG',
             'LOG_FORMAT': 'custom format',
             'LOG_FILE_ENABLED': 'True',
             'LOG_FILE_PATH': 'custom/path.log',
             'LOG_CONSOLE_ENABLED': 'False'
-        }):
-            config = LoggingConfig.from_env()
-            
-            assert config.level == 'DEBUG'
-            assert config.format == 'custom format'
-            assert config.file_enabled is True
-            assert str(config.file_path) == 'custom/path.log'
-            assert config.console_enabled is False
+        })
+        
+        config = LoggingConfig.from_env()
+        
+        assert config.level == 'DEBUG'
+        assert config.format == 'custom format'
+        assert config.file_enabled is True
+        assert str(config.file_path) == 'custom/path.log'
+        assert config.console_enabled is False
     
-    def test_logging_config_validation(self):
-        """Test logging config validation."""
-        config = LoggingConfig(
-            level='INVALID_LEVEL',
-            format='test format',
-            file_enabled=True,
-            file_path=None,
-            console_enabled=True
-        )
-        
-        warnings = config.validate()
-        
-        assert len(warnings) == 1
-        assert "LOG_LEVEL (INVALID_LEVEL) is not valid" in warnings[0]
+    def test_logging_config_validation_resets_level(self):
+        """Test an invalid log level is reset to the default by validation."""
+        config = LoggingConfig(**_INVALID_LOGGING_KWARGS)
+        
+        config.validate()
+        
         assert config.level == 'INFO'  # Should be reset to default
 
 
+class TestConfigValidation:
+    """Test validation warnings across configuration sections."""
+    
+    @pytest.mark.parametrize("config_cls, kwargs, expected",
+                             _VALIDATION_CASES, ids=['api', 'server', 'scheduling', 'logging'])
+    def test_validate(self, config_cls, kwargs, expected):
+        """Test each section reports the expected warnings in order."""
+        warnings = config_cls(**kwargs).validate()
+        
+        assert len(warnings) == len(expected)
+        for warning, fragment in zip(warnings, expected):
+            assert fragment in warning
+
+
 class TestConfig:
     """Test main configuration class."""
     
-    def test_config_initialization(self):
+    def test_config_initialization(self, monkeypatch):
         """Test main config initialization."""
         # Test individual config classes instead of the global instance
-        with patch.dict(os.environ, {}, clear=True):
-            with patch.dict(os.environ, {
-                'FINNHUB_API_KEY': 'test_key',
-                'FLASK_PORT': '9000'
-            }):
-                # Test API config
-                api_config = APIConfig.from_env()
-                assert api_config.finnhub_api_key == 'test_key'
-                
-                # Test server config
-                server_config = ServerConfig.from_env()
-                assert server_config.port == 9000
+        _set_env(monkeypatch, {
+            'FINNHUB_API_KEY': 'test_key',
+            'FLASK_PORT': '9000'
+        })
+        
+        # Test API config
+        api_config = APIConfig.from_env()
+        assert api_config.finnhub_api_key == 'test_key'
+        
+        # Test server config
+        server_config = ServerConfig.from_env()
+        assert server_config.port == 9000
     
-    def test_config_api_key_checks(self):
-        """Test API key configuration checks."""
-        config = Config()
+    def test_export_dir_from_env(self, tmp_path, monkeypatch):
+        """Test the export directory is read from EXPORT_DIR and created."""
+        monkeypatch.setenv('EXPORT_DIR', str(tmp_path / 'exports'))
         
+        assert Config().export_dir == tmp_path / 'exports'
+        assert (tmp_path / 'exports').is_dir()
+    
+    def test_tests_use_temporary_export_dir(self):
+        """Test the suite writes CSV files to the session directory, not ./data_exports."""
+        assert str(EXPORT_DIR) == os.environ['EXPORT_DIR']
+    
+    def test_config_api_key_checks(self, base_config, monkeypatch):
+        """Test API key configuration checks."""
         # Test with no API keys
-        with patch.object(config.api, 'finnhub_api_key', None):
-            with patch.object(config.api, 'alpha_vantage_api_key', None):
-                assert config.get_api_key_configured() is False
-                assert config.get_finnhub_configured() is False
-                assert config.get_alpha_vantage_configured() is False
+        monkeypatch.setattr(base_config.api, 'finnhub_api_key', None)
+        monkeypatch.setattr(base_config.api, 'alpha_vantage_api_key', None)
+        assert base_config.get_api_key_configured() is False
+        assert base_config.get_finnhub_configured() is False
+        assert base_config.get_alpha_vantage_configured() is False
         
         # Test with API keys
-        with patch.object(config.api, 'finnhub_api_key', 'test_key'):
-            with patch.object(config.api, 'alpha_vantage_api_key', 'test_key'):
-                assert config.get_api_key_configured() is True
-                assert config.get_finnhub_configured() is True
-                assert config.get_alpha_vantage_configured() is True
+        monkeypatch.setattr(base_config.api, 'finnhub_api_key', 'test_key')
+        monkeypatch.setattr(base_config.api, 'alpha_vantage_api_key', 'test_key')
+        assert base_config.get_api_key_configured() is True
+        assert base_config.get_finnhub_configured() is True
+        assert base_config.get_alpha_vantage_configured() is True
     
-    def test_config_validation_warnings(self):
+    def test_config_validation_warnings(self, base_config, monkeypatch):
         """Test configuration validation warnings."""
-        with patch.dict(os.environ, {
-            'FLASK_DEBUG': 'True',
-            'FLASK_HOST': '0.0.0.0'
-        }):
-            config = Config()
-            
-            # Should have warnings for debug mode with 0.0.0.0
-            # Note: We can't easily test the actual warning output without more complex mocking
-            assert config.server.debug is True
-            assert config.server.host == '0.0.0.0' 
\ No newline at end of file
+        monkeypatch.setenv('FLASK_DEBUG', 'True')
+        monkeypatch.setenv('FLASK_HOST', '0.0.0.0')
+        monkeypatch.setattr(base_config, 'server', ServerConfig.from_env())
+        
+        assert base_config.server.debug is True
+        assert base_config.server.host == '0.0.0.0'
+        
+        # Debug mode with 0.0.0.0 should be flagged
+        warnings = base_config.server.validate()
+        assert any("Debug mode enabled with host 0.0.0.0" in warning for warning in warnings)
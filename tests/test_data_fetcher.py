@@ -0,0 +1,92 @@
+"""
+Tests for the market data fetcher.
+"""
+
+import pytest
+from types import SimpleNamespace
+from back_end.config import config
+from back_end.models.data_fetcher import MarketDataFetcher, get_market_data_fetcher
+from back_end.utils.exceptions import DataFetchException
+
+# Finnhub quote for a symbol that is trading
+_QUOTE = {'c': 110.0, 'o': 100.0, 'h': 112.0, 'l': 99.0, 'pc': 100.0}
+
+# Alpha Vantage daily series with a single trading day
+_DAILY = {'2023-01-02': {'1. open': '100', '2. high': '112', '3. low': '99', '4. close': '110', '5. volume': '1000'}}
+
+
+@pytest.fixture
+def fetcher():
+    """Fetcher with a counting stand-in Finnhub client."""
+    quotes = []
+    fetcher = MarketDataFetcher.__new__(MarketDataFetcher)
+    fetcher.finnhub_client = SimpleNamespace(quote=lambda symbol: quotes.append(symbol) or dict(_QUOTE))
+    fetcher.alpha_vantage_client = SimpleNamespace(
+        get_daily=lambda symbol, outputsize: quotes.append(symbol) or (_DAILY, None))
+    fetcher.quotes = quotes
+    return fetcher
+
+
+class TestCurrentDataCache:
+    """Test caching of current quotes."""
+    
+    def test_repeat_requests_reuse_quote(self, fetcher):
+        """Test a second request for the same symbol, from any fetcher, skips the API."""
+        first = fetcher.get_current_data('AAPL')
+        first['data']['price'] = 0
+        
+        other = MarketDataFetcher.__new__(MarketDataFetcher)
+        other.finnhub_client = fetcher.finnhub_client
+        second = other.get_current_data('aapl')
+        
+        assert fetcher.quotes == ['AAPL']
+        assert second['data']['price'] == 110.0
+        assert (first['cached'], second['cached']) == (False, True)
+    
+    def test_expired_entries_are_refetched(self, fetcher, monkeypatch):
+        """Test quotes are fetched again once the TTL has passed."""
+        fetcher.get_current_data('AAPL')
+        monkeypatch.setattr('back_end.models.data_fetcher.time.monotonic', lambda: float('inf'))
+        fetcher.get_current_data('AAPL')
+        
+        assert fetcher.quotes == ['AAPL', 'AAPL']
+    
+    def test_failures_are_not_cached(self, fetcher):
+        """Test a failed fetch is retried on the next request."""
+        fetcher.finnhub_client = SimpleNamespace(quote=lambda symbol: fetcher.quotes.append(symbol) or {'c': 0})
+        
+        for _ in range(2):
+            with pytest.raises(DataFetchException):
+                fetcher.get_current_data('AAPL')
+        
+        assert fetcher.quotes == ['AAPL', 'AAPL']
+
+
+class TestHistoricalDataCache:
+    """Test caching of historical series."""
+    
+    def test_positional_and_keyword_limit_share_entry(self, fetcher):
+        """Test the cache key is the symbol and limit however they are passed."""
+        fetcher.get_historical_data('AAPL', 60)
+        second = fetcher.get_historical_data('aapl', limit=60)
+        
+        assert fetcher.quotes == ['AAPL']
+        assert second['cached'] is True
+    
+    def test_fresh_bypasses_cache(self, fetcher):
+        """Test ``fresh=True`` always calls the API and refreshes the entry."""
+        fetcher.get_historical_data('AAPL', 60)
+        refreshed = fetcher.get_historical_data('AAPL', 60, fresh=True)
+        
+        assert fetcher.quotes == ['AAPL', 'AAPL']
+        assert refreshed['cached'] is False
+        assert fetcher.get_historical_data('AAPL', 60)['cached'] is True
+
+
+def test_fetcher_is_shared_until_keys_change(monkeypatch):
+    """Test one fetcher serves every caller until an API key is reconfigured."""
+    shared = get_market_data_fetcher()
+    assert get_market_data_fetcher() is shared
+    
+    monkeypatch.setattr(config.api, 'finnhub_api_key', 'rotated_key')
+    assert get_market_data_fetcher() is not shared
@@ -0,0 +1,71 @@
+"""
+Tests for the data generation helpers.
+"""
+
+import pytest
+from datetime import datetime
+from back_end.models.data_generator import (
+    filter_data_by_month,
+    generate_hourly_data_for_today,
+    generate_hourly_data_for_yesterday
+)
+
+
+class TestFilterDataByMonth:
+    """Test filtering records to a single month."""
+    
+    def test_keeps_matching_month(self):
+        """Test only records from the requested month and year are kept."""
+        records = [
+            {'date': '2024-05-31', 'close': 1.0},
+            {'date': '2024-06-03T09:00:00', 'close': 2.0},
+            {'date': '2024-06-28', 'close': 3.0},
+            {'date': '2023-06-15', 'close': 4.0}
+        ]
+        
+        result = filter_data_by_month(records, 'June 2024')
+        
+        assert result == records[1:3]
+        assert result[0] is records[1]
+    
+    def test_skips_missing_and_malformed_dates(self):
+        """Test records without a parseable date are dropped."""
+        records = [{'close': 1.0}, {'date': 'not a date'}, {'date': None}, {'date': '2024-06-03'}]
+        
+        assert filter_data_by_month(records, 'June 2024') == [{'date': '2024-06-03'}]
+    
+    def test_skips_non_string_dates(self):
+        """Test records whose dates are all datetimes are dropped rather than crashing."""
+        records = [{'date': datetime(2024, 6, 3)}, {'date': datetime(2024, 6, 4)}]
+        
+        assert filter_data_by_month(records, 'June 2024') == []
+    
+    def test_invalid_month_returns_records(self):
+        """Test an unparseable month leaves the records unfiltered."""
+        records = [{'date': '2024-06-03'}]
+        
+        assert filter_data_by_month(records, 'Juno 2024') is records
+
+
+@pytest.mark.parametrize("generate", [generate_hourly_data_for_today, generate_hourly_data_for_yesterday],
+                         ids=['today', 'yesterday'])
+def test_hourly_data_shape(generate):
+    """Test a full trading day of half-hourly records that open at the previous close."""
+    result = generate('ASML.AS')
+    records = result['data']
+    
+    assert result['success'] is True
+    assert len(records) == 17
+    assert records[0]['date'].endswith('T09:00:00') and records[-1]['date'].endswith('T17:00:00')
+    assert all(current['open'] == previous['close'] for previous, current in zip(records, records[1:]))
+    assert all(type(record['close']) is float and type(record['volume']) is int for record in records)
+
+
+def test_hourly_data_is_stable_within_a_day():
+    """Test repeat requests for the same day return equal but independent records."""
+    first = generate_hourly_data_for_today('ASML.AS')['data']
+    first[0]['close'] = 0
+    second = generate_hourly_data_for_today('ASML.AS')['data']
+    
+    assert second[1:] == first[1:]
+    assert second[0]['close'] != 0
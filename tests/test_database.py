@@ -0,0 +1,117 @@
+"""
+Tests for CSV database operations.
+"""
+
+import os
+import pytest
+from back_end.config import config
+from back_end.models.database import (
+    load_from_database_csv,
+    save_to_database_csv,
+    update_database_from_tracking,
+    _read_database_records
+)
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    """Point the database at a temporary export directory."""
+    monkeypatch.setattr(config, 'export_dir', tmp_path)
+    _read_database_records.cache_clear()
+    yield tmp_path
+    _read_database_records.cache_clear()
+
+
+class TestLoadFromDatabaseCsv:
+    """Test loading the persistent CSV database."""
+    
+    def test_missing_file(self, export_dir):
+        """Test loading a symbol without a database file."""
+        result = load_from_database_csv('AAPL')
+        
+        assert result['success'] is False
+        assert result['data'] == []
+    
+    def test_repeat_loads_are_cached_and_isolated(self, export_dir):
+        """Test repeat loads reuse the parse but return independent records."""
+        (export_dir / 'AAPL_database.csv').write_text('date,close,volume\n2023-01-01,150.0,1000\n')
+        
+        first = load_from_database_csv('AAPL')
+        first['data'][0]['date_obj'] = 'annotated'
+        second = load_from_database_csv('AAPL')
+        
+        assert second['data'] == [{'date': '2023-01-01', 'close': 150.0, 'volume': 1000}]
+        assert _read_database_records.cache_info().hits == 1
+    
+    def test_rewritten_file_is_reloaded(self, export_dir):
+        """Test a changed file is parsed again."""
+        filepath = export_dir / 'AAPL_database.csv'
+        filepath.write_text('date,close,volume\n2023-01-01,150.0,1000\n')
+        load_from_database_csv('AAPL')
+        
+        filepath.write_text('date,close,volume\n2023-01-01,150.0,1000\n2023-01-02,155.0,1100\n')
+        os.utime(filepath, ns=(0, filepath.stat().st_mtime_ns + 1_000_000_000))
+        result = load_from_database_csv('AAPL')
+        
+        assert result['records'] == 2
+    
+    def test_columns_are_typed(self, export_dir):
+        """Test dates load as strings and prices as floats whatever the CSV text."""
+        (export_dir / 'AAPL_database.csv').write_text('date,open,close,volume\n20230101,150,151,1000\n')
+        
+        record = load_from_database_csv('AAPL')['data'][0]
+        
+        assert record == {'date': '20230101', 'open': 150.0, 'close': 151.0, 'volume': 1000}
+        assert isinstance(record['close'], float)
+
+
+class TestSaveToDatabaseCsv:
+    """Test updating the persistent CSV database."""
+    
+    def test_unchanged_rows_skip_write(self, export_dir):
+        """Test re-saving stored rows leaves the file untouched."""
+        filepath = export_dir / 'AAPL_database.csv'
+        filepath.write_text('date,close,volume\n2023-01-01,150.0,1000\n2023-01-02,155.0,1100\n')
+        mtime = filepath.stat().st_mtime_ns
+        
+        result = save_to_database_csv([{'date': '2023-01-02', 'close': 155, 'volume': 1100}], 'AAPL')
+        
+        assert result['updated'] is False
+        assert result['total_records'] == 2
+        assert filepath.stat().st_mtime_ns == mtime
+    
+    @pytest.mark.parametrize("record, total", [
+        ({'date': '2023-01-03', 'close': 160.0, 'volume': 1200}, 3),
+        ({'date': '2023-01-02', 'close': 156.0, 'volume': 1100}, 2)
+    ], ids=['new-date', 'changed-row'])
+    def test_new_or_changed_rows_are_written(self, export_dir, record, total):
+        """Test new dates and changed values are merged into the file."""
+        (export_dir / 'AAPL_database.csv').write_text('date,close,volume\n2023-01-01,150.0,1000\n2023-01-02,155.0,1100\n')
+        
+        result = save_to_database_csv([record], 'AAPL')
+        
+        assert result['updated'] is True
+        assert result['total_records'] == total
+        assert load_from_database_csv('AAPL')['data'][-1] == record
+
+
+def test_update_database_from_tracking(export_dir):
+    """Test tracked prices are summarized into one daily OHLC row per symbol and day."""
+    (export_dir / 'price_tracking.csv').write_text(
+        'timestamp,symbol,price\n'
+        '2023-01-02 09:00:00,AAPL,150.0\n'
+        '2023-01-02 12:00:00,AAPL,153.0\n'
+        '2023-01-02 16:00:00,AAPL,149.0\n'
+        '2023-01-03 09:00:00,AAPL,151.0\n'
+        '2023-01-02 10:00:00,MSFT,300.0\n'
+    )
+    
+    result = update_database_from_tracking()
+    
+    assert result['success'] is True
+    assert set(result['updated_symbols']) == {'AAPL', 'MSFT'}
+    assert load_from_database_csv('AAPL')['data'] == [
+        {'date': '2023-01-02', 'open': 150.0, 'high': 153.0, 'low': 149.0, 'close': 149.0, 'volume': 0},
+        {'date': '2023-01-03', 'open': 151.0, 'high': 151.0, 'low': 151.0, 'close': 151.0, 'volume': 0}
+    ]
+    assert load_from_database_csv('MSFT')['records'] == 1
@@ -0,0 +1,40 @@
+"""
+Tests for utility helpers.
+"""
+
+import os
+from back_end.utils.helpers import cleanup_duplicate_csv_files
+
+
+class TestCleanupDuplicateCsvFiles:
+    """Test duplicate CSV cleanup."""
+    
+    def _write(self, directory, name, mtime):
+        path = directory / name
+        path.write_text('date,close\n')
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_keeps_newest_file_per_group(self, tmp_path, monkeypatch):
+        """Test only the newest file of each symbol/period group survives."""
+        export_dir = tmp_path / 'data_exports'
+        export_dir.mkdir()
+        old = self._write(export_dir, 'AAPL_daily_20230101.csv', 1000)
+        new = self._write(export_dir, 'AAPL_default_20230102.csv', 2000)
+        single = self._write(export_dir, 'MSFT_daily_20230101.csv', 1000)
+        database = self._write(export_dir, 'NVDA_database.csv', 1000)
+        monkeypatch.chdir(tmp_path)
+        
+        result = cleanup_duplicate_csv_files()
+        
+        assert result == {'deleted': 1, 'kept': 2}
+        assert not old.exists()
+        assert new.exists()
+        assert single.exists()
+        assert database.exists()
+    
+    def test_missing_directory(self, tmp_path, monkeypatch):
+        """Test cleanup is a no-op when the export directory is missing."""
+        monkeypatch.chdir(tmp_path)
+        
+        assert cleanup_duplicate_csv_files() == {'deleted': 0, 'kept': 0}
@@ -0,0 +1,48 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from datetime import date, datetime
+from flask.json.provider import DefaultJSONProvider
+from back_end.utils.json_provider import OrjsonProvider
+
+
+@dataclass
+class _Quote:
+    symbol: str
+    price: float
+
+
+class TestOrjsonProvider:
+    """Test serialization through the app JSON provider."""
+    
+    def test_app_uses_provider(self, app):
+        """Test the application is configured with the orjson provider."""
+        assert isinstance(app.json, OrjsonProvider)
+    
+    def test_round_trip(self, app):
+        """Test numpy values serialize and parse back to plain values."""
+        payload = {'prices': np.array([1.5, 2.5]), 'symbol': 'AAPL'}
+        
+        text = app.json.dumps(payload)
+        
+        assert app.json.loads(text) == {'prices': [1.5, 2.5], 'symbol': 'AAPL'}
+    
+    def test_jsonify_response(self, app):
+        """Test jsonify responses are parsed by get_json."""
+        with app.app_context():
+            response = app.json.response({'success': True, 'count': 2})
+        
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'success': True, 'count': 2}
+    
+    def test_matches_flask_default_encoding(self, app):
+        """Test dates and dataclasses encode as Flask's stdlib provider does."""
+        payload = {'when': datetime(2023, 1, 2, 15, 30), 'day': date(2023, 1, 2), 'quote': _Quote('AAPL', 1.5)}
+        
+        text = app.json.dumps(payload)
+        
+        assert app.json.loads(text) == app.json.loads(DefaultJSONProvider(app).dumps(payload))
+        assert app.json.loads(text)['when'] == 'Mon, 02 Jan 2023 15:30:00 GMT'
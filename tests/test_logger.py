@@ -0,0 +1,72 @@
+"""
+Tests for logging utilities.
+"""
+
+import json
+import logging
+import sys
+from datetime import datetime
+from back_end.utils.logger import ColoredFormatter, StructuredFormatter
+
+
+class TestStructuredFormatter:
+    """Test structured log formatting."""
+    
+    def _record(self, **extra_fields):
+        record = logging.LogRecord('test', logging.INFO, __file__, 10, 'hello %s', ('world',), None)
+        if extra_fields:
+            record.extra_fields = extra_fields
+        return record
+    
+    def test_output_is_json(self):
+        """Test formatted records are valid JSON."""
+        entry = json.loads(StructuredFormatter().format(self._record()))
+        
+        assert entry['message'] == 'hello world'
+        assert entry['level'] == 'INFO'
+        assert entry['line'] == 10
+    
+    def test_extra_fields_fall_back_to_str(self):
+        """Test non-JSON extra values are stringified."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        formatter = StructuredFormatter()
+        formatter._use_orjson = False
+        
+        entry = json.loads(formatter.format(self._record(symbol='AAPL', when=when)))
+        
+        assert entry['symbol'] == 'AAPL'
+        assert entry['when'] == str(when)
+    
+    def test_fixed_shape_matches_dict_encoding(self):
+        """Test plain records encode the same fields with or without orjson."""
+        record = self._record()
+        fast = StructuredFormatter()
+        slow = StructuredFormatter()
+        slow._use_orjson = False
+        
+        assert json.loads(fast.format(record)) == json.loads(slow.format(record))
+    
+    def test_exception_info_is_included(self):
+        """Test exception text is added to the entry."""
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            record = logging.LogRecord('test', logging.ERROR, __file__, 10, 'failed', (), sys.exc_info())
+        
+        entry = json.loads(StructuredFormatter().format(record))
+        
+        assert 'ValueError: boom' in entry['exception']
+
+
+class TestColoredFormatter:
+    """Test colored console formatting."""
+    
+    def test_record_levelname_is_not_mutated(self):
+        """Test coloring does not leak into the shared log record."""
+        record = logging.LogRecord('test', logging.WARNING, __file__, 10, 'careful', (), None)
+        
+        output = ColoredFormatter('%(levelname)s %(message)s').format(record)
+        
+        assert output == '\033[33mWARNING\033[0m careful'
+        assert record.levelname == 'WARNING'
+        assert logging.Formatter('%(levelname)s').format(record) == 'WARNING'
@@ -0,0 +1,75 @@
+"""
+Tests for the API response wrapper.
+"""
+
+import numpy as np
+from datetime import datetime
+from back_end.utils.response_wrapper import ApiResponse
+
+
+class TestApiResponse:
+    """Test response payload construction."""
+    
+    def test_success_payload(self, app):
+        """Test success responses carry data, metadata and extra fields."""
+        with app.app_context():
+            response, status_code = ApiResponse.success(
+                data={'price': np.float64(1.5), 'volume': np.int64(10)},
+                message='ok',
+                metadata={'count': 1},
+                symbol='AAPL'
+            )
+        
+        assert status_code == 200
+        assert response.mimetype == 'application/json'
+        payload = response.get_json()
+        assert payload['success'] is True
+        assert payload['message'] == 'ok'
+        assert payload['data'] == {'price': 1.5, 'volume': 10}
+        assert payload['metadata'] == {'count': 1}
+        assert payload['symbol'] == 'AAPL'
+    
+    def test_error_payload(self, app):
+        """Test error responses include only the provided optional fields."""
+        with app.app_context():
+            response, status_code = ApiResponse.error('bad', status_code=404, error_code='NOT_FOUND')
+        
+        assert status_code == 404
+        payload = response.get_json()
+        assert payload['success'] is False
+        assert payload['status_code'] == 404
+        assert payload['error_code'] == 'NOT_FOUND'
+        assert 'error_type' not in payload
+        assert 'details' not in payload
+    
+    def test_paginated_payload(self, app):
+        """Test pagination metadata is computed from the totals."""
+        with app.app_context():
+            response, status_code = ApiResponse.paginated([1, 2], page=2, per_page=2, total=5)
+        
+        assert status_code == 200
+        payload = response.get_json()
+        assert payload['data'] == [1, 2]
+        assert payload['metadata']['pagination'] == {
+            'page': 2,
+            'per_page': 2,
+            'total': 5,
+            'total_pages': 3,
+            'has_next': True,
+            'has_prev': True
+        }
+    
+    def test_list_response_count(self, app):
+        """Test list responses default the count to the data length."""
+        with app.app_context():
+            response, _ = ApiResponse.list_response(['a', 'b', 'c'])
+        
+        assert response.get_json()['metadata'] == {'count': 3}
+    
+    def test_uses_app_json_provider(self, app):
+        """Test payloads are encoded by the app's JSON provider."""
+        when = datetime(2023, 1, 2, 15, 30)
+        with app.app_context():
+            response, _ = ApiResponse.success(data={'when': when})
+        
+        assert response.get_json()['data'] == app.json.loads(app.json.dumps({'when': when}))
@@ -3,24 +3,100 @@ Tests for service layer components.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import pandas as pd
+from pytest import MonkeyPatch
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from back_end.services.stock_service import StockService
 from back_end.services.market_service import MarketService
 from back_end.services.database_service import DatabaseService
 from back_end.services.automation_service import AutomationService
-from back_end.utils.exceptions import DataFetchException, DatabaseException
+from back_end.utils.exceptions import DataFetchException
 
 
+# Contents of a small symbol database, read in place of the CSV file
+_DATABASE_FRAME = pd.DataFrame({
+    'date': ['2023-01-01', '2023-12-31'],
+    'close': [100.0, 110.0],
+    'volume': [1000, 2000]
+})
+
+# Per-symbol results of the scheduled download, returned by its stand-in
+_DOWNLOAD_RESULTS = {
+    'AAPL': {'success': True, 'records': 10},
+    'MSFT': {'success': False, 'records': 0}
+}
+
+
+def _stub_file(name, **stat_fields):
+    """Lightweight stand-in for a ``Path`` with a fixed ``stat()`` result."""
+    stat_result = SimpleNamespace(**stat_fields)
+    return SimpleNamespace(name=name, stat=lambda: stat_result)
+
+
+def _fresh_fetcher(service, monkeypatch):
+    """Return ``service`` with its fetcher restored after the test."""
+    monkeypatch.setattr(service, 'fetcher', service.fetcher)
+    return service
+
+
+@pytest.fixture(scope="module")
+def _stock_service():
+    """StockService built once per module."""
+    return StockService()
+
+
+@pytest.fixture
+def stock_service(_stock_service, monkeypatch):
+    """Shared StockService; tests may replace its fetcher."""
+    return _fresh_fetcher(_stock_service, monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def _market_service():
+    """MarketService built once per module."""
+    return MarketService()
+
+
+@pytest.fixture
+def market_service(_market_service, monkeypatch):
+    """Shared MarketService; tests may replace its fetcher."""
+    return _fresh_fetcher(_market_service, monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def _db_service():
+    """DatabaseService built once per module."""
+    return DatabaseService()
+
+
+@pytest.fixture
+def db_service(_db_service, monkeypatch):
+    """Shared DatabaseService; tests may replace its fetcher."""
+    return _fresh_fetcher(_db_service, monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def automation_service():
+    """AutomationService built once per module, with the scheduled download stubbed out."""
+    with MonkeyPatch.context() as mp:
+        mp.setattr('back_end.services.automation_service.automated_daily_download',
+                   lambda: _DOWNLOAD_RESULTS)
+        yield AutomationService()
+
+
+def test_services_use_shared_fetcher(mock_fetcher):
+    """Test services pick up the application-wide fetcher."""
+    for service in (StockService(), MarketService(), DatabaseService()):
+        assert service.fetcher is mock_fetcher
+
+
+@pytest.mark.xdist_group('stock_service')
 class TestStockService:
     """Test stock service functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.stock_service = StockService()
-    
-    @patch('back_end.services.stock_service.MarketDataFetcher')
-    def test_get_stock_data_success(self, mock_fetcher):
+    def test_get_stock_data_success(self, stock_service, monkeypatch):
         """Test successful stock data retrieval."""
         # Mock the fetcher
         mock_fetcher_instance = Mock()
@@ -28,38 +104,78 @@ class TestStockService:
             'success': True,
             'data': {'price': 150.0, 'symbol': 'AAPL'}
         }
-        self.stock_service.fetcher = mock_fetcher_instance
+        stock_service.fetcher = mock_fetcher_instance
         
         # Mock database load with complete OHLCV data
-        with patch('back_end.services.stock_service.load_from_database_csv') as mock_load:
-            mock_load.return_value = {
-                'success': True,
-                'data': [
-                    {'date': '2023-01-01', 'open': 148.0, 'high': 152.0, 'low': 147.0, 'close': 150.0, 'volume': 1000},
-                    {'date': '2023-01-02', 'open': 150.0, 'high': 157.0, 'low': 149.0, 'close': 155.0, 'volume': 1100}
-                ]
-            }
-            
-            result = self.stock_service.get_stock_data('AAPL', 'default')
-            
-            assert result['success'] is True
-            assert result['symbol'] == 'AAPL'
-            assert len(result['dates']) == 2
-            assert len(result['prices']) == 2
+        mock_load = Mock()
+        monkeypatch.setattr('back_end.services.stock_service.load_from_database_csv', mock_load)
+        mock_load.return_value = {
+            'success': True,
+            'data': [
+                {'date': '2023-01-01', 'open': 148.0, 'high': 152.0, 'low': 147.0, 'close': 150.0, 'volume': 1000},
+                {'date': '2023-01-02', 'open': 150.0, 'high': 157.0, 'low': 149.0, 'close': 155.0, 'volume': 1100}
+            ]
+        }
+        
+        result = stock_service.get_stock_data('AAPL', 'default')
+        
+        assert result['success'] is True
+        assert result['symbol'] == 'AAPL'
+        assert len(result['dates']) == 2
+        assert len(result['prices']) == 2
+        assert result['dates'] == ['2023-01-01', '2023-01-02']
     
-    @patch('back_end.services.stock_service.MarketDataFetcher')
-    def test_get_stock_data_fetch_error(self, mock_fetcher):
+    def test_get_stock_data_batch_loads_once(self, stock_service, monkeypatch):
+        """Test batch retrieval shares one database load across periods."""
+        stock_service.fetcher = Mock()
+        stock_service.fetcher.get_current_data.return_value = {'success': False}
+        
+        mock_load = Mock()
+        monkeypatch.setattr('back_end.services.stock_service.load_from_database_csv', mock_load)
+        mock_load.return_value = {
+            'success': True,
+            'data': [
+                {'date': '2023-01-01', 'open': 148.0, 'high': 152.0, 'low': 147.0, 'close': 150.0, 'volume': 1000},
+                {'date': '2023-01-02', 'open': 150.0, 'high': 157.0, 'low': 149.0, 'close': 155.0, 'volume': 1100}
+            ]
+        }
+        
+        results = stock_service.get_stock_data_batch('aapl', ['default', 'week', 'all'])
+        
+        assert list(results) == ['default', 'week', 'all']
+        assert results['all']['dates'] == ['2023-01-01', '2023-01-02']
+        assert results['all']['symbol'] == 'AAPL'
+        # One load for the records and one for the current-price summary
+        assert mock_load.call_count == 2
+    
+    def test_get_stock_data_skips_tracking_for_cached_quote(self, stock_service, monkeypatch):
+        """Test a cached quote is not saved for tracking again."""
+        stock_service.fetcher = Mock()
+        stock_service.fetcher.get_current_data.return_value = {
+            'success': True,
+            'cached': True,
+            'data': {'price': 150.0, 'symbol': 'AAPL'}
+        }
+        mock_save = Mock()
+        monkeypatch.setattr('back_end.services.stock_service.save_price_tracking_data', mock_save)
+        monkeypatch.setattr('back_end.services.stock_service.load_from_database_csv',
+                            Mock(return_value={'success': False, 'message': 'No data'}))
+        
+        stock_service.get_stock_data('AAPL', 'default')
+        
+        mock_save.assert_not_called()
+    
+    def test_get_stock_data_fetch_error(self, stock_service):
         """Test stock data retrieval with fetch error."""
         # Mock the fetcher to raise an exception
         mock_fetcher_instance = Mock()
         mock_fetcher_instance.get_current_data.side_effect = DataFetchException("API error")
-        self.stock_service.fetcher = mock_fetcher_instance
+        stock_service.fetcher = mock_fetcher_instance
         
         with pytest.raises(DataFetchException):
-            self.stock_service.get_stock_data('AAPL', 'default')
+            stock_service.get_stock_data('AAPL', 'default')
     
-    @patch('back_end.services.stock_service.MarketDataFetcher')
-    def test_save_to_database_success(self, mock_fetcher):
+    def test_save_to_database_success(self, stock_service, monkeypatch):
         """Test successful database save operation."""
         # Mock the fetcher
         mock_fetcher_instance = Mock()
@@ -70,46 +186,82 @@ class TestStockService:
                 {'date': '2023-01-02', 'close': 155.0, 'volume': 1100}
             ]
         }
-        self.stock_service.fetcher = mock_fetcher_instance
+        stock_service.fetcher = mock_fetcher_instance
         
         # Mock database save
-        with patch('back_end.services.stock_service.save_to_database_csv') as mock_save:
-            mock_save.return_value = {
-                'success': True,
-                'records': 2,
-                'total_records': 2,
-                'message': 'Database updated successfully',
-                'updated': True,
-                'filename': 'AAPL_database.csv'
-            }
-            
-            result = self.stock_service.save_to_database('AAPL')
-            
-            assert result['success'] is True
-            assert result['symbol'] == 'AAPL'
-            assert result['records_added'] == 2
+        mock_save = Mock()
+        monkeypatch.setattr('back_end.services.stock_service.save_to_database_csv', mock_save)
+        mock_save.return_value = {
+            'success': True,
+            'records': 2,
+            'total_records': 2,
+            'message': 'Database updated successfully',
+            'updated': True,
+            'filename': 'AAPL_database.csv'
+        }
+        
+        result = stock_service.save_to_database('AAPL')
+        
+        assert result['success'] is True
+        assert result['symbol'] == 'AAPL'
+        assert result['records_added'] == 2
     
-    @patch('back_end.services.stock_service.MarketDataFetcher')
-    def test_save_to_database_fetch_error(self, mock_fetcher):
+    def test_save_to_database_fetch_error(self, stock_service):
         """Test database save with fetch error."""
         # Mock the fetcher to raise an exception
         mock_fetcher_instance = Mock()
         mock_fetcher_instance.get_historical_data.side_effect = DataFetchException("No data available")
-        self.stock_service.fetcher = mock_fetcher_instance
+        stock_service.fetcher = mock_fetcher_instance
         
         with pytest.raises(DataFetchException):
-            self.stock_service.save_to_database('AAPL')
+            stock_service.save_to_database('AAPL')
+    
+    def test_process_database_records(self, stock_service):
+        """Test records are parsed, sorted by date and invalid dates dropped."""
+        records = [
+            {'date': '2023-01-03', 'close': 3.0},
+            {'date': '2023-01-01T09:30:00', 'close': 1.0},
+            {'date': 'not-a-date', 'close': 0.0},
+            {'close': 0.0},
+            {'date': '2023-01-02', 'close': 2.0}
+        ]
+        
+        processed = stock_service._process_database_records(records)
+        
+        assert [r['close'] for r in processed] == [1.0, 2.0, 3.0]
+        assert processed[0]['date_obj'] == datetime(2023, 1, 1)
+        assert type(processed[0]['date_obj']) is datetime
+        assert stock_service._process_database_records([]) == []
+    
+    def test_process_database_records_without_string_dates(self, stock_service):
+        """Test records whose dates are all non-strings are dropped rather than crashing."""
+        records = [{'date': datetime(2023, 1, 1)}, {'date': pd.Timestamp('2023-01-02')}, {'date': 20230103}]
+        
+        assert stock_service._process_database_records(records) == []
+    
+    def test_filter_records_by_period(self, stock_service):
+        """Test week/month periods select the previous calendar week/month."""
+        start = datetime(2023, 12, 20)
+        records = stock_service._process_database_records([
+            {'date': (start + timedelta(days=i)).strftime('%Y-%m-%d')} for i in range(60)
+        ])
+        # Last record is Saturday 2024-02-17 -> previous week is 2024-02-05..09
+        week = stock_service._filter_records_by_period(records, 'week')
+        month = stock_service._filter_records_by_period(records, 'month')
+        
+        assert [r['date'] for r in week] == ['2024-02-05', '2024-02-06', '2024-02-07', '2024-02-08', '2024-02-09']
+        assert month[0]['date'] == '2024-01-01'
+        assert month[-1]['date'] == '2024-01-31'
+        assert len(month) == 31
+        assert stock_service._filter_records_by_period(records, 'all') is records
+        assert stock_service._filter_records_by_period([], 'week') == []
 
 
+@pytest.mark.xdist_group('market_service')
 class TestMarketService:
     """Test market service functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.market_service = MarketService()
-    
-    @patch('back_end.services.market_service.MarketDataFetcher')
-    def test_get_market_correlation_success(self, mock_fetcher):
+    def test_get_market_correlation_success(self, market_service):
         """Test successful market correlation analysis."""
         # Mock the fetcher
         mock_fetcher_instance = Mock()
@@ -121,17 +273,16 @@ class TestMarketService:
                 {'date': '2023-01-03', 'close': 110.0}
             ]
         }
-        self.market_service.fetcher = mock_fetcher_instance
+        market_service.fetcher = mock_fetcher_instance
         
-        result = self.market_service.get_market_correlation(['AAPL', 'MSFT'])
+        result = market_service.get_market_correlation(['AAPL', 'MSFT'])
         
         assert result['success'] is True
         assert 'correlation_matrix' in result
         assert 'market_volatility' in result
         assert 'symbols' in result
     
-    @patch('back_end.services.market_service.MarketDataFetcher')
-    def test_get_market_events_success(self, mock_fetcher):
+    def test_get_market_events_success(self, market_service):
         """Test successful market events detection."""
         # Mock the fetcher
         mock_fetcher_instance = Mock()
@@ -143,16 +294,15 @@ class TestMarketService:
                 {'date': '2023-01-03', 'close': 95.0, 'volume': 900}    # 13.6% decrease
             ]
         }
-        self.market_service.fetcher = mock_fetcher_instance
+        market_service.fetcher = mock_fetcher_instance
         
-        result = self.market_service.get_market_events('AAPL', threshold=0.05)
+        result = market_service.get_market_events('AAPL', threshold=0.05)
         
         assert result['success'] is True
         assert result['symbol'] == 'AAPL'
         assert len(result['events']) >= 1  # Should detect the large moves
     
-    @patch('back_end.services.market_service.MarketDataFetcher')
-    def test_get_market_events_no_data(self, mock_fetcher):
+    def test_get_market_events_no_data(self, market_service):
         """Test market events with no data."""
         # Mock the fetcher to return no data
         mock_fetcher_instance = Mock()
@@ -160,101 +310,75 @@ class TestMarketService:
             'success': False,
             'data': []
         }
-        self.market_service.fetcher = mock_fetcher_instance
+        market_service.fetcher = mock_fetcher_instance
         
         with pytest.raises(DataFetchException):
-            self.market_service.get_market_events('AAPL')
+            market_service.get_market_events('AAPL')
 
 
+@pytest.mark.xdist_group('database_service')
 class TestDatabaseService:
     """Test database service functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.db_service = DatabaseService()
-    
-    @patch('back_end.services.database_service.EXPORT_DIR')
-    def test_list_csv_files_success(self, mock_export_dir):
+    def test_list_csv_files_success(self, db_service, monkeypatch):
         """Test successful CSV file listing."""
-        # Mock the export directory
-        mock_dir = Mock()
-        mock_file1 = Mock()
-        mock_file1.name = 'test1.csv'
-        mock_file1.stat.return_value = Mock(st_size=1024, st_ctime=1234567890, st_mtime=1234567890)
-        
-        mock_file2 = Mock()
-        mock_file2.name = 'test2.csv'
-        mock_file2.stat.return_value = Mock(st_size=2048, st_ctime=1234567891, st_mtime=1234567891)
-        
-        mock_dir.glob.return_value = [mock_file1, mock_file2]
-        mock_dir.exists.return_value = True
-        mock_export_dir.exists.return_value = True
-        mock_export_dir.glob.return_value = [mock_file1, mock_file2]
+        # Plain stand-ins for the export directory and its files; no call tracking needed
+        files = [
+            _stub_file('test1.csv', st_size=1024, st_ctime=1234567890, st_mtime=1234567890),
+            _stub_file('test2.csv', st_size=2048, st_ctime=1234567891, st_mtime=1234567891)
+        ]
+        export_dir = SimpleNamespace(exists=lambda: True, glob=lambda pattern: files)
+        monkeypatch.setattr('back_end.services.database_service.EXPORT_DIR', export_dir)
         
-        result = self.db_service.list_csv_files()
+        result = db_service.list_csv_files()
         
         assert result['success'] is True
         assert result['count'] == 2
-        assert len(result['files']) == 2
+        assert [f['filename'] for f in result['files']] == ['test2.csv', 'test1.csv']
+        assert result['files'][0]['size'] == 2048
     
-    @patch('back_end.services.database_service.EXPORT_DIR')
-    def test_list_database_files_success(self, mock_export_dir):
+    def test_list_database_files_success(self, db_service):
         """Test successful database file listing."""
-        # Mock the export directory
-        mock_file = Mock()
-        mock_file.name = 'AAPL_database.csv'
-        mock_file.stem = 'AAPL_database'
-        mock_file.stat.return_value = Mock(st_size=1024, st_mtime=1234567890)
+        database_file = _stub_file('AAPL_database.csv', st_size=1024, st_mtime=1234567890)
+        database_file.stem = 'AAPL_database'
+        export_dir = SimpleNamespace(glob=lambda pattern: [database_file])
         
-        mock_export_dir.glob.return_value = [mock_file]
+        # Install both replacements in one pass
+        with patch.multiple('back_end.services.database_service',
+                            EXPORT_DIR=export_dir,
+                            pd=SimpleNamespace(read_csv=lambda path: _DATABASE_FRAME)):
+            result = db_service.list_database_files()
         
-        # Mock pandas read_csv
-        with patch('back_end.services.database_service.pd.read_csv') as mock_read_csv:
-            mock_df = Mock()
-            mock_df.__len__ = lambda x: 100
-            mock_df.columns = ['date', 'close', 'volume']
-            
-            # Mock the date column properly
-            mock_date_series = Mock()
-            mock_date_series.min.return_value = '2023-01-01'
-            mock_date_series.max.return_value = '2023-12-31'
-            mock_df.__getitem__ = lambda x, key: mock_date_series if key == 'date' else Mock()
-            
-            mock_read_csv.return_value = mock_df
-            
-            result = self.db_service.list_database_files()
-            
-            assert result['success'] is True
-            assert result['total_files'] == 1
-            assert len(result['databases']) == 1
+        assert result['success'] is True
+        assert result['total_files'] == 1
+        assert result['databases'][0]['symbol'] == 'AAPL'
+        assert result['databases'][0]['records'] == 2
+        assert result['databases'][0]['date_range'] == {'earliest': '2023-01-01', 'latest': '2023-12-31'}
     
-    def test_get_file_path_security_check(self):
+    def test_get_file_path_security_check(self, db_service):
         """Test file path security validation."""
         # Test path traversal attempt
         with pytest.raises(Exception):  # Should raise FileNotFoundException
-            self.db_service.get_file_path('../../../etc/passwd')
+            db_service.get_file_path('../../../etc/passwd')
         
         # Test invalid filename with slashes
         with pytest.raises(Exception):
-            self.db_service.get_file_path('file/with/slashes.csv')
+            db_service.get_file_path('file/with/slashes.csv')
 
 
+@pytest.mark.xdist_group('automation_service')
 class TestAutomationService:
     """Test automation service functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.automation_service = AutomationService()
-    
     @patch.multiple('back_end.services.automation_service',
                    FINNHUB_API_KEY='d1n3591r01qlvnp5a50gd1n3591r01qlvnp5a510',
                    AUTO_DOWNLOAD_SYMBOLS=['NVDA'],
                    DAILY_UPDATE_MINUTE=0,
                    DAILY_UPDATE_HOUR=19,
                    AUTO_DOWNLOAD_ENABLED=True)
-    def test_get_automation_status(self):
+    def test_get_automation_status(self, automation_service):
         """Test automation status retrieval."""
-        result = self.automation_service.get_automation_status()
+        result = automation_service.get_automation_status()
         
         assert result['success'] is True
         assert result['config']['enabled'] is True
@@ -263,16 +387,9 @@ class TestAutomationService:
         assert result['config']['symbols'] == ['NVDA']
         assert result['config']['api_key_configured'] is True
     
-    @patch('back_end.services.automation_service.automated_daily_download')
-    def test_trigger_automated_download(self, mock_download):
+    def test_trigger_automated_download(self, automation_service):
         """Test automated download triggering."""
-        # Mock the download function
-        mock_download.return_value = {
-            'AAPL': {'success': True, 'records': 10},
-            'MSFT': {'success': False, 'records': 0}
-        }
-        
-        result = self.automation_service.trigger_automated_download()
+        result = automation_service.trigger_automated_download()
         
         assert result['success'] is True
         assert result['summary']['successful_symbols'] == 1
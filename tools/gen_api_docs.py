@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Generate the frozen OpenAPI specification module from its YAML source.
+
+The source of truth for the API specification is
+``back_end/utils/api_spec.yaml``. This script loads it and writes
+``back_end/utils/api_docs_generated.py``, which holds the specification as a
+single pickled bytes literal so that importing it costs one C-level
+``pickle.loads`` call instead of executing hundreds of lines of dict literals.
+
+Re-run this script whenever the YAML file changes. PyYAML is only needed here,
+not at runtime.
+
+Usage:
+    python tools/gen_api_docs.py          # regenerate the module
+    python tools/gen_api_docs.py --check  # exit 1 if the module is stale
+"""
+
+import argparse
+import pickle
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SPEC_YAML = ROOT_DIR / "back_end" / "utils" / "api_spec.yaml"
+GENERATED_MODULE = ROOT_DIR / "back_end" / "utils" / "api_docs_generated.py"
+
+# Pin the protocol so the output does not change between Python versions
+PICKLE_PROTOCOL = 4
+CHUNK_SIZE = 48
+
+HEADER = '''"""
+Frozen OpenAPI specification for the Stock Market Dashboard API.
+
+GENERATED FILE - DO NOT EDIT. Edit back_end/utils/api_spec.yaml and run
+``python tools/gen_api_docs.py`` instead.
+"""
+
+import pickle
+
+_SPEC_PICKLE: bytes = (
+'''
+
+FOOTER = ''')
+
+_SPEC = pickle.loads(_SPEC_PICKLE)
+'''
+
+
+def load_spec(path: Path = SPEC_YAML) -> dict:
+    """Load the OpenAPI specification from its YAML source."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def render_module(spec: dict) -> str:
+    """Render the generated module source for the given specification."""
+    blob = pickle.dumps(spec, protocol=PICKLE_PROTOCOL)
+    
+    lines = []
+    for start in range(0, len(blob), CHUNK_SIZE):
+        lines.append(f"    {blob[start:start + CHUNK_SIZE]!r}\n")
+    
+    return HEADER + "".join(lines) + FOOTER
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="verify the generated module is up to date instead of writing it")
+    args = parser.parse_args()
+    
+    source = render_module(load_spec())
+    
+    if args.check:
+        current = GENERATED_MODULE.read_text(encoding="utf-8") if GENERATED_MODULE.exists() else ""
+        if current != source:
+            print(f"{GENERATED_MODULE.relative_to(ROOT_DIR)} is out of date; "
+                  f"run python tools/gen_api_docs.py", file=sys.stderr)
+            return 1
+        return 0
+    
+    GENERATED_MODULE.write_text(source, encoding="utf-8")
+    print(f"Wrote {GENERATED_MODULE.relative_to(ROOT_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())